@@ -0,0 +1,416 @@
+# Author: Timothy Jan
+# Date: 10/17/2026
+# Description: Computer opponents for Focus/Domination under the FocusGame_original rules. AlphaBetaEngine searches
+#              with iterative deepening until its time or node budget runs out, and MonteCarloEngine grows a UCT tree
+#              with random playouts until its time or playout budget runs out. Both take a
+#              FocusGame_original.FocusGame (or a CompactFocusGame), search a compact copy with make_move/unmake_move
+#              and return a move for the game's public move API. AlphaBetaEngine can share a FocusCache.EvaluationCache,
+#              answering positions it has already analyzed without searching, and both play from a FocusBook.OpeningBook
+#              while the position is in it.
+
+import math
+import random
+import time
+
+from FocusGame_compact import CompactFocusGame, EMPTY
+from FocusHash import TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND
+from FocusMoves import SQUARES_6X6
+
+WIN_SCORE = 1000000
+_WIN_BOUND = WIN_SCORE - 1000  # scores beyond this are wins or losses a number of plies away
+_CHECK_EVERY = 255  # nodes between clock checks, must be one less than a power of two
+
+
+class SearchTimeout(Exception):
+    """Raised inside a search when its time or node budget runs out."""
+    pass
+
+
+def evaluate(game, side):
+    """Returns score of a CompactFocusGame position from the point of view of player A (0) or player B (1)."""
+    other = side ^ 1
+    score = 100 * (game.get_capture(side) - game.get_capture(other))
+    score += 30 * (game.get_reserve(side) - game.get_reserve(other))
+    for stack in game.get_board():
+        if stack == EMPTY:
+            continue
+        # controlling a stack is worth more the taller it is
+        if stack & 1 == side:
+            score += stack.bit_length()
+        else:
+            score -= stack.bit_length()
+    return score
+
+
+def _to_table(score, ply):
+    """Returns score stored in the transposition table, with wins counted from the stored position."""
+    if score > _WIN_BOUND:
+        return score + ply
+    if score < -_WIN_BOUND:
+        return score - ply
+    return score
+
+
+def _from_table(score, ply):
+    """Returns transposition table score as seen from ply plies below the root."""
+    if score > _WIN_BOUND:
+        return score - ply
+    if score < -_WIN_BOUND:
+        return score + ply
+    return score
+
+
+def to_location_move(move):
+    """Returns (start, end, number) board index move as a location move, start is None for a reserve placement."""
+    start, end, number = move
+    return (SQUARES_6X6[start] if start >= 0 else None), SQUARES_6X6[end], number
+
+
+def play_move(game, player, move):
+    """Plays a move returned by choose_move through the game's public move API and returns the move message."""
+    start, end, number = move
+    if start is None:
+        return game.reserved_move(player, end)
+    return game.move_piece(player, start, end, number)
+
+
+def _search_position(game, player):
+    """Returns (compact copy, side) for a search, or (None, None) if it isn't player's turn."""
+    search_game = CompactFocusGame.from_game(game)
+    side = search_game.get_player_index(player)
+    if side is None:
+        return None, None
+    if search_game.get_turn_counter() != 1 and side != search_game.get_current_turn():
+        return None, None
+    return search_game, side
+
+
+def _book_move(book, game, side):
+    """Returns the book move for side in a CompactFocusGame, or None without a book or if the position isn't in it."""
+    if book is None:
+        return None
+    return book.choose_move(game, side)
+
+
+class RandomEngine:
+    """Computer opponent that plays a uniformly random legal move."""
+
+    def __init__(self, seed=None):
+        self._random = random.Random(seed)
+        self._stats = {}
+
+    def get_stats(self):
+        """Returns dict of nodes, depth, elapsed seconds and nodes per second for the last move."""
+        return self._stats
+
+    def choose_move(self, game, player):
+        """Returns a random (start, end, number) move for player, (None, location, 1) for a reserve placement, or None
+        if it isn't player's turn or player has no moves."""
+        self._stats = {"nodes": 0, "depth": 0, "elapsed": 0.0, "nodes_per_second": 0.0}
+        search_game, side = _search_position(game, player)
+        if search_game is None:
+            return None
+        moves = list(search_game.generate_moves(side))
+        if not moves:
+            return None
+        return to_location_move(moves[self._random.randrange(len(moves))])
+
+
+class AlphaBetaEngine:
+    """Computer opponent using alpha-beta search with iterative deepening under a wall-clock budget, a node budget or
+    both. Without a time limit the search doesn't depend on the clock, so the same position always gets the same
+    move."""
+
+    def __init__(self, time_limit=0.05, max_depth=32, table_bits=16, cache=None, book=None, max_nodes=None):
+        self._time_limit = time_limit  # seconds per move, or None for no clock
+        self._max_depth = max_depth
+        self._max_nodes = max_nodes  # nodes searched per move, or None for no limit
+        self._table = TranspositionTable(table_bits)
+        self._cache = cache  # EvaluationCache of analyzed positions, or None
+        self._book = book  # OpeningBook consulted before searching, or None
+        self._deadline = 0
+        self._node_limit = 0
+        self._nodes = 0
+        self._stats = {}
+
+    def get_stats(self):
+        """Returns dict of nodes, depth, elapsed seconds, nodes per second, score and whether the move came from the
+        cache or the book for the last search."""
+        return self._stats
+
+    def get_table(self):
+        """Returns the transposition table shared by every search of this engine."""
+        return self._table
+
+    def get_cache(self):
+        """Returns the evaluation cache of this engine, or None."""
+        return self._cache
+
+    def choose_move(self, game, player):
+        """Returns the best (start, end, number) move for player, (None, location, 1) for a reserve placement, or None
+        if it isn't player's turn or player has no moves."""
+        started = time.perf_counter()
+        self._deadline = math.inf if self._time_limit is None else started + self._time_limit
+        self._node_limit = math.inf if self._max_nodes is None else self._max_nodes
+        self._nodes = 0
+        self._stats = {"nodes": 0, "depth": 0, "elapsed": 0.0, "nodes_per_second": 0.0, "score": None,
+                       "cached": False, "book": False}
+
+        search_game, side = _search_position(game, player)
+        if search_game is None:
+            return None
+        move = _book_move(self._book, search_game, side)
+        if move is not None:
+            self._stats.update(book=True, elapsed=time.perf_counter() - started)
+            return to_location_move(move)
+
+        # a position analyzed before, or a mirror image of one, needs no search
+        if self._cache is not None:
+            root_game = search_game.copy()  # a timed out search leaves its moves on search_game
+            entry = self._cache.probe(search_game, side)
+            if entry is not None:
+                score, depth, move = entry
+                self._stats.update(depth=depth, score=score, cached=True, elapsed=time.perf_counter() - started)
+                return to_location_move(move)
+
+        self._table.new_search()
+        moves = list(search_game.generate_moves(side))
+        if not moves:
+            return None
+
+        best_move = moves[0]
+        for depth in range(1, self._max_depth + 1):
+            try:
+                score, move = self._search_root(search_game, side, moves, depth)
+            except SearchTimeout:
+                break
+            best_move = move
+            self._stats["depth"] = depth
+            self._stats["score"] = score
+
+            # search the best move first on the next iteration
+            moves.remove(move)
+            moves.insert(0, move)
+
+            # stop once a forced win or loss is found
+            if abs(score) >= WIN_SCORE - self._max_depth:
+                break
+
+        if self._cache is not None and self._stats["depth"] > 0:
+            self._cache.store(root_game, side, self._stats["score"], self._stats["depth"], best_move)
+
+        elapsed = time.perf_counter() - started
+        self._stats["nodes"] = self._nodes
+        self._stats["elapsed"] = elapsed
+        self._stats["nodes_per_second"] = self._nodes / elapsed if elapsed > 0 else 0.0
+        return to_location_move(best_move)
+
+    def _search_root(self, game, side, moves, depth):
+        """Returns (score, move) of the best root move searched to depth."""
+        alpha = -WIN_SCORE - 1
+        best_move = moves[0]
+        for move in moves:
+            game.make_move(side, move[0], move[1], move[2])
+            if game.get_capture(side) > 5:
+                score = WIN_SCORE
+            else:
+                score = -self._negamax(game, side ^ 1, depth - 1, -WIN_SCORE - 1, -alpha, 1)
+            game.unmake_move()
+            if score > alpha:
+                alpha = score
+                best_move = move
+        return alpha, best_move
+
+    def _negamax(self, game, side, depth, alpha, beta, ply):
+        """Returns score of the position for side to move, searched to depth."""
+        self._nodes += 1
+        if self._nodes >= self._node_limit:
+            raise SearchTimeout()
+        if self._nodes & _CHECK_EVERY == 0 and time.perf_counter() > self._deadline:
+            raise SearchTimeout()
+        if depth == 0:
+            return evaluate(game, side)
+
+        # positions reached by another move order may already be searched deep enough
+        key = game.get_hash()
+        entry = self._table.probe(key)
+        moves = list(game.generate_moves(side))
+        if entry is not None:
+            entry_depth, score, flag, table_move = entry
+            if entry_depth >= depth:
+                score = _from_table(score, ply)
+                if flag == EXACT or (flag == LOWER_BOUND and score >= beta) or (flag == UPPER_BOUND and score <= alpha):
+                    return score
+            # search the stored best move first
+            if table_move in moves:
+                moves.remove(table_move)
+                moves.insert(0, table_move)
+
+        # a player with no moves left can never capture again
+        if not moves:
+            return -WIN_SCORE + ply
+
+        original_alpha = alpha
+        best_score = -WIN_SCORE - 1
+        best_move = None
+        for move in moves:
+            game.make_move(side, move[0], move[1], move[2])
+            if game.get_capture(side) > 5:
+                score = WIN_SCORE - ply
+            else:
+                score = -self._negamax(game, side ^ 1, depth - 1, -beta, -alpha, ply + 1)
+            game.unmake_move()
+            if score > best_score:
+                best_score = score
+                best_move = move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if best_score <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_score >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self._table.store(key, depth, _to_table(best_score, ply), flag, best_move)
+        return best_score
+
+
+class _Node:
+    """Represents a Monte Carlo search tree node, reached when side played move."""
+
+    __slots__ = ("move", "parent", "side", "children", "untried", "visits", "wins")
+
+    def __init__(self, move, parent, side, untried):
+        self.move = move
+        self.parent = parent
+        self.side = side
+        self.children = []
+        self.untried = untried
+        self.visits = 0
+        self.wins = 0.0
+
+
+class MonteCarloEngine:
+    """Computer opponent using Monte Carlo tree search (UCT) with random playouts under a wall-clock budget, a playout
+    budget or both. Seeded and without a time limit, the same position always gets the same move."""
+
+    def __init__(self, time_limit=0.05, playout_depth=40, exploration=1.4, seed=None, book=None, max_playouts=None):
+        self._time_limit = time_limit  # seconds per move, or None for no clock
+        self._max_playouts = max_playouts  # playouts per move, or None for no limit
+        self._playout_depth = playout_depth  # plies before a playout is scored with evaluate
+        self._exploration = exploration
+        self._random = random.Random(seed)
+        self._book = book  # OpeningBook consulted before searching, or None
+        self._stats = {}
+
+    def get_stats(self):
+        """Returns dict of nodes, playouts, depth, elapsed seconds, nodes per second and whether the move came from
+        the book for the last search."""
+        return self._stats
+
+    def choose_move(self, game, player):
+        """Returns the most visited (start, end, number) move for player, (None, location, 1) for a reserve placement,
+        or None if it isn't player's turn or player has no moves."""
+        started = time.perf_counter()
+        deadline = math.inf if self._time_limit is None else started + self._time_limit
+        max_playouts = math.inf if self._max_playouts is None else self._max_playouts
+        self._stats = {"nodes": 0, "playouts": 0, "depth": 0, "elapsed": 0.0, "nodes_per_second": 0.0, "book": False}
+
+        search_game, side = _search_position(game, player)
+        if search_game is None:
+            return None
+        move = _book_move(self._book, search_game, side)
+        if move is not None:
+            self._stats.update(book=True, elapsed=time.perf_counter() - started)
+            return to_location_move(move)
+        root = _Node(None, None, side ^ 1, list(search_game.generate_moves(side)))
+        if not root.untried:
+            return None
+
+        nodes = 0
+        playouts = 0
+        max_depth = 0
+        while playouts == 0 or (playouts < max_playouts and time.perf_counter() < deadline):
+            node = root
+            made = 0
+
+            # selection
+            while not node.untried and node.children:
+                node = self._select_child(node)
+                search_game.make_move(node.side, node.move[0], node.move[1], node.move[2])
+                made += 1
+
+            # expansion, unless the node's move already won the game
+            if node.untried and search_game.get_capture(node.side) <= 5:
+                move = node.untried.pop(self._random.randrange(len(node.untried)))
+                mover = node.side ^ 1
+                search_game.make_move(mover, move[0], move[1], move[2])
+                made += 1
+                untried = [] if search_game.get_capture(mover) > 5 else list(search_game.generate_moves(mover ^ 1))
+                child = _Node(move, node, mover, untried)
+                node.children.append(child)
+                node = child
+            max_depth = max(max_depth, made)
+
+            # playout, then take back every move of this iteration
+            winner, played = self._playout(search_game, node.side, side)
+            made += played
+            nodes += made
+            playouts += 1
+            for undo in range(made):
+                search_game.unmake_move()
+
+            # backpropagation
+            while node is not None:
+                node.visits += 1
+                if winner == node.side:
+                    node.wins += 1
+                elif winner is None:
+                    node.wins += 0.5
+                node = node.parent
+
+        best = max(root.children, key=lambda child: child.visits)
+        elapsed = time.perf_counter() - started
+        self._stats = {"nodes": nodes, "playouts": playouts, "depth": max_depth, "elapsed": elapsed,
+                       "nodes_per_second": nodes / elapsed if elapsed > 0 else 0.0, "book": False}
+        return to_location_move(best.move)
+
+    def _select_child(self, node):
+        """Returns the child with the highest upper confidence bound."""
+        log_visits = math.log(node.visits)
+        best = None
+        best_value = -1.0
+        for child in node.children:
+            value = child.wins / child.visits + self._exploration * math.sqrt(log_visits / child.visits)
+            if value > best_value:
+                best = child
+                best_value = value
+        return best
+
+    def _playout(self, game, last_side, root_side):
+        """Plays random moves after last_side moved. Returns (winner or None for no result, number of moves made)."""
+        if game.get_capture(last_side) > 5:
+            return last_side, 0
+        side = last_side ^ 1
+        played = 0
+        for ply in range(self._playout_depth):
+            moves = list(game.generate_moves(side))
+            if not moves:
+                return side ^ 1, played
+            move = moves[self._random.randrange(len(moves))]
+            game.make_move(side, move[0], move[1], move[2])
+            played += 1
+            if game.get_capture(side) > 5:
+                return side, played
+            side ^= 1
+
+        # score unfinished playouts by the evaluation
+        score = evaluate(game, root_side)
+        if score > 0:
+            return root_side, played
+        if score < 0:
+            return root_side ^ 1, played
+        return None, played
@@ -0,0 +1,218 @@
+# Author: Timothy Jan
+# Date: 10/17/2026
+# Description: Batched random self-play for Focus/Domination under the FocusGame_original rules. BatchSimulator holds
+#              N games as NumPy arrays of packed stacks (the CompactFocusGame encoding), reserve and capture counts,
+#              and plays one random legal move in every unfinished game per step with array operations, including
+#              the trimming of stacks over five pieces that reserve_capture performs. Needs NumPy.
+
+import csv
+
+import numpy as np
+
+from FocusGame_compact import START_BOARD, MAX_HEIGHT
+from FocusHash import STACK_VALUES
+from FocusMoves import RAYS_6X6, ORIGINAL_DIRECTIONS
+
+NO_MOVE = -2  # start of a step's move in a game that is finished or stuck
+STUCK = -1  # winner of a game that ran out of moves or plies
+
+# END[square][k][number] is where a move of number spaces along the k-th of ORIGINAL_DIRECTIONS lands, -1 off board
+END = np.full((36, len(ORIGINAL_DIRECTIONS), 6), -1, dtype=np.int64)
+for _square in range(36):
+    for _k, _direction in enumerate(ORIGINAL_DIRECTIONS):
+        for _number, _end in enumerate(RAYS_6X6[_square][_direction], 1):
+            END[_square, _k, _number] = _end
+
+# moves of a resting stack (fewer than STACK_VALUES pieces) for each player, looked up at
+# [side, square * STACK_VALUES + stack]: all directions in MOVES, the first direction in FIRST_MOVES
+MOVES = np.zeros((2, 36 * STACK_VALUES), dtype=np.int16)
+FIRST_MOVES = np.zeros((2, 36 * STACK_VALUES), dtype=np.int16)
+for _square in range(36):
+    for _stack in range(2, STACK_VALUES):
+        _counts = [min(_stack.bit_length() - 1, len(RAYS_6X6[_square][_direction]))
+                   for _direction in ORIGINAL_DIRECTIONS]
+        MOVES[_stack & 1, _square * STACK_VALUES + _stack] = sum(_counts)
+        FIRST_MOVES[_stack & 1, _square * STACK_VALUES + _stack] = _counts[0]
+_FLAT_END = END.ravel()  # END looked up at square * 12 + k * 6 + number
+PLACEMENTS = 36  # reserve placements of a player with reserve pieces, one per square
+
+# HEIGHT[packed stack] for every stack up to MAX_HEIGHT pieces
+HEIGHT = np.array([value.bit_length() - 1 for value in range(1 << (MAX_HEIGHT + 1))], dtype=np.int64)
+HEIGHT[0] = 0
+
+
+class BatchSimulator:
+    """Represents many random self-play games advanced together one move per game per step."""
+
+    def __init__(self, games, seed=None, first_player=0, max_plies=400):
+        self._games = games
+        self._random = np.random.default_rng(seed)
+        self._max_plies = max_plies
+        # packed stacks square by square, (36, games), so per-square work runs over contiguous rows
+        self._stacks = np.tile(np.array(START_BOARD, dtype=np.int16)[:, None], (1, games))
+        # games still stepped, in order, with their stacks in _board and each player's moves from each square in
+        # _moves, (2, 36, stepped games), kept up to date as stacks change. Finished games are dropped once they are
+        # at least half of the stepped games, after storing their stacks in _stacks.
+        self._stepped = np.arange(games)
+        self._board = self._stacks.copy()
+        squares = np.arange(36)[:, None] * STACK_VALUES
+        self._moves = MOVES[:, squares + self._board]
+        self._reserve = np.zeros((games, 2), dtype=np.int64)
+        self._capture = np.zeros((games, 2), dtype=np.int64)
+        self._side = np.full(games, first_player, dtype=np.int64)  # player to move in each game
+        self._length = np.zeros(games, dtype=np.int64)  # plies played
+        self._winner = np.full(games, STUCK, dtype=np.int64)
+        self._done = np.zeros(games, dtype=bool)
+
+    def get_games(self):
+        """Returns number of games."""
+        return self._games
+
+    def get_stacks(self):
+        """Returns (games, 36) array of packed stacks."""
+        self._stacks[:, self._stepped] = self._board
+        return self._stacks.T
+
+    def get_reserve(self):
+        """Returns (games, 2) array of reserve counts for player A and player B."""
+        return self._reserve
+
+    def get_capture(self):
+        """Returns (games, 2) array of capture counts for player A and player B."""
+        return self._capture
+
+    def get_side(self):
+        """Returns array of the player to move in each game, 0 for player A and 1 for player B."""
+        return self._side
+
+    def is_done(self):
+        """Returns True once every game is won, stuck or out of plies."""
+        return bool(self._done.all())
+
+    def step(self):
+        """Plays one random legal move in every unfinished game. Returns (start, end, number) arrays of the moves
+        played, start is -1 for a reserve placement and NO_MOVE where no move was played."""
+        games = self._games
+        played_start = np.full(games, NO_MOVE, dtype=np.int64)
+        played_end = np.full(games, NO_MOVE, dtype=np.int64)
+        played_number = np.zeros(games, dtype=np.int64)
+        self._drop_finished()
+        stepped = self._stepped
+        columns = len(stepped)
+        live = ~self._done[stepped]
+        live_count = np.count_nonzero(live)
+        if live_count == 0:
+            return played_start, played_end, played_number
+        # every unfinished game has played as many plies, so they all have the same player to move
+        side = int(self._side[stepped[live.argmax()]])
+        moves = self._moves[side]
+        reserve = self._reserve[:, side]
+        capture = self._capture[:, side]
+        stacks = self._board.ravel()  # read and written at square * columns + column
+
+        # number the moves of every stepped game square by square. The few finished games among them are numbered
+        # too and dropped below, which is cheaper than gathering the live games' columns.
+        through = np.empty_like(moves)  # moves up to and including each square
+        through[0] = moves[0]
+        for square in range(1, 36):
+            np.add(through[square - 1], moves[square], out=through[square])
+        board_moves = through[35]
+        total = board_moves + np.where(reserve[stepped] > 0, PLACEMENTS, 0).astype(np.int16)
+
+        # pick a move uniformly in every game, drawing random numbers for the live games only
+        uniform = np.zeros(columns)
+        uniform[live] = self._random.random(live_count)
+        pick = (uniform * total).astype(np.int16)
+        square = np.minimum((through <= pick).sum(axis=0, dtype=np.int8), 35).astype(np.intp)
+
+        # games without a legal move are stuck, the others play their pick
+        self._done[stepped[total == 0]] = True
+        moving = np.flatnonzero(live & (total > 0))  # columns of the games playing a move
+        game = stepped[moving]
+        pick = pick[moving]
+        board_moves = board_moves[moving]
+        square = square[moving]
+        placement = pick >= board_moves
+
+        # turn the pick into a move: the first direction's moves of a square come before the second's
+        at = square * columns + moving
+        start_stack = stacks.take(at)
+        local = pick - through.ravel().take(at) + moves.ravel().take(at)  # index of the pick among the square's moves
+        first = FIRST_MOVES[side].take(square * STACK_VALUES + start_stack)
+        second = local >= first
+        number = np.where(placement, 1, np.where(second, local - first, local) + 1)
+        start = np.where(placement, -1, square)
+        end = np.where(placement, pick - board_moves, _FLAT_END.take(square * 12 + second * 6 + number))
+
+        # move the top number pieces, or place a reserve piece
+        end_at = end * columns + moving
+        end_stack = stacks.take(end_at)
+        moved = start_stack & ((1 << number) - 1)
+        new_end = np.where(placement, (end_stack << 1) | side, (end_stack << number) | moved)
+        board = ~placement
+        left = start_stack[board] >> number[board]
+        stacks[at[board]] = left
+        reserve[game[placement]] -= 1
+
+        # FocusGame_original credits the bottom piece once per excess piece and removes pieces from the top
+        height = HEIGHT[new_end]
+        excess = np.maximum(height - 5, 0)
+        own = ((new_end >> np.maximum(height - 1, 0)) & 1) == side
+        reserve[game] += np.where(own, excess, 0)
+        capture[game] += np.where(own, 0, excess)
+        new_end >>= excess
+        stacks[end_at] = new_end
+
+        # both players' moves change on the squares whose stacks changed
+        self._set_moves(at[board], square[board] * STACK_VALUES + left)
+        self._set_moves(end_at, end * STACK_VALUES + new_end)
+
+        # check win condition, then pass the turn
+        self._length[game] += 1
+        won = game[capture[game] > 5]
+        self._winner[won] = side
+        self._done[won] = True
+        self._done[game] |= self._length[game] >= self._max_plies
+        self._side[game] ^= 1
+
+        played_start[game] = start
+        played_end[game] = end
+        played_number[game] = number
+        return played_start, played_end, played_number
+
+    def _drop_finished(self):
+        """Stops stepping finished games once they are at least half of the stepped games, storing their stacks."""
+        live = np.flatnonzero(~self._done[self._stepped])
+        if 2 * len(live) > len(self._stepped):
+            return
+        self._stacks[:, self._stepped] = self._board
+        self._stepped = self._stepped[live]
+        # take keeps the arrays C-contiguous, so their ravelled views write through
+        self._board = self._board.take(live, axis=1)
+        self._moves = self._moves.take(live, axis=2)
+
+    def _set_moves(self, cells, keys):
+        """Sets both players' moves at cells (square * columns + column of the stepped games) to those of the stacks
+        at keys (square * STACK_VALUES + stack)."""
+        flat_moves = self._moves.reshape(2, -1)
+        flat_moves[0, cells] = MOVES[0].take(keys)
+        flat_moves[1, cells] = MOVES[1].take(keys)
+
+    def run(self):
+        """Steps until every game is done. Returns self."""
+        while not self.is_done():
+            self.step()
+        return self
+
+    def iter_results(self):
+        """Yields (game, winner, length, captures A, captures B, reserve A, reserve B) per game, winner is STUCK for
+        games that ran out of moves or plies."""
+        for game in range(self._games):
+            yield (game, int(self._winner[game]), int(self._length[game]), int(self._capture[game, 0]),
+                   int(self._capture[game, 1]), int(self._reserve[game, 0]), int(self._reserve[game, 1]))
+
+    def write_results(self, file):
+        """Writes the per-game results table as CSV to an open text file."""
+        writer = csv.writer(file)
+        writer.writerow(("game", "winner", "length", "captures_a", "captures_b", "reserve_a", "reserve_b"))
+        writer.writerows(self.iter_results())
@@ -0,0 +1,303 @@
+# Author: Timothy Jan
+# Date: 10/17/2026
+# Description: Benchmark suite for FocusGame_original.FocusGame. Each scenario is timed in batches of loops, the
+#              batch repeated, and the seconds per operation written to JSON. Comparing against an earlier JSON file
+#              reports the change of every scenario and fails when one is slower than the threshold allows.
+#              The batch scenarios play random games with FocusBatch.BatchSimulator and need NumPy, they are skipped
+#              without it. batch_speedup is random_plies over batch_plies, and regresses when it shrinks.
+#              Usage: python FocusBenchmark.py [--output results.json] [--compare baseline.json] [--threshold 0.1]
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+
+from FocusGame_compact import CompactFocusGame
+from FocusGame_original import FocusGame
+from FocusMemoryBenchmark import bytes_per_game
+
+PLAYER_A = ("PlayerA", "R")
+PLAYER_B = ("PlayerB", "G")
+
+# PlayerA to move with a four piece stack at (0, 1) and three pieces in reserve. Moving it onto the four piece stack
+# at (0, 5), or placing a reserve piece on the five piece stack at (1, 5), makes reserve_capture trim the stack.
+TALL_POSITION = ("-,aaaa,-,-,-,bbba/-,-,-,-,-,abbab/-,-,-,-,-,-/-,-,-,-,-,-/-,-,-,-,-,-/-,-,-,-,-,- "
+                 "a a 3 3:0 0:0 m")
+VALID_MOVE = ("PlayerA", (0, 1), (0, 5), 4)
+INVALID_MOVES = (("PlayerC", (0, 1), (0, 5), 4),  # unknown player
+                 ("PlayerB", (0, 5), (1, 5), 1),  # not their turn
+                 ("PlayerA", (0, 1), (0, 6), 5),  # off the board
+                 ("PlayerA", (0, 1), (1, 2), 1),  # diagonal
+                 ("PlayerA", (0, 1), (0, 4), 2),  # wrong distance
+                 ("PlayerA", (0, 1), (0, 2), 5),  # more pieces than the stack holds
+                 ("PlayerA", (1, 5), (2, 5), 1))  # stack belongs to the other player
+SETUP_LOOPS = 2000  # moves per batch of scenarios that need a fresh game for every move
+RANDOM_GAMES = 10  # games per batch of the random_games scenario
+MAX_PLIES = 400  # plies after which a random game counts as finished
+RANDOM_PLIES = 10000  # plies per batch of the random_plies scenario
+BATCH_GAMES = 20000  # games per BatchSimulator of the batch_plies scenario
+BATCH_PLIES = 1000000  # plies per batch of the batch_plies scenario
+MEMORY_GAMES = 10000
+
+
+def tall_game():
+    """Returns a FocusGame in TALL_POSITION."""
+    return FocusGame.from_text(TALL_POSITION, PLAYER_A, PLAYER_B)
+
+
+def tall_games(count):
+    """Returns list of count FocusGames in TALL_POSITION."""
+    compact = CompactFocusGame.from_text(TALL_POSITION, PLAYER_A, PLAYER_B)
+    return [FocusGame.from_compact(compact) for game in range(count)]
+
+
+def bench_construction(loops):
+    """Returns seconds to construct loops new games."""
+    started = time.perf_counter()
+    for loop in range(loops):
+        FocusGame(PLAYER_A, PLAYER_B)
+    return time.perf_counter() - started
+
+
+def bench_pre_move_check_valid(loops):
+    """Returns seconds for loops checks of a valid move."""
+    game = tall_game()
+    player, start, end, number = VALID_MOVE
+    started = time.perf_counter()
+    for loop in range(loops):
+        game.pre_move_check(player, start, end, number)
+    return time.perf_counter() - started
+
+
+def bench_pre_move_check_invalid(loops):
+    """Returns seconds for loops checks of invalid moves, cycling through INVALID_MOVES."""
+    game = tall_game()
+    moves = [INVALID_MOVES[loop % len(INVALID_MOVES)] for loop in range(loops)]
+    started = time.perf_counter()
+    for player, start, end, number in moves:
+        game.pre_move_check(player, start, end, number)
+    return time.perf_counter() - started
+
+
+def bench_move_piece_tall(loops):
+    """Returns seconds for loops moves onto a tall stack, each of which trims it in reserve_capture."""
+    games = tall_games(loops)
+    player, start, end, number = VALID_MOVE
+    started = time.perf_counter()
+    for game in games:
+        game.move_piece(player, start, end, number)
+    return time.perf_counter() - started
+
+
+def bench_reserved_move(loops):
+    """Returns seconds for loops reserve placements onto a tall stack."""
+    games = tall_games(loops)
+    started = time.perf_counter()
+    for game in games:
+        game.reserved_move("PlayerA", (1, 5))
+    return time.perf_counter() - started
+
+
+def bench_show_pieces(loops):
+    """Returns seconds for loops calls of show_pieces on a five piece stack."""
+    game = tall_game()
+    started = time.perf_counter()
+    for loop in range(loops):
+        game.show_pieces((1, 5))
+    return time.perf_counter() - started
+
+
+def bench_restore_bytes(loops):
+    """Returns seconds for loops FocusGame.from_bytes restores of a TALL_POSITION snapshot."""
+    data = tall_game().to_bytes()
+    started = time.perf_counter()
+    for loop in range(loops):
+        FocusGame.from_bytes(data, PLAYER_A, PLAYER_B)
+    return time.perf_counter() - started
+
+
+def bench_restore_compact_bytes(loops):
+    """Returns seconds for loops CompactFocusGame.from_bytes restores of a TALL_POSITION snapshot."""
+    data = tall_game().to_bytes()
+    started = time.perf_counter()
+    for loop in range(loops):
+        CompactFocusGame.from_bytes(data, PLAYER_A, PLAYER_B)
+    return time.perf_counter() - started
+
+
+def play_random_game(seed):
+    """Plays random legal moves from the start until a player wins, can't move or MAX_PLIES pass. Returns plies
+    played."""
+    rng = random.Random(seed)
+    game = FocusGame(PLAYER_A, PLAYER_B)
+    player = PLAYER_A[0]
+    other = PLAYER_B[0]
+    for ply in range(MAX_PLIES):
+        moves = list(game.legal_moves(player))
+        if not moves:
+            return ply
+        start, end, number = moves[rng.randrange(len(moves))]
+        if start is None:
+            message = game.reserved_move(player, end)
+        else:
+            message = game.move_piece(player, start, end, number)
+        if message == player + " Wins":
+            return ply + 1
+        player, other = other, player
+    return MAX_PLIES
+
+
+def bench_random_games(loops):
+    """Returns seconds to play loops random games, the same seeds in every batch."""
+    started = time.perf_counter()
+    for loop in range(loops):
+        play_random_game(loop)
+    return time.perf_counter() - started
+
+
+def bench_random_plies(loops):
+    """Returns seconds for loops plies of random games, played a whole game at a time from the same seeds in every
+    batch."""
+    plies = 0
+    seed = 0
+    started = time.perf_counter()
+    while plies < loops:
+        plies += play_random_game(seed)
+        seed += 1
+    return (time.perf_counter() - started) * loops / plies
+
+
+def bench_batch_plies(loops):
+    """Returns seconds for loops plies of random games played by BatchSimulator, BATCH_GAMES games at a time from the
+    same seeds in every batch."""
+    from FocusBatch import BatchSimulator
+
+    plies = 0
+    seed = 0
+    started = time.perf_counter()
+    while plies < loops:
+        simulator = BatchSimulator(BATCH_GAMES, seed, 0, MAX_PLIES).run()
+        plies += sum(result[2] for result in simulator.iter_results())
+        seed += 1
+    return (time.perf_counter() - started) * loops / plies
+
+
+# name -> (function of loops returning seconds, fixed loops or None to calibrate)
+SCENARIOS = {"construction": (bench_construction, None),
+             "pre_move_check_valid": (bench_pre_move_check_valid, None),
+             "pre_move_check_invalid": (bench_pre_move_check_invalid, None),
+             "move_piece_tall": (bench_move_piece_tall, SETUP_LOOPS),
+             "reserved_move": (bench_reserved_move, SETUP_LOOPS),
+             "show_pieces": (bench_show_pieces, None),
+             "restore_bytes": (bench_restore_bytes, None),
+             "restore_compact_bytes": (bench_restore_compact_bytes, None),
+             "random_games": (bench_random_games, RANDOM_GAMES),
+             "random_plies": (bench_random_plies, RANDOM_PLIES),
+             "batch_plies": (bench_batch_plies, BATCH_PLIES)}
+
+
+def calibrate(function, min_time):
+    """Returns loops for which function takes at least min_time seconds."""
+    loops = 1
+    while function(loops) < min_time and loops < 1 << 24:
+        loops *= 2
+    return loops
+
+
+def run_scenario(function, loops=None, repeat=5, min_time=0.05):
+    """Returns dict of unit, loops, seconds per operation of every batch and their median, mean and minimum."""
+    if loops is None:
+        loops = calibrate(function, min_time)
+    function(loops)  # warm up
+    values = [function(loops) / loops for batch in range(repeat)]
+    return {"unit": "s", "loops": loops, "values": values, "median": statistics.median(values),
+            "mean": statistics.mean(values), "min": min(values)}
+
+
+def run_suite(names=None, repeat=5, min_time=0.05, memory_games=MEMORY_GAMES):
+    """Returns the results document for the named scenarios, every scenario, batch_speedup and memory_per_game by
+    default."""
+    results = {}
+    for name, (function, loops) in SCENARIOS.items():
+        if names is None or name in names:
+            try:
+                results[name] = run_scenario(function, loops, repeat, min_time)
+            except ImportError:
+                pass  # a batch scenario without NumPy
+    if "random_plies" in results and "batch_plies" in results:
+        value = results["random_plies"]["median"] / results["batch_plies"]["median"]
+        results["batch_speedup"] = {"unit": "x", "loops": 1, "values": [value], "median": value, "mean": value,
+                                    "min": value}
+    if names is None or "memory_per_game" in names:
+        value = bytes_per_game(FocusGame, memory_games)
+        results["memory_per_game"] = {"unit": "bytes", "loops": memory_games, "values": [value], "median": value,
+                                      "mean": value, "min": value}
+    return {"python": platform.python_version(), "implementation": platform.python_implementation(),
+            "machine": platform.machine(), "time": time.strftime("%Y-%m-%dT%H:%M:%S"), "benchmarks": results}
+
+
+def compare(baseline, current, threshold=0.1):
+    """Returns list of (name, baseline median, current median, change ratio, regressed) for scenarios in both
+    documents. A scenario regresses when its median grew by more than threshold (0.1 is 10%), or for a speedup
+    when its inverse did."""
+    rows = []
+    for name, result in current["benchmarks"].items():
+        if name not in baseline["benchmarks"]:
+            continue
+        old = baseline["benchmarks"][name]["median"]
+        new = result["median"]
+        if result["unit"] == "x":
+            change = old / new - 1 if new else 0.0
+        else:
+            change = new / old - 1 if old else 0.0
+        rows.append((name, old, new, change, change > threshold))
+    return rows
+
+
+def format_value(value, unit):
+    """Returns a median as readable text."""
+    if unit == "bytes":
+        return "%.0f B" % value
+    if unit == "x":
+        return "%.1fx" % value
+    if value < 1e-3:
+        return "%.2f us" % (value * 1e6)
+    return "%.2f ms" % (value * 1e3)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark FocusGame_original.FocusGame.")
+    parser.add_argument("--output", help="write results JSON to this file")
+    parser.add_argument("--compare", help="baseline results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="allowed slowdown before failing (0.1 is 10%%)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed batches per scenario")
+    parser.add_argument("--min-time", type=float, default=0.05, help="seconds per calibrated batch")
+    parser.add_argument("--scenario", action="append", help="run only this scenario, may be given more than once")
+    arguments = parser.parse_args()
+
+    document = run_suite(arguments.scenario, arguments.repeat, arguments.min_time)
+    for name, result in document["benchmarks"].items():
+        print("%-24s %12s" % (name, format_value(result["median"], result["unit"])))
+    if arguments.output:
+        with open(arguments.output, "w") as output:
+            json.dump(document, output, indent=2)
+
+    if arguments.compare:
+        with open(arguments.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+        regressed = False
+        print()
+        for name, old, new, change, slower in compare(baseline, document, arguments.threshold):
+            unit = document["benchmarks"][name]["unit"]
+            print("%-24s %12s -> %12s %+7.1f%%%s" % (name, format_value(old, unit), format_value(new, unit),
+                                                     change * 100, "  REGRESSION" if slower else ""))
+            regressed = regressed or slower
+        if regressed:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,247 @@
+# Author: Timothy Jan
+# Date: 10/17/2026
+# Description: Opening book for the fixed FocusGame_original starting position. BookBuilder collects the moves played in
+#              the first plies of self-play games or FocusRecord archives under symmetry-reduced position keys and
+#              writes them sorted to a compact file. OpeningBook memory-maps that file on first use and finds a
+#              position's moves by binary search, so loading costs nothing and only the pages touched are read.
+#
+#              File layout (little endian):
+#                  b"FOCUSBOK", u16 version, u32 number of records
+#                  records sorted by key, then by games played descending:
+#                      u64 key, u16 move, u16 games played, i32 score
+#
+#              Keys are the first 8 bytes of the BLAKE2b digest of FocusCache.position_key, and moves are packed as in
+#              FocusRecord (start square, 63 for a reserve placement, << 9 | end square << 3 | number) in the canonical
+#              position. Score is wins minus losses of the player making the move.
+#              Usage: python FocusBook.py book.bin [--games 200] [--archive games.rec] [--plies 12]
+
+import argparse
+import hashlib
+import mmap
+import random
+import struct
+
+from FocusAI import AlphaBetaEngine, evaluate
+from FocusCache import position_key, to_canonical_move, from_canonical_move
+from FocusGame_compact import CompactFocusGame
+from FocusRecord import RecordReader, PLACEMENT
+
+MAGIC = b"FOCUSBOK"
+VERSION = 1
+BOOK_PLIES = 12  # plies of each game added to the book
+MAX_GAMES = 65535  # games counted per book move
+
+_FILE_HEADER = struct.Struct("<8sHI")
+_RECORD = struct.Struct("<QHHi")
+_KEY = struct.Struct("<Q")
+
+
+def book_key(game, side):
+    """Returns (u64 book key, symmetry index) of a CompactFocusGame position with player A (0) or player B (1) to
+    move."""
+    key, symmetry = position_key(game, side)
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little"), symmetry
+
+
+def pack_move(move):
+    """Returns u16 for a (start, end, number) board index move, start is -1 for a reserve placement."""
+    start, end, number = move
+    return (PLACEMENT if start < 0 else start) << 9 | end << 3 | number
+
+
+def unpack_move(value):
+    """Returns (start, end, number) board index move for a u16."""
+    start = value >> 9
+    return (-1 if start == PLACEMENT else start), (value >> 3) & 63, value & 7
+
+
+class BookBuilder:
+    """Represents the book moves collected from games, before they are written to a file."""
+
+    def __init__(self, book_plies=BOOK_PLIES):
+        self._book_plies = book_plies
+        self._moves = {}  # (book key, packed canonical move) -> [games, score]
+        self._games = 0
+
+    def get_game_count(self):
+        """Returns number of games added."""
+        return self._games
+
+    def get_move_count(self):
+        """Returns number of distinct (position, move) pairs collected."""
+        return len(self._moves)
+
+    def add_game(self, first_player, moves, winner):
+        """Adds the first plies of a game from the starting position. first_player is 0 if player A moved first and 1
+        if player B did, moves are the (start, end, number) board index moves in order, and winner is the index of
+        the winning player or None."""
+        game = CompactFocusGame(("PlayerA", "R"), ("PlayerB", "G"))
+        side = first_player
+        for move in moves[:self._book_plies]:
+            key, symmetry = book_key(game, side)
+            entry = self._moves.setdefault((key, pack_move(to_canonical_move(move, symmetry))), [0, 0])
+            entry[0] += 1
+            if winner is not None:
+                entry[1] += 1 if winner == side else -1
+            game.make_move(side, move[0], move[1], move[2])
+            side ^= 1
+        self._games += 1
+
+    def add_archive(self, path):
+        """Adds every game of a FocusRecord archive, replaying each to find its winner."""
+        with RecordReader(path) as reader:
+            for index in range(reader.get_game_count()):
+                first_player = reader.get_header(index)[2]
+                moves = [(-1 if start is None else start[0] * 6 + start[1], end[0] * 6 + end[1], number)
+                         for start, end, number in reader.get_moves(index)]
+                final = reader.replay(index)
+                winner = None
+                if isinstance(final.get_message(), str) and final.get_message().endswith(" Wins"):
+                    winner = 0 if final.get_message() == final.get_player_name(0) + " Wins" else 1
+                self.add_game(first_player, moves, winner)
+
+    def write(self, path, min_games=1):
+        """Writes the moves played in at least min_games games to a book file."""
+        records = sorted((key, -min(entry[0], MAX_GAMES), move, entry[1])
+                         for (key, move), entry in self._moves.items() if entry[0] >= min_games)
+        with open(path, "wb") as output:
+            output.write(_FILE_HEADER.pack(MAGIC, VERSION, len(records)))
+            for key, negative_games, move, score in records:
+                output.write(_RECORD.pack(key, move, -negative_games, score))
+
+
+def self_play(games, seed=0, time_limit=0.005, explore=0.25, book_plies=BOOK_PLIES, max_plies=200):
+    """Yields (first player, moves, winner) for games of AlphaBetaEngine against itself. In the first book_plies plies
+    a random move is played instead with probability explore, so the games branch out. Games still going after max_plies
+    are won by the side evaluate favors, or drawn."""
+    rng = random.Random(seed)
+    engine = AlphaBetaEngine(time_limit)
+    for index in range(games):
+        game = CompactFocusGame(("PlayerA", "R"), ("PlayerB", "G"))
+        first_player = rng.randrange(2)
+        side = first_player
+        moves = []
+        winner = None
+        for ply in range(max_plies):
+            legal = list(game.generate_moves(side))
+            if not legal:
+                winner = side ^ 1
+                break
+            if ply < book_plies and rng.random() < explore:
+                move = legal[rng.randrange(len(legal))]
+            else:
+                start, end, number = engine.choose_move(game, game.get_player_name(side))
+                move = (-1 if start is None else start[0] * 6 + start[1], end[0] * 6 + end[1], number)
+            game.make_move(side, move[0], move[1], move[2])
+            moves.append(move)
+            if game.get_capture(side) > 5:
+                winner = side
+                break
+            side ^= 1
+        else:
+            score = evaluate(game, 0)
+            winner = 0 if score > 0 else 1 if score < 0 else None
+        yield first_player, moves, winner
+
+
+class OpeningBook:
+    """Represents a book file, memory-mapped the first time it is probed."""
+
+    def __init__(self, path):
+        self._path = path
+        self._file = None
+        self._map = None
+        self._count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _open(self):
+        """Maps the file and checks its header."""
+        self._file = open(self._path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count = _FILE_HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION or len(self._map) != _FILE_HEADER.size + count * _RECORD.size:
+            self.close()
+            raise ValueError("not a Focus opening book file")
+        self._count = count
+
+    def close(self):
+        """Unmaps and closes the file. It is mapped again if the book is probed later."""
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map = None
+            self._file = None
+
+    def get_record_count(self):
+        """Returns number of (position, move) records in the book."""
+        if self._map is None:
+            self._open()
+        return self._count
+
+    def probe(self, game, side):
+        """Returns list of (move, games, score) book moves of a CompactFocusGame position with player A (0) or player
+        B (1) to move, most played first. Moves are (start, end, number) board indexes in this position."""
+        if self._map is None:
+            self._open()
+        key, symmetry = book_key(game, side)
+
+        # first record with a key not below the position's
+        low = 0
+        high = self._count
+        while low < high:
+            middle = (low + high) // 2
+            if _KEY.unpack_from(self._map, _FILE_HEADER.size + middle * _RECORD.size)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        moves = []
+        offset = _FILE_HEADER.size + low * _RECORD.size
+        while low < self._count:
+            record_key, move, games, score = _RECORD.unpack_from(self._map, offset)
+            if record_key != key:
+                break
+            moves.append((from_canonical_move(unpack_move(move), symmetry), games, score))
+            low += 1
+            offset += _RECORD.size
+        return moves
+
+    def choose_move(self, game, side):
+        """Returns the most played legal book move of a CompactFocusGame position with side to move, or None."""
+        moves = self.probe(game, side)
+        if not moves:
+            return None
+        legal = set(game.generate_moves(side))
+        for move, games, score in moves:
+            # a key shared by two positions could give a move that isn't legal here
+            if move in legal:
+                return move
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a Focus opening book.")
+    parser.add_argument("output", help="book file to write")
+    parser.add_argument("--games", type=int, default=200, help="self-play games to add")
+    parser.add_argument("--archive", action="append", default=[], help="FocusRecord archive to add, may be repeated")
+    parser.add_argument("--plies", type=int, default=BOOK_PLIES, help="plies of each game added to the book")
+    parser.add_argument("--min-games", type=int, default=1, help="games a move needs to be kept")
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    builder = BookBuilder(arguments.plies)
+    for path in arguments.archive:
+        builder.add_archive(path)
+    for first_player, moves, winner in self_play(arguments.games, arguments.seed, book_plies=arguments.plies):
+        builder.add_game(first_player, moves, winner)
+    builder.write(arguments.output, arguments.min_games)
+    print("%d games, %d book moves" % (builder.get_game_count(), builder.get_move_count()))
+
+
+if __name__ == '__main__':
+    main()
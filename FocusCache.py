@@ -0,0 +1,185 @@
+# Author: Timothy Jan
+# Date: 10/17/2026
+# Description: Position-keyed evaluation cache for CompactFocusGame analysis. A position's key is its packed board, the
+#              reserve and capture counts and the side to move, reduced over the board symmetries that keep the
+#              FocusGame_original rules (the diagonal reflection swapping rows and columns, since moves only go down
+#              or right), so mirrored positions share one entry. Entries hold a score, search depth and best move,
+#              are evicted least recently used first, and can be saved to a file and loaded again after a restart.
+#
+#              File layout (little endian):
+#                  b"FOCUSEVC", u16 version, u16 key length, u32 number of entries
+#                  entries, least recently used first: key bytes, i32 score, u8 depth,
+#                  u8 start square (255 for a reserve placement), u8 end square, u8 number
+
+import os
+import struct
+from collections import OrderedDict
+from operator import itemgetter
+
+from FocusGeometry import GEOMETRY_6X6
+from FocusMoves import ORIGINAL_DIRECTIONS
+
+MAGIC = b"FOCUSEVC"
+VERSION = 1
+MAX_ENTRIES = 100000
+PLACEMENT = 255  # start square of a reserve placement in the file
+
+# square permutations of the 6x6 board that map every move of the original rules to a move
+SYMMETRIES = GEOMETRY_6X6.get_symmetries(ORIGINAL_DIRECTIONS)
+KEY_LENGTH = len(SYMMETRIES[0]) + 5
+
+_FILE_HEADER = struct.Struct("<8sHHI")
+_ENTRY = struct.Struct("<iBBBB")
+
+
+def _map_move(move, symmetry):
+    """Returns a (start, end, number) board index move with its squares mapped by a symmetry, start -1 kept for a
+    reserve placement."""
+    start, end, number = move
+    return (symmetry[start] if start >= 0 else -1), symmetry[end], number
+
+
+def to_canonical_move(move, symmetry):
+    """Returns a board index move of a position as the same move in its canonical position, for the symmetry index
+    returned by position_key."""
+    return _map_move(move, SYMMETRIES[symmetry])
+
+
+def from_canonical_move(move, symmetry):
+    """Returns a board index move of a canonical position as the same move in the position it was reached from, for
+    the symmetry index returned by position_key."""
+    return _map_move(move, _INVERSES[symmetry])
+
+
+def _invert(symmetry):
+    """Returns the permutation undoing a symmetry."""
+    inverse = [0] * len(symmetry)
+    for square, image in enumerate(symmetry):
+        inverse[image] = square
+    return tuple(inverse)
+
+
+_INVERSES = tuple(_invert(symmetry) for symmetry in SYMMETRIES)
+# per symmetry, the getter picking the stack that lands on each square, in square order
+_GATHERS = tuple(itemgetter(*inverse) for inverse in _INVERSES)
+
+
+def position_key(game, side):
+    """Returns (canonical key bytes, index of the symmetry mapping the position onto it) for a CompactFocusGame with
+    player A (0) or player B (1) to move."""
+    board = game.get_board()
+    counts = bytes((game.get_reserve(0), game.get_reserve(1), game.get_capture(0), game.get_capture(1), side))
+    best_key = None
+    best_symmetry = 0
+    for index, gather in enumerate(_GATHERS):
+        # stacks between moves hold at most five pieces, so every packed stack fits in a byte
+        key = bytes(gather(board)) + counts
+        if best_key is None or key < best_key:
+            best_key = key
+            best_symmetry = index
+    return best_key, best_symmetry
+
+
+class EvaluationCache:
+    """Represents a bounded cache of (score, depth, best move) by position, evicting the least recently used entry
+    when full. Scores are from the point of view of the side to move, and moves are (start, end, number) board
+    indexes as generate_moves yields them."""
+
+    def __init__(self, max_entries=MAX_ENTRIES, path=None):
+        self._max_entries = max_entries
+        self._entries = OrderedDict()  # canonical key -> (score, depth, move in the canonical position)
+        self._hits = 0
+        self._misses = 0
+        self._path = path  # file loaded now if it exists, and written by save
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def get_max_entries(self):
+        """Returns number of entries kept before evicting."""
+        return self._max_entries
+
+    def get_size(self):
+        """Returns number of entries."""
+        return len(self._entries)
+
+    def get_hits(self):
+        """Returns number of successful probes."""
+        return self._hits
+
+    def get_misses(self):
+        """Returns number of failed probes."""
+        return self._misses
+
+    def get_stats(self):
+        """Returns dict of entries, maximum entries, hits, misses and hit rate."""
+        probes = self._hits + self._misses
+        return {"entries": len(self._entries), "max_entries": self._max_entries, "hits": self._hits,
+                "misses": self._misses, "hit_rate": self._hits / probes if probes else 0.0}
+
+    def clear(self):
+        """Deletes every entry and resets the counters."""
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def probe(self, game, side):
+        """Returns (score, depth, move) stored for a CompactFocusGame position with side to move, the move mapped
+        onto this position, or None."""
+        key, symmetry = position_key(game, side)
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._entries.move_to_end(key)
+        score, depth, move = entry
+        return score, depth, from_canonical_move(move, symmetry)
+
+    def store(self, game, side, score, depth, move):
+        """Stores the result of analyzing a CompactFocusGame position with side to move, unless a deeper result is
+        already stored."""
+        key, symmetry = position_key(game, side)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            if entry[1] > depth:
+                return
+        self._entries[key] = (score, depth, to_canonical_move(move, symmetry))
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def save(self, path=None):
+        """Writes every entry to a file, the cache's own path by default. The file is replaced only once completely
+        written."""
+        path = self._path if path is None else path
+        if path is None:
+            raise ValueError("no file to save the evaluation cache to")
+        temporary = path + ".tmp"
+        with open(temporary, "wb") as output:
+            output.write(_FILE_HEADER.pack(MAGIC, VERSION, KEY_LENGTH, len(self._entries)))
+            for key, (score, depth, (start, end, number)) in self._entries.items():
+                output.write(key)
+                output.write(_ENTRY.pack(score, depth, PLACEMENT if start < 0 else start, end, number))
+        os.replace(temporary, path)
+
+    def load(self, path):
+        """Adds the entries of a file written by save as the most recently used, evicting older entries if full."""
+        with open(path, "rb") as source:
+            data = source.read()
+        if len(data) < _FILE_HEADER.size:
+            raise ValueError("not an evaluation cache file")
+        magic, version, key_length, count = _FILE_HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not an evaluation cache file")
+        if key_length != KEY_LENGTH or len(data) != _FILE_HEADER.size + count * (key_length + _ENTRY.size):
+            raise ValueError("evaluation cache file doesn't match this board")
+
+        offset = _FILE_HEADER.size
+        for entry in range(count):
+            key = data[offset:offset + key_length]
+            score, depth, start, end, number = _ENTRY.unpack_from(data, offset + key_length)
+            offset += key_length + _ENTRY.size
+            self._entries[key] = (score, depth, (-1 if start == PLACEMENT else start, end, number))
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
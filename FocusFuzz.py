@@ -0,0 +1,290 @@
+# Author: Timothy Jan
+# Date: 10/17/2026
+# Description: Differential fuzzing of engines that play by the FocusGame_original rules. Every seed deterministically
+#              drives one game of random operations: mostly moves of the mover's own stacks, mixed with illegal moves
+#              (off the board, diagonal, wrong distance or number, other player's stacks, unknown players) and reserve
+#              placements. Each operation runs on a reference engine and a candidate engine, whose return values (or
+#              exception types) must match every ply and whose to_text states and position hashes must match every
+#              CHECK_EVERY plies and at the end. Seeds are sharded across processes, and the lowest diverging seed is
+#              replayed ply by ply to find the first diverging ply, then shrunk to a minimal reproduction.
+#
+#              The batched engine picks its own moves, so check_batch replays the moves it plays on reference games
+#              and compares the packed boards, reserves and captures after every step instead.
+#              Usage: python FocusFuzz.py [candidate] [--reference original] [--seeds 2000] [--plies 500]
+#                                         [--workers N] [--batch GAMES]
+
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from FocusGame_compact import CompactFocusGame
+from FocusGame_original import FocusGame
+from FocusStats import InstrumentedFocusGame
+
+PLAYER_A = ("PlayerA", "R")
+PLAYER_B = ("PlayerB", "G")
+CHECK_EVERY = 16  # plies between state comparisons while fuzzing
+LEGAL_SHARE = 0.8  # share of operations aimed at a stack of the mover
+
+# engine name -> class constructed from (name, color) players A and B
+ENGINES = {"original": FocusGame, "compact": CompactFocusGame, "instrumented": InstrumentedFocusGame}
+
+_DIRECTIONS = ((1, 0), (0, 1), (-1, 0), (0, -1), (1, 1))  # down, right, up, left and diagonal
+
+
+def register_engine(name, engine_class):
+    """Makes an engine class available to the harness by name. It must take (name, color) players A and B and have
+    move_piece, reserved_move, show_pieces, to_text and get_hash."""
+    ENGINES[name] = engine_class
+
+
+def _outcome(method, *arguments):
+    """Returns the return value of a move method, or the name of the exception it raised."""
+    try:
+        return method(*arguments)
+    except Exception as error:
+        return "raised " + type(error).__name__
+
+
+def apply_op(game, op):
+    """Returns the outcome of one ("move", player, start, end, number) or ("reserve", player, location) operation."""
+    if op[0] == "reserve":
+        return _outcome(game.reserved_move, op[1], op[2])
+    return _outcome(game.move_piece, op[1], op[2], op[3], op[4])
+
+
+def next_op(rng, game, mover):
+    """Returns a random operation for a game in which mover (0 or 1) is expected to move."""
+    players = (PLAYER_A, PLAYER_B)
+    roll = rng.random()
+    if roll < LEGAL_SHARE:
+        # aim at a stack: legal if the mover owns it and the move stays on the board
+        start = (rng.randrange(6), rng.randrange(6))
+        pieces = game.show_pieces(start)
+        if pieces and pieces[-1] == players[mover][1]:
+            number = rng.randint(1, len(pieces))
+            row_step, column_step = _DIRECTIONS[rng.randrange(2)]
+            return "move", players[mover][0], start, (start[0] + row_step * number, start[1] + column_step * number), \
+                number
+        return "reserve", players[mover][0], start
+    if roll < 0.9:
+        player = rng.choice((players[mover][0], players[mover][0], players[mover ^ 1][0], "PlayerC"))
+        start = (rng.randint(-1, 6), rng.randint(-1, 6))
+        row_step, column_step = rng.choice(_DIRECTIONS)
+        number = rng.randint(-1, 6)
+        distance = number if rng.random() < 0.7 else rng.randint(-1, 6)
+        return "move", player, start, (start[0] + row_step * distance, start[1] + column_step * distance), number
+    player = rng.choice((players[mover][0], players[mover ^ 1][0], "PlayerC"))
+    return "reserve", player, (rng.randint(-1, 6), rng.randint(-1, 6))
+
+
+def _accepted(outcome):
+    """Returns True if an outcome passes the turn, as far as the harness tracks it."""
+    return isinstance(outcome, str) and outcome != "No pieces in reserve" and not outcome.startswith("raised ")
+
+
+def _state(game):
+    """Returns the comparable state of a game, its text and position hash, or the exception type if it can't be
+    read."""
+    return _outcome(lambda: (game.to_text(), game.get_hash()))
+
+
+def replay(reference, candidate, ops):
+    """Plays ops on fresh reference and candidate games, comparing after every op. Returns (ply, reference result,
+    candidate result) of the first difference, results being ("outcome", value) or ("state", text), or None."""
+    reference_game = ENGINES[reference](PLAYER_A, PLAYER_B)
+    candidate_game = ENGINES[candidate](PLAYER_A, PLAYER_B)
+    for ply, op in enumerate(ops):
+        expected = apply_op(reference_game, op)
+        actual = apply_op(candidate_game, op)
+        if expected != actual:
+            return ply, ("outcome", expected), ("outcome", actual)
+        expected = _state(reference_game)
+        actual = _state(candidate_game)
+        if expected != actual:
+            return ply, ("state", expected), ("state", actual)
+    return None
+
+
+def fuzz_seed(reference, candidate, seed, plies, check_every=CHECK_EVERY):
+    """Plays one seed's operations on both engines. Returns (plies played, ops up to the first difference or None).
+    Differences in state are noticed at the next check, so the ops returned end at or after the diverging ply."""
+    rng = random.Random(seed)
+    reference_game = ENGINES[reference](PLAYER_A, PLAYER_B)
+    candidate_game = ENGINES[candidate](PLAYER_A, PLAYER_B)
+    mover = rng.randrange(2)
+    ops = []
+    for ply in range(plies):
+        op = next_op(rng, reference_game, mover)
+        ops.append(op)
+        expected = apply_op(reference_game, op)
+        if expected != apply_op(candidate_game, op):
+            return ply + 1, ops
+        if (ply + 1) % check_every == 0 or ply + 1 == plies:
+            if _state(reference_game) != _state(candidate_game):
+                return ply + 1, ops
+        if _accepted(expected) and op[1] in (PLAYER_A[0], PLAYER_B[0]):
+            mover = 0 if op[1] == PLAYER_B[0] else 1
+    return plies, None
+
+
+def _fuzz_seeds(task):
+    """Fuzzes a range of seeds in a worker process. Returns (plies played, lowest diverging seed and its ops, or
+    None)."""
+    reference, candidate, first_seed, last_seed, plies, check_every = task
+    total = 0
+    for seed in range(first_seed, last_seed):
+        played, ops = fuzz_seed(reference, candidate, seed, plies, check_every)
+        total += played
+        if ops is not None:
+            return total, (seed, ops)
+    return total, None
+
+
+def minimize(reference, candidate, ops):
+    """Returns a shorter list of ops that still makes the engines differ, removing chunks of ops while the
+    difference remains (delta debugging)."""
+    first = replay(reference, candidate, ops)
+    if first is None:
+        return ops
+    ops = ops[:first[0] + 1]
+    chunks = 2
+    while len(ops) > 1:
+        size = max(1, len(ops) // chunks)
+        removed = False
+        for start in range(0, len(ops), size):
+            trial = ops[:start] + ops[start + size:]
+            if trial and replay(reference, candidate, trial) is not None:
+                ops = trial
+                chunks = max(chunks - 1, 2)
+                removed = True
+                break
+        if not removed:
+            if size == 1:
+                break
+            chunks = min(chunks * 2, len(ops))
+    first = replay(reference, candidate, ops)
+    return ops[:first[0] + 1]
+
+
+def format_repro(reference, candidate, ops):
+    """Returns a Python snippet replaying ops on both engines."""
+    lines = ["reference = %s(%r, %r)" % (ENGINES[reference].__name__, PLAYER_A, PLAYER_B),
+             "candidate = %s(%r, %r)" % (ENGINES[candidate].__name__, PLAYER_A, PLAYER_B),
+             "for game in (reference, candidate):"]
+    for op in ops:
+        if op[0] == "reserve":
+            lines.append("    game.reserved_move(%r, %r)" % (op[1], op[2]))
+        else:
+            lines.append("    game.move_piece(%r, %r, %r, %r)" % op[1:])
+    return "\n".join(lines)
+
+
+def run_fuzz(candidate, reference="original", seeds=2000, plies=500, workers=None, first_seed=0,
+             check_every=CHECK_EVERY):
+    """Fuzzes seeds first_seed up to first_seed + seeds across workers processes (all cores by default, 1 to run in
+    this process). Returns dict of plies, seconds, plies per minute and, for the lowest diverging seed, its seed,
+    first diverging ply, reference and candidate results and minimized ops."""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    shard = max(1, seeds // (workers * 4))
+    tasks = [(reference, candidate, start, min(start + shard, first_seed + seeds), plies, check_every)
+             for start in range(first_seed, first_seed + seeds, shard)]
+    started = time.perf_counter()
+    if workers == 1:
+        results = [_fuzz_seeds(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(workers) as executor:
+            results = list(executor.map(_fuzz_seeds, tasks))
+    elapsed = time.perf_counter() - started
+
+    total = sum(played for played, failure in results)
+    failures = [failure for played, failure in results if failure is not None]
+    report = {"reference": reference, "candidate": candidate, "seeds": seeds, "plies": total, "seconds": elapsed,
+              "plies_per_minute": total * 60 / elapsed if elapsed > 0 else 0.0, "divergence": None}
+    if failures:
+        seed, ops = min(failures)
+        ply, expected, actual = replay(reference, candidate, ops)
+        report["divergence"] = {"seed": seed, "ply": ply, "op": ops[ply], "reference": expected, "candidate": actual,
+                                "repro": minimize(reference, candidate, ops)}
+    return report
+
+
+def check_batch(games=1000, seed=0, max_plies=400, reference="original"):
+    """Plays BatchSimulator games and replays every move on reference games, comparing boards, reserves and captures
+    after each step. Returns dict of plies, seconds and the first (game, ply, move) that differs, or None."""
+    from FocusBatch import BatchSimulator, NO_MOVE
+    from FocusMoves import SQUARES_6X6
+
+    simulator = BatchSimulator(games, seed, 0, max_plies)
+    boards = [ENGINES[reference](PLAYER_A, PLAYER_B) for game in range(games)]
+    names = (PLAYER_A[0], PLAYER_B[0])
+    plies = 0
+    started = time.perf_counter()
+    step = 0
+    while not simulator.is_done():
+        sides = simulator.get_side().copy()
+        starts, ends, numbers = simulator.step()
+        stacks = simulator.get_stacks()
+        reserve = simulator.get_reserve()
+        capture = simulator.get_capture()
+        for game in range(games):
+            start = int(starts[game])
+            if start == NO_MOVE:
+                continue
+            move = (None if start < 0 else SQUARES_6X6[start], SQUARES_6X6[int(ends[game])], int(numbers[game]))
+            player = names[sides[game]]
+            if move[0] is None:
+                boards[game].reserved_move(player, move[1])
+            else:
+                boards[game].move_piece(player, move[0], move[1], move[2])
+            plies += 1
+            compact = CompactFocusGame.from_game(boards[game])
+            if (list(compact.get_board()) != stacks[game].tolist()
+                    or [compact.get_reserve(0), compact.get_reserve(1)] != reserve[game].tolist()
+                    or [compact.get_capture(0), compact.get_capture(1)] != capture[game].tolist()):
+                return {"plies": plies, "seconds": time.perf_counter() - started,
+                        "divergence": {"game": game, "ply": step, "move": move}}
+        step += 1
+    return {"plies": plies, "seconds": time.perf_counter() - started, "divergence": None}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Differential fuzzing of Focus engines.")
+    parser.add_argument("candidate", nargs="?", default="compact", help="engine checked: " + ", ".join(ENGINES))
+    parser.add_argument("--reference", default="original", help="engine trusted to be right")
+    parser.add_argument("--seeds", type=int, default=2000)
+    parser.add_argument("--plies", type=int, default=500, help="operations per seed")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, help="processes, all cores by default")
+    parser.add_argument("--batch", type=int, help="check BatchSimulator with this many games instead")
+    arguments = parser.parse_args()
+
+    if arguments.batch:
+        report = check_batch(arguments.batch, arguments.first_seed, reference=arguments.reference)
+        print("batch: %d plies in %.1f s" % (report["plies"], report["seconds"]))
+        if report["divergence"] is not None:
+            print("diverged in game %(game)d at step %(ply)d on move %(move)r" % report["divergence"])
+            sys.exit(1)
+        return
+
+    report = run_fuzz(arguments.candidate, arguments.reference, arguments.seeds, arguments.plies, arguments.workers,
+                      arguments.first_seed)
+    print("%s vs %s: %d plies in %.1f s, %.0f plies/min" % (report["candidate"], report["reference"],
+                                                           report["plies"], report["seconds"],
+                                                           report["plies_per_minute"]))
+    divergence = report["divergence"]
+    if divergence is not None:
+        print("seed %d diverged at ply %d on %r" % (divergence["seed"], divergence["ply"], divergence["op"]))
+        print("  %s: %r" % (report["reference"], divergence["reference"]))
+        print("  %s: %r" % (report["candidate"], divergence["candidate"]))
+        print("minimized reproduction, %d ops:" % len(divergence["repro"]))
+        print(format_repro(report["reference"], report["candidate"], divergence["repro"]))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,24 +1,53 @@
 # Author: Timothy Jan
-# Last Modified: 06/17/2021
+# Last Modified: 10/17/2026
 # Description: Focus/Domination board game: two-player game where the objective is to capture opposing player's pieces.
 #              The first player to capture six of the opponent's pieces wins the game.
+#              This is the move engine for any FocusGeometry board: stacks move in all four directions and pieces over
+#              five high come off the bottom. FocusGame_original.py does not use it. It keeps its own 6x6 rules (moves
+#              only down or right, pieces over five high come off the top) and only reads GEOMETRY_6X6 for its bounds
+#              and move tables.
+
+from FocusGeometry import GEOMETRY_6X6, GEOMETRY_8X8
+
+MAX_STACK = 5  # pieces a stack keeps, the ones below are taken off the bottom
+WIN_CAPTURES = 6
+
+# owner of the piece on each square at the start, in square order: 0 for player A, 1 for player B, None for empty
+START_8X8 = (None, None, None, None,  # row 1 (4)
+             0, 0, 1, 1, 0, 0,  # row 2 (6)
+             None, 1, 1, 0, 0, 1, 1, None,  # row 3 (8)
+             None, 0, 0, 1, 1, 0, 0, None,  # row 4 (8)
+             None, 1, 1, 0, 0, 1, 1, None,  # row 5 (8)
+             None, 0, 0, 1, 1, 0, 0, None,  # row 6 (8)
+             1, 1, 0, 0, 1, 1,  # row 7 (6)
+             None, None, None, None)  # row 8 (4)
+START_6X6 = (0, 0, 1, 1, 0, 0,
+             1, 1, 0, 0, 1, 1,
+             0, 0, 1, 1, 0, 0,
+             1, 1, 0, 0, 1, 1,
+             0, 0, 1, 1, 0, 0,
+             1, 1, 0, 0, 1, 1)
+START_POSITIONS = {GEOMETRY_8X8.get_layout(): START_8X8, GEOMETRY_6X6.get_layout(): START_6X6}
 
 
 class Player:
     """Represents game players."""
 
+    __slots__ = ("_name", "_color", "_reserve", "_capture")
+
     def __init__(self, player):
-        self._player = {"name": player[0], "color": player[1]}
+        self._name = player[0]
+        self._color = player[1]
         self._reserve = []
         self._capture = []
 
     def get_player_name(self):
         """Returns player name."""
-        return self._player["name"]
+        return self._name
 
     def get_player_color(self):
         """Returns player color."""
-        return self._player["color"]
+        return self._color
 
     def add_reserve(self, piece):
         """Adds piece to player's reserve."""
@@ -36,27 +65,36 @@ class Player:
         """Returns number of pieces in player's capture."""
         return len(self._capture)
 
+    def remove_reserve(self):
+        """Removes a piece from player's reserve and returns it."""
+        return self._reserve.pop()
+
 
 class Piece:
-    """Represents game pieces."""
+    """Represents game pieces. Pieces never change, so a game shares one Piece per player."""
+
+    __slots__ = ("_name", "_color")
 
     def __init__(self, player):
-        self._piece = {"name": player[0], "color": player[1]}
+        self._name = player[0]
+        self._color = player[1]
 
     def get_player(self):
         """Returns piece's player name."""
-        return self._piece["name"]
+        return self._name
 
     def get_color(self):
         """Returns piece's player color."""
-        return self._piece["color"]
+        return self._color
 
 
 class Stack:
     """Represents stack of game pieces."""
 
-    def __init__(self, piece):
-        self._stack = [piece]
+    __slots__ = ("_stack",)
+
+    def __init__(self, piece=None):
+        self._stack = [] if piece is None else [piece]  # empty cells hold no pieces
 
     def get_stack(self):
         """Returns stack."""
@@ -78,6 +116,12 @@ class Stack:
         """Adds pieces to the top of the stack."""
         self._stack += pieces
 
+    def trim_bottom(self, num):
+        """Deletes a number of pieces off the bottom of the stack and returns them."""
+        pieces = self._stack[:num]
+        del self._stack[:num]
+        return pieces
+
     def get_len_stack(self):
         """Returns number of pieces in the stack."""
         return len(self._stack)
@@ -92,21 +136,161 @@ class Stack:
         """Returns name based on the piece on top of the stack."""
         if not self.get_stack():
             return ""
-        return self._stack[-1].get_name()
+        return self._stack[-1].get_player()
 
 
 class FocusGame:
-    """Represents the board game Focus/Domination"""
+    """Represents the board game Focus/Domination on a board geometry, the 8-row board by default"""
 
-    def __init__(self, player_a, player_b):
+    __slots__ = ("_player_a", "_player_b", "_geometry", "_board", "_current_turn", "_message")
+
+    def __init__(self, player_a, player_b, geometry=GEOMETRY_8X8, start=None):
         self._player_a = Player(player_a)
         self._player_b = Player(player_b)
-        self._board = [[Stack(None), Stack(None), Stack(None), Stack(None)],  # row 1 (4)
-                       [Stack(Piece(player_a)), Stack(Piece(player_a)), Stack(Piece(player_b)), Stack(Piece(player_b)), Stack(Piece(player_a)), Stack(Piece(player_a))],  # row 2 (6)
-                       [Stack(None), Stack(Piece(player_b)), Stack(Piece(player_b)), Stack(Piece(player_a)), Stack(Piece(player_a)), Stack(Piece(player_b)), Stack(Piece(player_b)), Stack(None)],  # row 3 (8)
-                       [Stack(None), Stack(Piece(player_a)), Stack(Piece(player_a)), Stack(Piece(player_b)), Stack(Piece(player_b)), Stack(Piece(player_a)), Stack(Piece(player_a)), Stack(None)],  # row 4 (8)
-                       [Stack(None), Stack(Piece(player_b)), Stack(Piece(player_b)), Stack(Piece(player_a)), Stack(Piece(player_a)), Stack(Piece(player_b)), Stack(Piece(player_b)), Stack(None)],  # row 5 (8)
-                       [Stack(None), Stack(Piece(player_a)), Stack(Piece(player_a)), Stack(Piece(player_b)), Stack(Piece(player_b)), Stack(Piece(player_a)), Stack(Piece(player_a)), Stack(None)],  # row 6 (8)
-                       [Stack(Piece(player_b)), Stack(Piece(player_b)), Stack(Piece(player_a)), Stack(Piece(player_a)), Stack(Piece(player_b)), Stack(Piece(player_b))],  # row 7 (6)
-                       [Stack(None), Stack(None), Stack(None), Stack(None)]  # row 8 (4)
-                       ]
+        self._geometry = geometry
+        if start is None:
+            if geometry.get_layout() not in START_POSITIONS:
+                raise ValueError("layout has no standard start position")
+            start = START_POSITIONS[geometry.get_layout()]
+        if len(start) != geometry.get_size():
+            raise ValueError("start position must have one entry per square")
+        # pieces never change, so every stack starts with one of two shared pieces
+        pieces = (Piece(player_a), Piece(player_b))
+        self._board = [Stack(None if owner is None else pieces[owner]) for owner in start]  # stack per square
+        self._current_turn = None  # whoever moves first goes first
+        self._message = None
+
+    def get_geometry(self):
+        """Returns the board geometry."""
+        return self._geometry
+
+    def get_player_a(self):
+        """Returns player A."""
+        return self._player_a
+
+    def get_player_b(self):
+        """Returns player B."""
+        return self._player_b
+
+    def get_current_turn(self):
+        """Returns the player to move, or None before the first move."""
+        return self._current_turn
+
+    def get_message(self):
+        """Returns the message of the last accepted move."""
+        return self._message
+
+    def get_stack_on_board(self, location):
+        """Returns stack at location, or None if location isn't on the board."""
+        square = self._geometry.get_square(location)
+        if square is None:
+            return None
+        return self._board[square]
+
+    def _find_player(self, player):
+        """Returns the Player with a name, or None if there is none."""
+        if player == self._player_a.get_player_name():
+            return self._player_a
+        if player == self._player_b.get_player_name():
+            return self._player_b
+        return None
+
+    def move_piece(self, player, start, end, number):
+        """Moves the top number pieces of player's stack at start number spaces in a straight line to end. Returns
+        "successfully moved", "<name> Wins" or False for an invalid move."""
+        mover = self._find_player(player)
+        # check the player exists and it's their turn
+        if mover is None or (self._current_turn is not None and mover is not self._current_turn):
+            return False
+
+        # check both locations are on the board and in line, number spaces apart
+        start_square = self._geometry.get_square(start)
+        end_square = self._geometry.get_square(end)
+        if start_square is None or end_square is None:
+            return False
+        offset = self._geometry.get_offsets()[start_square][end_square]
+        if offset is None or number < 1 or (offset != number and offset != -number):
+            return False
+
+        # check the player controls the stack and it holds enough pieces
+        stack = self._board[start_square]
+        if number > stack.get_len_stack() or stack.get_stack_name() != player:
+            return False
+
+        self._board[end_square].add_slice(stack.get_slice(number))
+        stack.del_slice(number)
+        return self._finish_move(mover, end_square)
+
+    def reserved_move(self, player, location):
+        """Places one of player's reserve pieces on top of the stack at location. Returns "successfully moved",
+        "<name> Wins", "No pieces in reserve" or False for an invalid move."""
+        mover = self._find_player(player)
+        if mover is None:
+            return False
+        if mover.get_len_reserve() < 1:
+            return "No pieces in reserve"
+        if self._current_turn is not None and mover is not self._current_turn:
+            return False
+        square = self._geometry.get_square(location)
+        if square is None:
+            return False
+
+        self._board[square].add_slice([mover.remove_reserve()])
+        return self._finish_move(mover, square)
+
+    def _finish_move(self, mover, square):
+        """Takes pieces over MAX_STACK off the bottom of the stack on square into the mover's reserve (their own
+        pieces) or capture (the opponent's), passes the turn and returns the move message."""
+        stack = self._board[square]
+        if stack.get_len_stack() > MAX_STACK:
+            for piece in stack.trim_bottom(stack.get_len_stack() - MAX_STACK):
+                if piece.get_player() == mover.get_player_name():
+                    mover.add_reserve(piece)
+                else:
+                    mover.add_capture(piece)
+
+        self._current_turn = self._player_b if mover is self._player_a else self._player_a
+        if mover.get_len_capture() >= WIN_CAPTURES:
+            self._message = mover.get_player_name() + " Wins"
+        else:
+            self._message = "successfully moved"
+        return self._message
+
+    def legal_moves(self, player):
+        """Yields every (start, end, number) move move_piece would accept from player, without changing the game.
+        Reserve placements are yielded as (None, location, 1)."""
+        mover = self._find_player(player)
+        if mover is None or (self._current_turn is not None and mover is not self._current_turn):
+            return
+
+        squares = self._geometry.get_squares()
+        for square, stack in enumerate(self._board):
+            if stack.get_stack_name() != player:
+                continue
+            for start, end, number in self._geometry.stack_moves(square, stack.get_len_stack()):
+                yield squares[start], squares[end], number
+
+        # reserve pieces can be placed on any space
+        if mover.get_len_reserve() > 0:
+            for location in squares:
+                yield None, location, 1
+
+    def show_pieces(self, location):
+        """Returns list of the colors of the pieces at location from bottom (left) to top (right), or None if location
+        isn't on the board."""
+        stack = self.get_stack_on_board(location)
+        if stack is None:
+            return None
+        return [piece.get_color() for piece in stack.get_stack()]
+
+    def show_reserve(self, player):
+        """Returns the number of pieces in a player's reserve."""
+        mover = self._find_player(player)
+        if mover is not None:
+            return mover.get_len_reserve()
+
+    def show_captured(self, player):
+        """Returns the number of pieces captured by a player."""
+        mover = self._find_player(player)
+        if mover is not None:
+            return mover.get_len_capture()
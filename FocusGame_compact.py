@@ -0,0 +1,532 @@
+# Author: Timothy Jan
+# Date: 10/17/2026
+# Description: Compact board engine for Focus/Domination. Plays by exactly the same rules as
+#              FocusGame_original.FocusGame, but every stack is packed into one integer of an array('H') instead of a
+#              list of Piece objects, so a live game costs a few hundred bytes and applying a move allocates nothing.
+#              It is a separate class next to FocusGame_original.FocusGame, not its backing store: FocusGame still keeps
+#              its Stack and Piece objects, and from_game / FocusGame.from_compact convert between the two.
+#
+#              Stack encoding: the highest set bit is a height marker, and the bits below it are piece owners (0 for
+#              player A, 1 for player B) with the top piece in bit 0. An empty stack is just the marker (1), a single
+#              player A piece is 0b10 and a single player B piece is 0b11. Moving the top n pieces is then a mask and
+#              two shifts, and the height is bit_length() - 1.
+
+import struct
+import sys
+from array import array
+
+from FocusHash import STACK_KEYS, RESERVE_KEYS, CAPTURE_KEYS, TURN_KEYS, turn_index, position_hash
+from FocusMoves import SQUARES_6X6, RAYS_6X6, ORIGINAL_DIRECTIONS
+
+ROWS = 6
+COLUMNS = 6
+EMPTY = 1  # stack with no pieces, only the height marker
+MAX_HEIGHT = 10  # a five piece move onto a five piece stack, before reserve_capture trims it
+
+# board index for [row][column], looked up the same way FocusGame_original indexes its tuple of tuples
+INDEX = tuple(tuple(row * COLUMNS + column for column in range(COLUMNS)) for row in range(ROWS))
+
+# starting position: rows alternate A A B B A A / B B A A B B
+START_BOARD = tuple((0b10, 0b10, 0b11, 0b11, 0b10, 0b10)[column] ^ (row % 2)
+                    for row in range(ROWS) for column in range(COLUMNS))
+
+
+# snapshot: turn counter, first player, current player (2 for None), reserve and capture counts of A and B, message
+# code, position hash and the board as 36 little endian u16
+_SNAPSHOT = struct.Struct("<HBBBBBBBQ72s")
+_NO_PLAYER = 2
+_MESSAGES = (None, False, "successfully moved")  # message codes 0-2, codes 3 and 4 are wins by player A and B
+_TEXT_PIECES = "ab"  # piece letters for player A and player B in the text form
+
+
+def stack_height(stack):
+    """Returns number of pieces in a packed stack."""
+    return stack.bit_length() - 1
+
+
+def stack_owners(stack):
+    """Returns list of piece owners (0 or 1) in a packed stack from bottom to top."""
+    return [(stack >> bit) & 1 for bit in range(stack.bit_length() - 2, -1, -1)]
+
+
+def unpack_snapshot(data, player_a, player_b):
+    """Returns (packed board array, [reserve A, reserve B], [capture A, capture B], turn counter, first player, current
+    turn, message, position hash) of a CompactFocusGame.to_bytes snapshot for (name, color) players A and B. Players
+    are 0 for A, 1 for B or None."""
+    (turn_counter, first_player, current_turn, reserve_a, reserve_b, capture_a, capture_b, message, position_hash,
+     packed_board) = _SNAPSHOT.unpack(data)
+    board = array("H", packed_board)
+    if sys.byteorder != "little":
+        board.byteswap()
+    return (board, [reserve_a, reserve_b], [capture_a, capture_b], turn_counter,
+            None if first_player == _NO_PLAYER else first_player,
+            None if current_turn == _NO_PLAYER else current_turn,
+            _MESSAGES[message] if message < 3 else (player_a, player_b)[message - 3][0] + " Wins", position_hash)
+
+
+def pack_stack(owners):
+    """Returns packed stack for a list of piece owners (0 or 1) from bottom to top."""
+    stack = EMPTY
+    for owner in owners:
+        stack = (stack << 1) | owner
+    return stack
+
+
+class CompactFocusGame:
+    """Represents the board game Focus/Domination on a packed integer board."""
+
+    __slots__ = ("_players", "_board", "_reserve", "_capture", "_turn_counter", "_first_player", "_current_turn",
+                 "_message", "_undo", "_hash")
+
+    def __init__(self, player_a, player_b):
+        self._players = (player_a, player_b)  # (name, color) tuples, index 0 is player A and index 1 is player B
+        self._board = array("H", START_BOARD)
+        self._reserve = [0, 0]
+        self._capture = [0, 0]
+        self._turn_counter = 1
+        self._first_player = None
+        self._current_turn = None
+        self._message = None
+        self._undo = []  # undo entries pushed by make_move
+        self._hash = self.compute_hash()
+
+    def get_player_name(self, index):
+        """Returns name of player A (0) or player B (1)."""
+        return self._players[index][0]
+
+    def get_player_color(self, index):
+        """Returns color of player A (0) or player B (1)."""
+        return self._players[index][1]
+
+    def get_player_index(self, player):
+        """Returns 0 for player A, 1 for player B or None if the player doesn't exist."""
+        if player == self._players[0][0]:
+            return 0
+        if player == self._players[1][0]:
+            return 1
+        return None
+
+    def get_current_turn(self):
+        """Returns index of the player whose turn it is, or None before the first move."""
+        return self._current_turn
+
+    def get_first_player(self):
+        """Returns index of the player who moved first, or None before the first move."""
+        return self._first_player
+
+    def get_turn_counter(self):
+        """Returns turn counter."""
+        return self._turn_counter
+
+    def get_message(self):
+        """Returns last move message."""
+        return self._message
+
+    def get_board(self):
+        """Returns packed board array."""
+        return self._board
+
+    def get_hash(self):
+        """Returns Zobrist hash of the position."""
+        return self._hash
+
+    def compute_hash(self):
+        """Returns Zobrist hash of the position computed from scratch."""
+        return position_hash(self._board, self._reserve, self._capture, self._turn_counter, self._current_turn)
+
+    def get_reserve(self, index):
+        """Returns number of pieces in the reserve of player A (0) or player B (1)."""
+        return self._reserve[index]
+
+    def get_capture(self, index):
+        """Returns number of pieces captured by player A (0) or player B (1)."""
+        return self._capture[index]
+
+    def copy(self):
+        """Returns an independent copy of the game without its undo entries."""
+        game = CompactFocusGame(self._players[0], self._players[1])
+        game._board = array("H", self._board)
+        game._reserve = self._reserve[:]
+        game._capture = self._capture[:]
+        game._turn_counter = self._turn_counter
+        game._first_player = self._first_player
+        game._current_turn = self._current_turn
+        game._message = self._message
+        game._hash = self._hash
+        return game
+
+    def to_bytes(self):
+        """Returns snapshot of the position, turn order and message as bytes. Player names and colors are not
+        included."""
+        if self._message is None or self._message is False or self._message == "successfully moved":
+            message = _MESSAGES.index(self._message)
+        else:
+            message = 3 if self._message == self._players[0][0] + " Wins" else 4
+        board = self._board
+        if sys.byteorder != "little":
+            board = array("H", board)
+            board.byteswap()
+        return _SNAPSHOT.pack(self._turn_counter, _NO_PLAYER if self._first_player is None else self._first_player,
+                              _NO_PLAYER if self._current_turn is None else self._current_turn, self._reserve[0],
+                              self._reserve[1], self._capture[0], self._capture[1], message, self._hash,
+                              board.tobytes())
+
+    @classmethod
+    def from_bytes(cls, data, player_a, player_b):
+        """Returns a CompactFocusGame restored from a to_bytes snapshot for (name, color) players A and B."""
+        (board, reserve, capture, turn_counter, first_player, current_turn, message,
+         position_hash) = unpack_snapshot(data, player_a, player_b)
+        game = cls.__new__(cls)
+        game._players = (player_a, player_b)
+        game._board = board
+        game._reserve = reserve
+        game._capture = capture
+        game._turn_counter = turn_counter
+        game._first_player = first_player
+        game._current_turn = current_turn
+        game._message = message
+        game._undo = []
+        game._hash = position_hash
+        return game
+
+    def to_text(self):
+        """Returns canonical text form of the position: rows of comma separated stacks from bottom to top ('a' for a
+        player A piece, 'b' for player B, '-' for empty) joined by '/', then the player to move, first player, turn
+        counter, reserves, captures and message code, e.g. "ab,-,b,.../... b a 4 0:1 2:0 m"."""
+        rows = []
+        for row in INDEX:
+            rows.append(",".join("".join(_TEXT_PIECES[owner] for owner in stack_owners(self._board[index])) or "-"
+                                 for index in row))
+        if self._message is None or self._message is False or self._message == "successfully moved":
+            message = "-fm"[_MESSAGES.index(self._message)]
+        else:
+            message = "w" + ("a" if self._message == self._players[0][0] + " Wins" else "b")
+        return " ".join(("/".join(rows), "-" if self._current_turn is None else _TEXT_PIECES[self._current_turn],
+                         "-" if self._first_player is None else _TEXT_PIECES[self._first_player],
+                         str(self._turn_counter), "%d:%d" % tuple(self._reserve), "%d:%d" % tuple(self._capture),
+                         message))
+
+    @classmethod
+    def from_text(cls, text, player_a, player_b):
+        """Returns a CompactFocusGame restored from to_text for (name, color) players A and B."""
+        board, current_turn, first_player, turn_counter, reserve, capture, message = text.split()
+        game = cls(player_a, player_b)
+        stacks = [stack for row in board.split("/") for stack in row.split(",")]
+        if len(stacks) != ROWS * COLUMNS:
+            raise ValueError("board must have %d stacks" % (ROWS * COLUMNS))
+        for index, stack in enumerate(stacks):
+            game._board[index] = pack_stack([] if stack == "-" else [_TEXT_PIECES.index(piece) for piece in stack])
+        game._current_turn = None if current_turn == "-" else _TEXT_PIECES.index(current_turn)
+        game._first_player = None if first_player == "-" else _TEXT_PIECES.index(first_player)
+        game._turn_counter = int(turn_counter)
+        game._reserve = [int(count) for count in reserve.split(":")]
+        game._capture = [int(count) for count in capture.split(":")]
+        if message.startswith("w"):
+            game._message = game._players[_TEXT_PIECES.index(message[1])][0] + " Wins"
+        else:
+            game._message = _MESSAGES["-fm".index(message)]
+        game._hash = game.compute_hash()
+        return game
+
+    @classmethod
+    def from_game(cls, game):
+        """Returns a CompactFocusGame in the same position as a FocusGame_original.FocusGame, or a copy of a
+        CompactFocusGame."""
+        if isinstance(game, CompactFocusGame):
+            return game.copy()
+        player_a = game.get_player_a()
+        player_b = game.get_player_b()
+        compact = cls((player_a.get_player_name(), player_a.get_player_color()),
+                      (player_b.get_player_name(), player_b.get_player_color()))
+        for row in range(ROWS):
+            for column in range(COLUMNS):
+                owners = [0 if piece.get_player() == player_a.get_player_name() else 1
+                          for piece in game.get_stack_on_board((row, column)).get_stack()]
+                compact._board[INDEX[row][column]] = pack_stack(owners)
+        compact._reserve = [player_a.get_len_reserve(), player_b.get_len_reserve()]
+        compact._capture = [player_a.get_len_capture(), player_b.get_len_capture()]
+        compact._turn_counter = game.get_turn_counter()
+        compact._message = game.get_message()
+        if game.get_first_player() is not None:
+            compact._first_player = 0 if game.get_first_player() is player_a else 1
+        if game.get_current_turn() is not None:
+            compact._current_turn = 0 if game.get_current_turn() is player_a else 1
+        compact._hash = compact.compute_hash()
+        return compact
+
+    def pre_move_check(self, player, start, end, number):
+        """Performs pre-move checks."""
+        # check if a player exists
+        if player != self._players[0][0] and player != self._players[1][0]:
+            self._message = False
+            return self._message
+
+        # check if it's the first turn
+        if self._turn_counter == 1:
+            self.setup_first_turn_players(player)
+
+        # check if it's the player's turn
+        if player != self._players[self._current_turn][0]:
+            self._message = False
+            return self._message
+
+        # check valid move locations
+        if start[0] < 0 or start[0] > 5 or start[1] < 0 or start[1] > 5 \
+                or end[0] < 0 or end[0] > 5 or end[1] < 0 or end[1] > 5:
+            self._message = False
+            return self._message
+
+        # check diagonal move, or starting and ending location are the same
+        if (end[0] - start[0] != 0 and end[1] - start[1] != 0) or (start[0] == end[0] and start[1] == end[1]):
+            self._message = False
+            return self._message
+
+        stack = self._board[INDEX[start[0]][start[1]]]
+
+        # enough pieces exist in the stack for the player to move
+        if number > stack.bit_length() - 1:
+            self._message = False
+            return self._message
+
+        # player is trying to move the wrong number of spaces (e.g. if moving 3 pieces, must move 3 spaces)
+        if end[0] - start[0] != number and end[1] - start[1] != number:
+            self._message = False
+            return self._message
+
+        # player is attempting to move a stack that doesn't belong to them
+        if stack == EMPTY:
+            # FocusGame_original raises IndexError reading the owner of an empty stack, so the same error is raised here
+            raise IndexError("no piece on top of the empty stack at %s" % (start,))
+        if stack & 1 != self._current_turn:
+            self._message = False
+            return self._message
+
+        self._message = "successfully moved"
+        return self._message
+
+    def assign_pieces(self, start, end, number):
+        """Moves pieces from one stack to another. The destination can be taller than five pieces until
+        reserve_capture trims it, so the position hash is brought up to date there."""
+        if number < 1:
+            return
+        start_index = INDEX[start[0]][start[1]]
+        end_index = INDEX[end[0]][end[1]]
+        stack = self._board[start_index]
+
+        # add pieces to destination, then remove them from start location
+        self._board[end_index] = (self._board[end_index] << number) | (stack & ((1 << number) - 1))
+        self._board[start_index] = stack >> number
+
+    def reserve_capture(self, location):
+        """Checks end space after a move to determine whether to capture or reserve any pieces."""
+        index = INDEX[location[0]][location[1]]
+        stack = self._board[index]
+        height = stack.bit_length() - 1
+        if height < 5:
+            self._hash = self.compute_hash()
+            return
+
+        # FocusGame_original credits the bottom piece once per excess piece and removes pieces from the top
+        excess = height - 5
+        if (stack >> (height - 1)) & 1 == self._current_turn:
+            self._reserve[self._current_turn] += excess
+        else:
+            self._capture[self._current_turn] += excess
+        self._board[index] = stack >> excess
+        # every stack is back to at most five pieces, so the hash keys cover the position again
+        self._hash = self.compute_hash()
+
+        # check win condition
+        if self._capture[self._current_turn] > 5:
+            self._message = self._players[self._current_turn][0] + " Wins"
+            return self._message
+        self._message = "successfully moved"
+        return
+
+    def apply_move(self, side, start, end, number):
+        """Moves number pieces between board indexes (start is -1 to place a reserve piece) for the current player A (0)
+        or player B (1), then reserves or captures pieces over five and updates the turn. Does in one pass what
+        assign_pieces, reserve_capture and update_turn do, updating the position hash incrementally."""
+        board = self._board
+        reserve = self._reserve
+        capture = self._capture
+        new_hash = self._hash ^ RESERVE_KEYS[side][reserve[side]] ^ CAPTURE_KEYS[side][capture[side]]
+        end_stack = board[end]
+        end_keys = STACK_KEYS[end]
+        new_hash ^= end_keys[end_stack]
+
+        if start < 0:
+            # reserve placement keeps the previous message, same as reserved_move
+            end_stack = (end_stack << 1) | side
+            reserve[side] -= 1
+        else:
+            self._message = "successfully moved"
+            if number > 0:
+                stack = board[start]
+                start_keys = STACK_KEYS[start]
+                board[start] = stack >> number
+                new_hash ^= start_keys[stack] ^ start_keys[stack >> number]
+                end_stack = (end_stack << number) | (stack & ((1 << number) - 1))
+
+        # FocusGame_original credits the bottom piece once per excess piece and removes pieces from the top
+        height = end_stack.bit_length() - 1
+        if height >= 5:
+            excess = height - 5
+            if (end_stack >> (height - 1)) & 1 == side:
+                reserve[side] += excess
+            else:
+                capture[side] += excess
+            end_stack >>= excess
+
+            # check win condition
+            if capture[side] > 5:
+                self._message = self._players[side][0] + " Wins"
+            else:
+                self._message = "successfully moved"
+
+        board[end] = end_stack
+        self._hash = (new_hash ^ end_keys[end_stack] ^ RESERVE_KEYS[side][reserve[side]]
+                      ^ CAPTURE_KEYS[side][capture[side]])
+        self.update_turn()
+        return self._message
+
+    def move_piece(self, player, start, end, number):
+        """Allows players to move game stacks."""
+        # pre move checks
+        self.pre_move_check(player, start, end, number)
+
+        # return invalid move message and exit
+        if self._message != "successfully moved":
+            return self._message
+
+        return self.apply_move(self._current_turn, INDEX[start[0]][start[1]], INDEX[end[0]][end[1]], number)
+
+    def reserved_move(self, player, location):
+        """Allows player to place a piece from their reserve on a given location."""
+        # check to see if the player has reserves
+        if player == self._players[0][0] and self._reserve[0] < 1:
+            return "No pieces in reserve"
+        if player == self._players[1][0] and self._reserve[1] < 1:
+            return "No pieces in reserve"
+
+        # check that it's the player's turn
+        if self._current_turn is None:
+            # FocusGame_original raises AttributeError reading the current player's name, so the same error is raised
+            raise AttributeError("no current player before the first move")
+        if player != self._players[self._current_turn][0]:
+            return False
+
+        # check to see if the player is putting the piece on the board
+        if location[0] < 0 or location[0] > 5 or location[1] < 0 or location[1] > 5:
+            self._message = False
+            return self._message
+
+        return self.apply_move(self._current_turn, -1, INDEX[location[0]][location[1]], 1)
+
+    def generate_moves(self, side):
+        """Yields (start, end, number) board indexes of every move for player A (0) or player B (1), without checking
+        whose turn it is. Reserve placements are yielded as (-1, index, 1)."""
+        board = self._board
+        for start in range(36):
+            stack = board[start]
+            if stack == EMPTY or stack & 1 != side:
+                continue
+            height = stack.bit_length() - 1
+            for direction in ORIGINAL_DIRECTIONS:
+                ray = RAYS_6X6[start][direction]
+                for number in range(1, min(height, len(ray)) + 1):
+                    yield start, ray[number - 1], number
+
+        # reserve pieces can be placed on any space
+        if self._reserve[side] > 0:
+            for end in range(36):
+                yield -1, end, 1
+
+    def legal_moves(self, player):
+        """Yields every (start, end, number) move of at least one piece that move_piece would accept from player,
+        without changing the game. Reserve placements are yielded as (None, location, 1). pre_move_check also accepts
+        moves of zero pieces, and of a negative number going up or left, which move nothing and only pass the turn;
+        those are not yielded."""
+        side = self.get_player_index(player)
+        if side is None:
+            return
+
+        # on the first turn either player may move, afterwards only the current player
+        if self._turn_counter != 1 and side != self._current_turn:
+            return
+        for start, end, number in self.generate_moves(side):
+            yield (SQUARES_6X6[start] if start >= 0 else None), SQUARES_6X6[end], number
+
+    def make_move(self, side, start, end, number):
+        """Makes a move from generate_moves for player A (0) or player B (1) without validating it, and records an undo
+        entry for unmake_move. Returns the move message."""
+        board = self._board
+        self._undo.append((start, board[start] if start >= 0 else EMPTY, end, board[end], self._reserve[side],
+                           self._capture[side], self._turn_counter, self._first_player, self._message, self._hash))
+        if self._turn_counter == 1:
+            self._first_player = side
+            self._current_turn = side
+        return self.apply_move(side, start, end, number)
+
+    def unmake_move(self):
+        """Takes back the last move made by make_move."""
+        (start, start_stack, end, end_stack, reserve, capture, turn_counter, first_player, message,
+         old_hash) = self._undo.pop()
+        side = self._current_turn ^ 1  # the player who made the move
+        if start >= 0:
+            self._board[start] = start_stack
+        self._board[end] = end_stack
+        self._reserve[side] = reserve
+        self._capture[side] = capture
+        self._turn_counter = turn_counter
+        self._first_player = first_player
+        self._current_turn = side if turn_counter != 1 else first_player
+        self._message = message
+        self._hash = old_hash
+
+    def setup_first_turn_players(self, player):
+        """Sets up game players."""
+        if player == self._players[0][0]:
+            self._first_player = 0
+        else:
+            self._first_player = 1
+        self._current_turn = self._first_player
+
+    def update_turn(self):
+        """Updates turn counter by incrementing turn counter and flipping current turn to the other player."""
+        self._hash ^= TURN_KEYS[turn_index(self._turn_counter, self._current_turn)]
+        self._turn_counter += 1
+        if self._turn_counter % 2 == 0:
+            self._current_turn = 1 - self._first_player
+        else:
+            self._current_turn = self._first_player
+        self._hash ^= TURN_KEYS[self._current_turn]
+
+    def show_pieces(self, location):
+        """Shows a list of the pieces that are present at a given location from bottom (left) to top (right)."""
+        stack = self._board[INDEX[location[0]][location[1]]]
+        colors = (self._players[0][1], self._players[1][1])
+        return [colors[(stack >> bit) & 1] for bit in range(stack.bit_length() - 2, -1, -1)]
+
+    def show_reserve(self, player):
+        """Returns the number of pieces in a player's reserve."""
+        if player == self._players[0][0]:
+            return self._reserve[0]
+        if player == self._players[1][0]:
+            return self._reserve[1]
+
+    def show_captured(self, player):
+        """Returns the number of pieces captured by a player."""
+        if player == self._players[0][0]:
+            return self._capture[0]
+        if player == self._players[1][0]:
+            return self._capture[1]
+
+    def print_board(self):
+        """Prints game board [top piece (stack) ownership][size of stack in space]."""
+        for row in INDEX:
+            print()
+            for index in row:
+                stack = self._board[index]
+                color = "" if stack == EMPTY else self._players[stack & 1][1]
+                print("[" + color, str(stack.bit_length() - 1) + "]", end=" ")
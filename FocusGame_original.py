@@ -2,23 +2,55 @@
 # Date: 11/26/2020
 # Description: Focus/Domination board game! Two-player game to move and capture your opponent's pieces. The first
 #              player to capture six of the opponent's pieces wins the game.
+#              Its move rules are its own and differ from the geometry engine in FocusGame.py: stacks only move down or
+#              right, and pieces over five high come off the top of the stack. CompactFocusGame, the snapshots and the
+#              fuzzer all check against these rules, so this engine only borrows GEOMETRY_6X6 for bounds and move
+#              tables.
+
+from array import array
+from collections import deque
+from itertools import repeat
+
+from FocusGame_compact import CompactFocusGame, INDEX, START_BOARD, stack_owners, unpack_snapshot
+from FocusGeometry import GEOMETRY_6X6
+from FocusHash import STACK_VALUES, STACK_KEYS, RESERVE_KEYS, CAPTURE_KEYS, TURN_KEYS, turn_index, position_hash
+from FocusMoves import ORIGINAL_DIRECTIONS, stack_moves
+
+# reasons validate_move gives for rejecting a move
+UNKNOWN_PLAYER = "unknown_player"
+NOT_YOUR_TURN = "not_your_turn"
+OFF_BOARD = "off_board"
+DIAGONAL = "diagonal"
+SAME_LOCATION = "same_location"
+INSUFFICIENT_STACK = "insufficient_stack"
+WRONG_DISTANCE = "wrong_distance"
+NOT_OWNER = "not_owner"
+NO_RESERVE = "no_reserve"
+
+MAX_PIECE_LISTS = 256  # player pairs whose pieces from_compact keeps
+_PIECE_LISTS = {}  # (player A, player B) -> (Piece per player, piece list of every packed stack of up to five pieces)
+_START_HASH = position_hash(START_BOARD, (0, 0), (0, 0), 1, None)
 
 
 class Player:
     """Represents game players."""
 
+    __slots__ = ("_name", "_color", "_reserve", "_reserve_head", "_capture")
+
     def __init__(self, player_tuple):
-        self._player = {"name": player_tuple[0], "color": player_tuple[1]}
+        self._name = player_tuple[0]
+        self._color = player_tuple[1]
         self._reserve = []
+        self._reserve_head = 0  # index of the bottommost piece, pieces below it were already drawn
         self._capture = []
 
     def get_player_name(self):
         """Returns player name."""
-        return self._player["name"]
+        return self._name
 
     def get_player_color(self):
         """Returns player color."""
-        return self._player["color"]
+        return self._color
 
     def add_reserve(self, piece):
         """Adds piece to player's reserve."""
@@ -28,13 +60,21 @@ class Player:
         """Adds piece to player's capture."""
         self._capture.append(piece)
 
+    def add_reserve_pieces(self, piece, number):
+        """Adds number copies of a piece to player's reserve."""
+        self._reserve.extend([piece] * number)
+
+    def add_capture_pieces(self, piece, number):
+        """Adds number copies of a piece to player's capture."""
+        self._capture.extend([piece] * number)
+
     def get_reserve(self):
         """Returns the bottommost piece in reserves."""
-        return self._reserve[0]
+        return self._reserve[self._reserve_head]
 
     def get_len_reserve(self):
         """Returns the number of pieces in the player's reserve."""
-        return len(self._reserve)
+        return len(self._reserve) - self._reserve_head
 
     def get_len_capture(self):
         """Returns the number of pieces in the player's capture."""
@@ -42,12 +82,35 @@ class Player:
 
     def del_one_reserve(self):
         """Deletes the bottommost piece from reserves."""
-        del self._reserve[0]
+        self._reserve[self._reserve_head] = None
+        self._reserve_head += 1
+        # drop drawn pieces once they make up half the list, so each draw costs O(1) amortized
+        if self._reserve_head * 2 >= len(self._reserve):
+            del self._reserve[:self._reserve_head]
+            self._reserve_head = 0
+
+    def return_reserve(self, piece):
+        """Puts a piece back at the bottom of reserves."""
+        if self._reserve_head > 0:
+            self._reserve_head -= 1
+            self._reserve[self._reserve_head] = piece
+        else:
+            self._reserve.insert(0, piece)
+
+    def trim_reserve(self, length):
+        """Deletes pieces added to reserves after it held length pieces."""
+        del self._reserve[self._reserve_head + length:]
+
+    def trim_capture(self, length):
+        """Deletes pieces added to capture after it held length pieces."""
+        del self._capture[length:]
 
 
 class Stack:
     """Represents stack of game pieces."""
 
+    __slots__ = ("_stack",)
+
     def __init__(self, piece):
         self._stack = [piece]  # initializes the stack to game setup's default piece
 
@@ -69,6 +132,10 @@ class Stack:
             return self._stack[0]
         return self._stack[index:]
 
+    def get_top_of_stack(self, number):
+        """Returns list of the top number pieces of the stack, bottom to top."""
+        return self._stack[len(self._stack) - number:]
+
     def get_stack_pieces(self):
         """Returns number of pieces in stack."""
         return len(self._stack)
@@ -83,55 +150,190 @@ class Stack:
         """Returns player name based on the piece on top of the stack."""
         return self._stack[-1].get_player()
 
+    def get_packed(self, player_b):
+        """Returns the stack packed as in CompactFocusGame, pieces of the player named player_b as 1."""
+        packed = 1
+        for piece in self._stack:
+            packed = (packed << 1) | (piece.get_player() == player_b)
+        return packed
+
     def add_to_stack(self, from_stack, number):
         """Copies a specified number of pieces from one stack to another."""
-        self._stack.extend(from_stack.get_stack()[len(from_stack.get_stack()) - number:])
+        self._stack.extend(from_stack.get_top_of_stack(number))
 
     def remove_from_stack(self, number):
-        """Removes pieces(s) from top of stack."""
-        for piece in range(number):
-            del self._stack[-1]
+        """Removes pieces(s) from top of stack. Raises IndexError if the stack has fewer than number pieces, leaving it
+        unchanged."""
+        if number > len(self._stack):
+            raise IndexError("can't remove %d pieces from a stack of %d" % (number, len(self._stack)))
+        if number > 0:
+            del self._stack[len(self._stack) - number:]
+
+    def move_to_stack(self, to_stack, number):
+        """Moves the top number pieces of this stack onto another stack, keeping their order. Raises IndexError if the
+        stack has fewer than number pieces, leaving both stacks unchanged."""
+        pieces = self.get_top_of_stack(number)
+        self.remove_from_stack(number)
+        to_stack.get_stack().extend(pieces)
 
     def transfer_stack(self, from_stack, number):
         """Transfers piece(s) from one stack to another."""
-        for piece in range(number):
-            self._stack.append(from_stack.get_bottom_stack_piece())
-            del self._stack[0]
+        if number > 0:
+            self._stack.extend([from_stack.get_bottom_stack_piece()] * number)
+            del self._stack[:number]
 
 
 class Piece:
-    """Represents game pieces."""
+    """Represents game pieces. Pieces never change, so a game shares one Piece per player."""
+
+    __slots__ = ("_name", "_color")
 
     def __init__(self, player_tuple):
-        self._piece = {"name": player_tuple[0], "color": player_tuple[1]}
+        self._name = player_tuple[0]
+        self._color = player_tuple[1]
 
     def get_player(self):
         """Returns piece's player."""
-        return self._piece["name"]
+        return self._name
 
     def get_color(self):
         """Returns piece's color."""
-        return self._piece["color"]
+        return self._color
+
+
+def _get_piece_lists(player_a, player_b):
+    """Returns (Piece of player A and player B, tuple of the piece list of every packed stack of up to five pieces) for
+    (name, color) players. Pieces never change, so games restored for the same players share them."""
+    entry = _PIECE_LISTS.get((player_a, player_b))
+    if entry is None:
+        if len(_PIECE_LISTS) >= MAX_PIECE_LISTS:
+            _PIECE_LISTS.clear()
+        pieces = (Piece(player_a), Piece(player_b))
+        entry = (pieces, tuple([pieces[owner] for owner in stack_owners(value)] for value in range(STACK_VALUES)))
+        _PIECE_LISTS[(player_a, player_b)] = entry
+    return entry
+
+
+class MoveFeed:
+    """Represents a subscriber that keeps a game's move events until they are read."""
+
+    __slots__ = ("_events",)
+
+    def __init__(self):
+        self._events = deque()
+
+    def __call__(self, event):
+        self._events.append(event)
+
+    def get_pending(self):
+        """Returns number of events not read yet."""
+        return len(self._events)
+
+    def drain(self):
+        """Yields the events not read yet, oldest first, including any published while draining."""
+        while self._events:
+            yield self._events.popleft()
 
 
 class FocusGame:
-    """Represents the board game Focus/Domination."""
+    """Represents the board game Focus/Domination. Alongside the stacks it keeps every stack packed as in
+    CompactFocusGame, so assign_pieces, reserve_capture, reserved_move and update_turn update the Zobrist hash of the
+    position with the same few XORs as CompactFocusGame.apply_move, and both engines hash a position alike."""
+
+    __slots__ = ("_player_a", "_player_b", "_board", "_turn_counter", "_first_player", "_second_player",
+                 "_current_turn", "_message", "_undo", "_subscribers", "_packed", "_hash")
 
     def __init__(self, player_a, player_b):
         self._player_a = Player(player_a)
         self._player_b = Player(player_b)
-        self._board = ((Stack(Piece(player_a)), Stack(Piece(player_a)), Stack(Piece(player_b)), Stack(Piece(player_b)), Stack(Piece(player_a)), Stack(Piece(player_a))),  # row 1
-                       (Stack(Piece(player_b)), Stack(Piece(player_b)), Stack(Piece(player_a)), Stack(Piece(player_a)), Stack(Piece(player_b)), Stack(Piece(player_b))),  # row 2
-                       (Stack(Piece(player_a)), Stack(Piece(player_a)), Stack(Piece(player_b)), Stack(Piece(player_b)), Stack(Piece(player_a)), Stack(Piece(player_a))),  # row 3
-                       (Stack(Piece(player_b)), Stack(Piece(player_b)), Stack(Piece(player_a)), Stack(Piece(player_a)), Stack(Piece(player_b)), Stack(Piece(player_b))),  # row 4
-                       (Stack(Piece(player_a)), Stack(Piece(player_a)), Stack(Piece(player_b)), Stack(Piece(player_b)), Stack(Piece(player_a)), Stack(Piece(player_a))),  # row 5
-                       (Stack(Piece(player_b)), Stack(Piece(player_b)), Stack(Piece(player_a)), Stack(Piece(player_a)), Stack(Piece(player_b)), Stack(Piece(player_b))),  # row 6
+        # pieces never change, so every stack starts with one of two shared pieces
+        piece_a = Piece(player_a)
+        piece_b = Piece(player_b)
+        self._board = ((Stack(piece_a), Stack(piece_a), Stack(piece_b), Stack(piece_b), Stack(piece_a), Stack(piece_a)),  # row 1
+                       (Stack(piece_b), Stack(piece_b), Stack(piece_a), Stack(piece_a), Stack(piece_b), Stack(piece_b)),  # row 2
+                       (Stack(piece_a), Stack(piece_a), Stack(piece_b), Stack(piece_b), Stack(piece_a), Stack(piece_a)),  # row 3
+                       (Stack(piece_b), Stack(piece_b), Stack(piece_a), Stack(piece_a), Stack(piece_b), Stack(piece_b)),  # row 4
+                       (Stack(piece_a), Stack(piece_a), Stack(piece_b), Stack(piece_b), Stack(piece_a), Stack(piece_a)),  # row 5
+                       (Stack(piece_b), Stack(piece_b), Stack(piece_a), Stack(piece_a), Stack(piece_b), Stack(piece_b)),  # row 6
                        )
         self._turn_counter = 1
         self._first_player = None
         self._second_player = None
         self._current_turn = None
         self._message = None
+        self._undo = []  # undo entries pushed by make_move
+        self._subscribers = None  # callbacks of move events, a list once anyone subscribes
+        self._packed = array("H", START_BOARD)  # packed stack per square, in INDEX order
+        self._hash = _START_HASH
+
+    @classmethod
+    def from_compact(cls, compact):
+        """Returns a FocusGame in the same position as a CompactFocusGame. Every stack, reserve and capture shares one
+        Piece per player."""
+        player_a = (compact.get_player_name(0), compact.get_player_color(0))
+        player_b = (compact.get_player_name(1), compact.get_player_color(1))
+        return cls._restore(player_a, player_b, array("H", compact.get_board()),
+                            (compact.get_reserve(0), compact.get_reserve(1)),
+                            (compact.get_capture(0), compact.get_capture(1)), compact.get_turn_counter(),
+                            compact.get_first_player(), compact.get_current_turn(), compact.get_message(),
+                            compact.get_hash())
+
+    @classmethod
+    def _restore(cls, player_a, player_b, board, reserve, capture, turn_counter, first_player, current_turn, message,
+                 position_hash):
+        """Returns a FocusGame for (name, color) players A and B with a packed board array the game keeps, reserve
+        and capture counts of A and B, and first player and current turn as 0 for A, 1 for B or None."""
+        pieces, piece_lists = _get_piece_lists(player_a, player_b)
+        game = cls.__new__(cls)
+
+        # every square gets its own copy of the piece list of its packed stack
+        stacks = list(map(Stack.__new__, repeat(Stack, len(board))))
+        for stack, value in zip(stacks, board):
+            if value < STACK_VALUES:
+                stack._stack = piece_lists[value].copy()
+            else:
+                stack._stack = [pieces[owner] for owner in stack_owners(value)]
+        game._board = tuple(zip(*[iter(stacks)] * len(INDEX[0])))
+
+        # reserves hold the player's own pieces and captures hold the opponent's
+        game._player_a = Player(player_a)
+        game._player_b = Player(player_b)
+        players = (game._player_a, game._player_b)
+        for side in (0, 1):
+            players[side].add_reserve_pieces(pieces[side], reserve[side])
+            players[side].add_capture_pieces(pieces[1 - side], capture[side])
+
+        game._turn_counter = turn_counter
+        game._first_player = None if first_player is None else players[first_player]
+        game._second_player = None if first_player is None else players[1 - first_player]
+        game._current_turn = None if current_turn is None else players[current_turn]
+        game._message = message
+        game._undo = []
+        game._subscribers = None
+        game._packed = board
+        game._hash = position_hash
+        return game
+
+    def to_bytes(self):
+        """Returns CompactFocusGame snapshot of the game as bytes."""
+        return CompactFocusGame.from_game(self).to_bytes()
+
+    @classmethod
+    def from_bytes(cls, data, player_a, player_b):
+        """Returns a FocusGame restored from a to_bytes snapshot for (name, color) players A and B, without building a
+        CompactFocusGame on the way. Most of the time goes to creating the 36 Stack objects and their piece lists, so
+        this takes about ten times as long as CompactFocusGame.from_bytes; callers that must restore within 10us
+        should hold CompactFocusGame snapshots and build a FocusGame when it is played."""
+        return cls._restore(player_a, player_b, *unpack_snapshot(data, player_a, player_b))
+
+    def to_text(self):
+        """Returns canonical CompactFocusGame text form of the game."""
+        return CompactFocusGame.from_game(self).to_text()
+
+    @classmethod
+    def from_text(cls, text, player_a, player_b):
+        """Returns a FocusGame restored from to_text for (name, color) players A and B."""
+        return cls.from_compact(CompactFocusGame.from_text(text, player_a, player_b))
 
     def pre_move_check(self, player, start, end, number):
         """Performs pre-move checks."""
@@ -150,16 +352,7 @@ class FocusGame:
             return self._message
 
         # check valid move locations
-        if start[0] < 0 or start[0] > 5:
-            self._message = False
-            return self._message
-        elif start[1] < 0 or start[1] > 5:
-            self._message = False
-            return self._message
-        elif end[0] < 0 or end[0] > 5:
-            self._message = False
-            return self._message
-        elif end[1] < 0 or end[1] > 5:
+        if not GEOMETRY_6X6.is_on_board(start) or not GEOMETRY_6X6.is_on_board(end):
             self._message = False
             return self._message
 
@@ -198,35 +391,119 @@ class FocusGame:
 
         return self._message
 
-    def assign_pieces(self, start, end, number):
-        """Moves pieces from one stack to another."""
-
-        # add pieces to destination
-        self._board[end[0]][end[1]].add_to_stack(self._board[start[0]][start[1]], number)
+    def validate_move(self, player, start, end, number):
+        """Returns None if the move would be accepted, or the reason code it would be rejected for, checked in the same
+        order as pre_move_check. A start of None checks a reserve placement on end, like make_move. Never changes the
+        game."""
+        reserve, their_turn = self._validation_context(player)
+        if reserve is None:
+            return UNKNOWN_PLAYER
+        return self._move_reason(player, reserve, their_turn, start, end, number)
+
+    def validate_moves(self, player, moves):
+        """Returns list of validate_move results for (start, end, number) moves of player in the current position."""
+        reserve, their_turn = self._validation_context(player)
+        if reserve is None:
+            return [UNKNOWN_PLAYER] * len(moves)
+        return [self._move_reason(player, reserve, their_turn, start, end, number) for start, end, number in moves]
+
+    def _validation_context(self, player):
+        """Returns (reserve count, whether player may move a stack now) of player, or (None, False) if player isn't in
+        the game. On the first turn either player may move a stack, afterwards only the current player."""
+        if player == self._player_a.get_player_name():
+            reserve = self._player_a.get_len_reserve()
+        elif player == self._player_b.get_player_name():
+            reserve = self._player_b.get_len_reserve()
+        else:
+            return None, False
+        return reserve, self._turn_counter == 1 or player == self._current_turn.get_player_name()
+
+    def _move_reason(self, player, reserve, their_turn, start, end, number):
+        """Returns None or the reason code for one move of a known player, using the board square and offset tables
+        instead of coordinate comparisons."""
+        end_square = GEOMETRY_6X6.get_square(end)
+
+        # reserve placements are checked in reserved_move's order, and need a current player
+        if start is None:
+            if reserve < 1:
+                return NO_RESERVE
+            if self._turn_counter == 1 or not their_turn:
+                return NOT_YOUR_TURN
+            if end_square is None:
+                return OFF_BOARD
+            return None
+
+        if not their_turn:
+            return NOT_YOUR_TURN
+        start_square = GEOMETRY_6X6.get_square(start)
+        if start_square is None or end_square is None:
+            return OFF_BOARD
+        offset = GEOMETRY_6X6.get_offsets()[start_square][end_square]
+        if offset is None:
+            return DIAGONAL
+        if offset == 0:
+            return SAME_LOCATION
+        stack = self._board[start[0]][start[1]]
+        height = stack.get_stack_pieces()
+        if number > height:
+            return INSUFFICIENT_STACK
+        # the number of pieces must match the signed distance, a move of no pieces goes nowhere
+        if number != offset and number != 0:
+            return WRONG_DISTANCE
+        if height == 0 or stack.get_stack_ownership() != player:
+            return NOT_OWNER
+        return None
 
-        # remove pieces from start location
-        self._board[start[0]][start[1]].remove_from_stack(number)
+    def assign_pieces(self, start, end, number):
+        """Moves pieces from one stack to another. The destination can be taller than five pieces until
+        reserve_capture trims it, so its hash key is added back there."""
+        start_index = INDEX[start[0]][start[1]]
+        end_index = INDEX[end[0]][end[1]]
+        packed = self._packed
+        stack = packed[start_index]
+        end_stack = packed[end_index]
+        self._hash ^= STACK_KEYS[end_index][end_stack]
+        # a move of no pieces, or of a negative number, moves nothing
+        if number > 0:
+            packed[start_index] = stack >> number
+            packed[end_index] = (end_stack << number) | (stack & ((1 << number) - 1))
+            self._hash ^= STACK_KEYS[start_index][stack] ^ STACK_KEYS[start_index][stack >> number]
+
+        # move pieces from start location to destination
+        self._board[start[0]][start[1]].move_to_stack(self._board[end[0]][end[1]], number)
 
         return
 
     def reserve_capture(self, location):
-        """Checks end space after a move to determine whether to capture or reserve any pieces."""
+        """Checks end space after a move to determine whether to capture or reserve any pieces, then adds the hash key
+        of the stack left there."""
+        index = INDEX[location[0]][location[1]]
         if self._board[location[0]][location[1]].get_stack_pieces() < 5:
+            self._hash ^= STACK_KEYS[index][self._packed[index]]
             return
         else:
-            for piece in range(self._board[location[0]][location[1]].get_stack_pieces() - 5):
-                # if the piece belongs to the current player
-                if self._current_turn.get_player_name() == self._board[location[0]][location[1]].get_bottom_stack_piece().get_player():
-                    # add to player reserve
-                    self._current_turn.add_reserve(self._board[location[0]][location[1]].get_bottom_stack_piece())
-                    # remove from stack
-                    self._board[location[0]][location[1]].remove_from_stack(1)
-                # otherwise, the piece belongs to the other player
-                else:
-                    # add to player capture
-                    self._current_turn.add_capture(self._board[location[0]][location[1]].get_bottom_stack_piece())
-                    # remove from stack
-                    self._board[location[0]][location[1]].remove_from_stack(1)
+            stack = self._board[location[0]][location[1]]
+            excess = stack.get_stack_pieces() - 5
+            side = 0 if self._current_turn is self._player_a else 1
+            reserve = self._current_turn.get_len_reserve()
+            capture = self._current_turn.get_len_capture()
+            # every excess piece is credited as the bottom piece, which removing pieces from the top never changes
+            bottom = stack.get_bottom_stack_piece()
+            # if the piece belongs to the current player
+            if self._current_turn.get_player_name() == bottom.get_player():
+                # add to player reserve
+                self._current_turn.add_reserve_pieces(bottom, excess)
+            # otherwise, the piece belongs to the other player
+            else:
+                # add to player capture
+                self._current_turn.add_capture_pieces(bottom, excess)
+            # remove from stack
+            stack.remove_from_stack(excess)
+            packed = self._packed[index] >> excess
+            self._packed[index] = packed
+            self._hash ^= (STACK_KEYS[index][packed]
+                           ^ RESERVE_KEYS[side][reserve] ^ RESERVE_KEYS[side][self._current_turn.get_len_reserve()]
+                           ^ CAPTURE_KEYS[side][capture] ^ CAPTURE_KEYS[side][self._current_turn.get_len_capture()])
             # check win condition
             if self._current_turn.get_len_capture() > 5:
                 self._message = self._current_turn.get_player_name() + " Wins"
@@ -243,6 +520,7 @@ class FocusGame:
         # return invalid move message and exit
         if self._message != "successfully moved":
             return self._message
+        counts = self._event_counts() if self._subscribers else None
 
         # move pieces
         self.assign_pieces(start, end, number)
@@ -253,6 +531,9 @@ class FocusGame:
         # update turn
         self.update_turn()
 
+        if counts is not None:
+            self.publish_move("move", player, start, end, number, counts)
+
         # return final message
         return self._message
 
@@ -271,13 +552,19 @@ class FocusGame:
             return False
 
         # check to see if the player is putting the piece on the board
-        if location[0] < 0 or location[0] > 5:
-            self._message = False
-            return self._message
-        if location[1] < 0 or location[1] > 5:
+        if not GEOMETRY_6X6.is_on_board(location):
             self._message = False
             return self._message
 
+        counts = self._event_counts() if self._subscribers else None
+        index = INDEX[location[0]][location[1]]
+        side = 0 if self._current_turn is self._player_a else 1
+        reserve = self._current_turn.get_len_reserve()
+        end_stack = self._packed[index]
+        self._packed[index] = (end_stack << 1) | side
+        # reserve_capture adds the key of the stack left there
+        self._hash ^= STACK_KEYS[index][end_stack] ^ RESERVE_KEYS[side][reserve] ^ RESERVE_KEYS[side][reserve - 1]
+
         # add the piece to that space on TOP
         self._board[location[0]][location[1]].get_stack().append(self._current_turn.get_reserve())
 
@@ -290,9 +577,170 @@ class FocusGame:
         # update turn
         self.update_turn()
 
+        if counts is not None:
+            self.publish_move("move", player, None, location, 1, counts)
+
         # return final message
         return self._message
 
+    def legal_moves(self, player):
+        """Yields every (start, end, number) move of at least one piece that move_piece would accept from player,
+        without changing the game. Reserve placements are yielded as (None, location, 1). pre_move_check also accepts
+        moves of zero pieces, and of a negative number going up or left, which move nothing and only pass the turn;
+        those are not yielded."""
+        # check if a player exists
+        if player != self._player_a.get_player_name() and player != self._player_b.get_player_name():
+            return
+
+        # on the first turn either player may move, afterwards only the current player
+        if self._turn_counter != 1 and player != self._current_turn.get_player_name():
+            return
+
+        location_rays = GEOMETRY_6X6.get_location_rays()
+        for square, location in enumerate(GEOMETRY_6X6.get_squares()):
+            stack = self._board[location[0]][location[1]]
+            if stack.get_stack_pieces() == 0 or stack.get_stack_ownership() != player:
+                continue
+            yield from stack_moves(location, location_rays[square], stack.get_stack_pieces(), ORIGINAL_DIRECTIONS)
+
+        # reserve pieces can be placed on any space
+        if self._turn_counter != 1 and self._current_turn.get_len_reserve() > 0:
+            for location in GEOMETRY_6X6.get_squares():
+                yield None, location, 1
+
+    def make_move(self, player, start, end, number):
+        """Makes a move like move_piece, or like reserved_move when start is None, and records an undo entry for
+        unmake_move. Returns the move message."""
+        # remember the destination height and the moved slice, the only board state a move can change
+        end_length = None
+        moved = None
+        if GEOMETRY_6X6.is_on_board(end):
+            end_length = self.get_stack_on_board(end).get_stack_pieces()
+            if start is not None and GEOMETRY_6X6.is_on_board(start):
+                moved = self.get_stack_on_board(start).get_top_of_stack(number)
+
+        players = []
+        for each_player in (self._player_a, self._player_b):
+            front = each_player.get_reserve() if each_player.get_len_reserve() > 0 else None
+            players.append((each_player.get_len_reserve(), each_player.get_len_capture(), front))
+        turn = (self._turn_counter, self._first_player, self._second_player, self._current_turn, self._message,
+                self._hash)
+
+        if start is None:
+            message = self.reserved_move(player, end)
+        else:
+            message = self.move_piece(player, start, end, number)
+        self._undo.append((player, start, end, end_length, moved, players, turn))
+        return message
+
+    def unmake_move(self):
+        """Takes back the last move made by make_move."""
+        player, start, end, end_length, moved, players, turn = self._undo.pop()
+        applied = self._turn_counter != turn[0]
+        counts = self._event_counts() if applied and self._subscribers else None
+
+        if applied:
+            player_b = self._player_b.get_player_name()
+            end_stack = self.get_stack_on_board(end)
+            end_stack.remove_from_stack(end_stack.get_stack_pieces() - end_length)
+            self._packed[INDEX[end[0]][end[1]]] = end_stack.get_packed(player_b)
+            if start is not None:
+                self.get_stack_on_board(start).get_stack().extend(moved)
+                self._packed[INDEX[start[0]][start[1]]] = self.get_stack_on_board(start).get_packed(player_b)
+
+        for each_player, (reserve_length, capture_length, front) in zip((self._player_a, self._player_b), players):
+            if applied and start is None and each_player.get_player_name() == player:
+                # the placed piece came off the bottom of reserves
+                each_player.trim_reserve(reserve_length - 1)
+                each_player.return_reserve(front)
+            else:
+                each_player.trim_reserve(reserve_length)
+            each_player.trim_capture(capture_length)
+
+        (self._turn_counter, self._first_player, self._second_player, self._current_turn, self._message,
+         self._hash) = turn
+
+        if counts is not None:
+            self.publish_move("undo", player, start, end, None if start is None else len(moved), counts)
+
+    def subscribe(self, callback):
+        """Calls callback with the event dict of every move from now on and returns it. Events are published once per
+        move, so one callback can fan an event out to many readers."""
+        if self._subscribers is None:
+            self._subscribers = []
+        self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        """Stops calling a subscribed callback."""
+        self._subscribers.remove(callback)
+
+    def feed(self):
+        """Returns a MoveFeed subscribed to the game, whose drain generator yields the events of moves made since."""
+        return self.subscribe(MoveFeed())
+
+    def _event_counts(self):
+        """Returns reserve and capture counts of both players, taken before a move to compute its deltas."""
+        return (self._player_a.get_len_reserve(), self._player_a.get_len_capture(),
+                self._player_b.get_len_reserve(), self._player_b.get_len_capture())
+
+    def publish_move(self, kind, player, start, end, number, counts):
+        """Calls every subscriber with the event of a move ("move") or a taken back move ("undo"). The event holds the
+        turn counter and player to move after it, the move (start is None for a reserve placement), the changed cells
+        as [row, column, colors from bottom to top], the nonzero reserve and capture changes by player name, and the
+        move message."""
+        cells = [[end[0], end[1], self.show_pieces(end)]]
+        if start is not None and start != end:
+            cells.insert(0, [start[0], start[1], self.show_pieces(start)])
+        reserve = {}
+        captured = {}
+        for each_player, old_reserve, old_capture in ((self._player_a, counts[0], counts[1]),
+                                                      (self._player_b, counts[2], counts[3])):
+            if each_player.get_len_reserve() != old_reserve:
+                reserve[each_player.get_player_name()] = each_player.get_len_reserve() - old_reserve
+            if each_player.get_len_capture() != old_capture:
+                captured[each_player.get_player_name()] = each_player.get_len_capture() - old_capture
+        event = {"event": kind, "turn": self._turn_counter, "player": player,
+                 "move": [None if start is None else list(start), list(end), number], "cells": cells,
+                 "reserve": reserve, "captured": captured,
+                 "next": None if self._current_turn is None else self._current_turn.get_player_name(),
+                 "message": self._message}
+        for callback in list(self._subscribers):
+            callback(event)
+
+    def get_player_a(self):
+        """Returns player A."""
+        return self._player_a
+
+    def get_player_b(self):
+        """Returns player B."""
+        return self._player_b
+
+    def get_current_turn(self):
+        """Returns player whose turn it is, or None before the first move."""
+        return self._current_turn
+
+    def get_turn_counter(self):
+        """Returns turn counter."""
+        return self._turn_counter
+
+    def get_message(self):
+        """Returns last move message."""
+        return self._message
+
+    def get_hash(self):
+        """Returns Zobrist hash of the position."""
+        return self._hash
+
+    def compute_hash(self):
+        """Returns Zobrist hash of the position computed from scratch."""
+        player_b = self._player_b.get_player_name()
+        board = [stack.get_packed(player_b) for row in self._board for stack in row]
+        reserve = (self._player_a.get_len_reserve(), self._player_b.get_len_reserve())
+        capture = (self._player_a.get_len_capture(), self._player_b.get_len_capture())
+        side = None if self._current_turn is None else 0 if self._current_turn is self._player_a else 1
+        return position_hash(board, reserve, capture, self._turn_counter, side)
+
     def get_first_player(self):
         """Returns first player."""
         return self._first_player
@@ -322,13 +770,13 @@ class FocusGame:
 
     def update_turn(self):
         """Updates turn counter by incrementing turn counter and flipping current turn to the other player's name."""
+        self._hash ^= TURN_KEYS[turn_index(self._turn_counter, 0 if self._current_turn is self._player_a else 1)]
         self._turn_counter += 1
         if self._turn_counter % 2 == 0:
             self._current_turn = self.get_second_player()
-            return
         else:
             self._current_turn = self.get_first_player()
-            return
+        self._hash ^= TURN_KEYS[0 if self._current_turn is self._player_a else 1]
 
     def show_pieces(self, location):
         """Shows a list of the pieces that are present at a given location from bottom (left) to top (right)."""
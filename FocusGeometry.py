@@ -0,0 +1,129 @@
+# Author: Timothy Jan
+# Date: 10/17/2026
+# Description: Board geometry for Focus/Domination layouts. A BoardGeometry is built once per layout and holds the
+#              valid-cell mask, the location <-> square number maps, and the neighbor, ray and offset tables that move
+#              engines use instead of bounds arithmetic. Locations are (row, index in row) tuples, as in FocusGame.py,
+#              and squares number the cells in row order from 0.
+
+from FocusMoves import LAYOUT_6X6, LAYOUT_8X8, ALL_DIRECTIONS, build_squares, build_square_numbers, \
+    build_ray_table, build_location_rays, build_offset_table, STEPS
+
+# ((row factor, column factor), swap axes) for the eight rotations and reflections of a square, identity first
+_TRANSFORMS = tuple(((row_sign, column_sign), swap) for swap in (False, True)
+                    for row_sign in (1, -1) for column_sign in (1, -1))
+
+
+class BoardGeometry:
+    """Represents the cells of a board layout and the move tables precomputed for it."""
+
+    __slots__ = ("_layout", "_squares", "_numbers", "_mask", "_neighbors", "_rays", "_location_rays", "_offsets")
+
+    def __init__(self, layout):
+        self._layout = tuple((first, length) for first, length in layout)  # (first column, cells) per row
+        self._squares = build_squares(self._layout)
+        self._numbers = build_square_numbers(self._layout)
+        width = max(first + length for first, length in self._layout)
+        self._mask = tuple(tuple(first <= column < first + length for column in range(width))
+                           for first, length in self._layout)
+        self._rays = build_ray_table(self._layout)
+        self._location_rays = build_location_rays(self._layout)
+        self._neighbors = tuple(tuple(ray[0] if ray else None for ray in directions) for directions in self._rays)
+        self._offsets = build_offset_table(self._layout)
+
+    def get_layout(self):
+        """Returns tuple of (first column, number of cells) per row."""
+        return self._layout
+
+    def get_size(self):
+        """Returns number of cells on the board."""
+        return len(self._squares)
+
+    def get_squares(self):
+        """Returns tuple of the location of every square, in square order."""
+        return self._squares
+
+    def get_mask(self):
+        """Returns valid-cell mask: mask[row][column] is True where the bounding grid has a cell, in grid columns."""
+        return self._mask
+
+    def get_square(self, location):
+        """Returns square number of a location, or None if it isn't on the board."""
+        return self._numbers.get(tuple(location))
+
+    def get_location(self, square):
+        """Returns location of a square number."""
+        return self._squares[square]
+
+    def is_on_board(self, location):
+        """Returns True if location is a cell of the board."""
+        return tuple(location) in self._numbers
+
+    def get_neighbors(self):
+        """Returns neighbor table: neighbors[square][direction] is the adjacent square number, or None at an edge."""
+        return self._neighbors
+
+    def get_rays(self):
+        """Returns ray table: rays[square][direction] is a tuple of square numbers ordered by distance."""
+        return self._rays
+
+    def get_location_rays(self):
+        """Returns ray table holding locations instead of square numbers."""
+        return self._location_rays
+
+    def get_offsets(self):
+        """Returns offset table: offsets[start][end] is the signed distance from start to end along their shared row
+        or column, 0 for the same square and None if they aren't in line."""
+        return self._offsets
+
+    def get_symmetries(self, directions=ALL_DIRECTIONS):
+        """Returns tuple of square permutations, identity first, for the rotations and reflections that map the board
+        onto itself and the move directions onto themselves: symmetry[square] is the square it maps to."""
+        height = len(self._layout)
+        width = len(self._mask[0])
+        steps = set(STEPS[direction] for direction in directions)
+        cells = {}  # (row, grid column) -> square number
+        for square, (row, index) in enumerate(self._squares):
+            cells[(row, self._layout[row][0] + index)] = square
+
+        symmetries = []
+        for (row_sign, column_sign), swap in _TRANSFORMS:
+            def transform(row, column):
+                row, column = row_sign * row, column_sign * column
+                return (column, row) if swap else (row, column)
+
+            if set(transform(*step) for step in steps) != steps:
+                continue
+            # transform doubled coordinates around the board center, so the center needs no half steps
+            symmetry = []
+            for row, column in cells:
+                new_row, new_column = transform(2 * row - height + 1, 2 * column - width + 1)
+                symmetry.append(cells.get(((new_row + height - 1) // 2, (new_column + width - 1) // 2)))
+            if None not in symmetry:
+                symmetries.append(tuple(symmetry))
+        return tuple(symmetries)
+
+    def stack_moves(self, square, height, directions=ALL_DIRECTIONS):
+        """Yields (start, end, number) square moves of a stack of a given height on square, moving number pieces
+        number spaces."""
+        rays = self._rays[square]
+        for direction in directions:
+            ray = rays[direction]
+            for number in range(1, min(height, len(ray)) + 1):
+                yield square, ray[number - 1], number
+
+
+_GEOMETRIES = {}  # layout -> BoardGeometry
+
+
+def get_geometry(layout):
+    """Returns the BoardGeometry of a layout, building it the first time the layout is seen."""
+    layout = tuple((first, length) for first, length in layout)
+    geometry = _GEOMETRIES.get(layout)
+    if geometry is None:
+        geometry = BoardGeometry(layout)
+        _GEOMETRIES[layout] = geometry
+    return geometry
+
+
+GEOMETRY_6X6 = get_geometry(LAYOUT_6X6)
+GEOMETRY_8X8 = get_geometry(LAYOUT_8X8)
@@ -0,0 +1,102 @@
+# Author: Timothy Jan
+# Date: 10/17/2026
+# Description: Zobrist hashing and a bounded transposition table for Focus/Domination positions. A position hash is the
+#              XOR of one 64-bit key per (square, packed stack), one per reserve and capture count of each player and
+#              one for the side to move, so CompactFocusGame and FocusGame_original.FocusGame, which keeps its stacks
+#              packed alongside its Stack objects for this, can update it with a handful of XORs per move.
+
+import random
+
+STACK_VALUES = 64  # packed stacks of up to five pieces, the most a stack holds between moves
+MAX_SQUARES = 64
+MAX_COUNT = 73  # reserve + capture + pieces on the board never exceed the 36 starting pieces, with room to spare
+
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+_random = random.Random(20201126)  # fixed seed so hashes match between processes and runs
+
+
+def _keys(count):
+    """Returns list of random 64-bit keys."""
+    return [_random.getrandbits(64) for key in range(count)]
+
+
+# STACK_KEYS[square][packed stack], an empty square hashes to 0
+STACK_KEYS = [[0, 0] + _keys(STACK_VALUES - 2) for square in range(MAX_SQUARES)]
+# RESERVE_KEYS[player][count] and CAPTURE_KEYS[player][count]
+RESERVE_KEYS = [[0] + _keys(MAX_COUNT - 1), [0] + _keys(MAX_COUNT - 1)]
+CAPTURE_KEYS = [[0] + _keys(MAX_COUNT - 1), [0] + _keys(MAX_COUNT - 1)]
+# TURN_KEYS[player to move], index 2 is the first turn when either player may move
+TURN_KEYS = [0] + _keys(2)
+
+
+def turn_index(turn_counter, current_turn):
+    """Returns TURN_KEYS index for a turn counter and current player."""
+    if turn_counter == 1:
+        return 2
+    return current_turn
+
+
+def position_hash(board, reserve, capture, turn_counter, current_turn):
+    """Returns Zobrist hash of a packed board, reserve and capture counts and side to move."""
+    result = TURN_KEYS[turn_index(turn_counter, current_turn)]
+    for square, stack in enumerate(board):
+        result ^= STACK_KEYS[square][stack]
+    for player in (0, 1):
+        result ^= RESERVE_KEYS[player][reserve[player]] ^ CAPTURE_KEYS[player][capture[player]]
+    return result
+
+
+class TranspositionTable:
+    """Represents a fixed size hash table of search results. An entry is replaced by a search at least as deep, or by
+    any search once the entry is left over from an earlier move."""
+
+    def __init__(self, size_bits=16):
+        self._size = 1 << size_bits
+        self._mask = self._size - 1
+        self._keys = [None] * self._size
+        self._entries = [None] * self._size  # (depth, score, flag, move, generation)
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+
+    def get_size(self):
+        """Returns number of slots."""
+        return self._size
+
+    def get_hits(self):
+        """Returns number of successful probes."""
+        return self._hits
+
+    def get_misses(self):
+        """Returns number of failed probes."""
+        return self._misses
+
+    def new_search(self):
+        """Marks every stored entry as left over from an earlier search."""
+        self._generation += 1
+
+    def clear(self):
+        """Deletes every entry."""
+        self._keys = [None] * self._size
+        self._entries = [None] * self._size
+
+    def probe(self, key):
+        """Returns (depth, score, flag, move) stored for a position hash, or None."""
+        slot = key & self._mask
+        if self._keys[slot] != key:
+            self._misses += 1
+            return None
+        self._hits += 1
+        return self._entries[slot][:4]
+
+    def store(self, key, depth, score, flag, move):
+        """Stores a search result for a position hash, unless it would replace a deeper result of this search."""
+        slot = key & self._mask
+        entry = self._entries[slot]
+        if entry is not None and self._keys[slot] != key and entry[0] > depth and entry[4] == self._generation:
+            return
+        self._keys[slot] = key
+        self._entries[slot] = (depth, score, flag, move, self._generation)
@@ -0,0 +1,148 @@
+# Author: Timothy Jan
+# Date: 10/17/2026
+# Description: Load generator for FocusServer. Plays many concurrent random games over a few pipelined connections and
+#              reports p50/p99 request latency and accepted moves per second. Each game keeps a CompactFocusGame copy
+#              to pick legal moves and to check that the server's answers match the rules.
+#              Usage: python FocusLoadTest.py [games] [connections] [host] [port]
+
+import asyncio
+import json
+import random
+import sys
+import time
+
+from FocusGame_compact import CompactFocusGame
+from FocusMoves import SQUARES_6X6
+from FocusServer import DEFAULT_HOST, DEFAULT_PORT
+
+
+def percentile(values, fraction):
+    """Returns the value at fraction (0 to 1) of a sorted list, or 0.0 for an empty list."""
+    if not values:
+        return 0.0
+    return values[min(int(fraction * len(values)), len(values) - 1)]
+
+
+class _Connection:
+    """Represents one client connection carrying the requests of many games, matched to responses by id."""
+
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+        self._pending = {}  # request id -> future of the response
+        self._next_id = 0
+        self._latencies = []
+        self._receiver = asyncio.ensure_future(self._receive())
+
+    def get_latencies(self):
+        """Returns list of seconds between sending each move request and reading its response."""
+        return self._latencies
+
+    async def _receive(self):
+        """Reads responses and resolves the futures waiting on them."""
+        while True:
+            line = await self._reader.readline()
+            if not line:
+                break
+            response = json.loads(line)
+            self._pending.pop(response["id"]).set_result(response)
+        for future in self._pending.values():
+            future.set_exception(ConnectionError("server closed the connection"))
+
+    async def request(self, request, timed=False):
+        """Sends a request and returns the response dict."""
+        self._next_id += 1
+        request["id"] = self._next_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[self._next_id] = future
+        sent = time.perf_counter()
+        self._writer.write(json.dumps(request).encode("utf-8") + b"\n")
+        await self._writer.drain()
+        response = await future
+        if timed:
+            self._latencies.append(time.perf_counter() - sent)
+        return response
+
+    async def close(self):
+        """Closes the connection."""
+        self._writer.close()
+        await self._receiver
+
+
+async def _play(connection, seed, max_plies, counts):
+    """Plays one random game through the server."""
+    rng = random.Random(seed)
+    players = (("PlayerA", "R"), ("PlayerB", "G"))
+    response = await connection.request({"op": "new_game", "player_a": list(players[0]),
+                                         "player_b": list(players[1])})
+    if "error" in response:
+        counts["errors"] += 1
+        return
+    game_id = response["result"]
+    local = CompactFocusGame(*players)
+    side = rng.randrange(2)
+    for ply in range(max_plies):
+        moves = list(local.generate_moves(side))
+        if not moves:
+            break
+        start, end, number = moves[rng.randrange(len(moves))]
+        player = players[side][0]
+        if start < 0:
+            request = {"op": "reserved_move", "game": game_id, "player": player, "location": SQUARES_6X6[end]}
+            expected = local.reserved_move(player, SQUARES_6X6[end])
+        else:
+            request = {"op": "move_piece", "game": game_id, "player": player, "start": SQUARES_6X6[start],
+                       "end": SQUARES_6X6[end], "number": number}
+            expected = local.move_piece(player, SQUARES_6X6[start], SQUARES_6X6[end], number)
+        response = await connection.request(request, True)
+        if "error" in response:
+            counts["errors"] += 1
+            break
+        if response["result"] != expected:
+            counts["mismatches"] += 1
+            break
+        counts["moves"] += 1
+        if expected == player + " Wins":
+            break
+        side ^= 1
+    await connection.request({"op": "end_game", "game": game_id})
+
+
+async def run_load(games=10000, connections=100, host=DEFAULT_HOST, port=DEFAULT_PORT, max_plies=40, seed=0):
+    """Plays games concurrently against a running server. Returns dict of games, moves, errors, mismatches, elapsed
+    seconds, moves per second and p50/p99 move latency in milliseconds."""
+    clients = []
+    for index in range(connections):
+        reader, writer = await asyncio.open_connection(host, port)
+        clients.append(_Connection(reader, writer))
+    counts = {"moves": 0, "errors": 0, "mismatches": 0}
+
+    started = time.perf_counter()
+    await asyncio.gather(*[_play(clients[game % connections], seed * 1000003 + game, max_plies, counts)
+                           for game in range(games)])
+    elapsed = time.perf_counter() - started
+
+    latencies = []
+    for client in clients:
+        latencies.extend(client.get_latencies())
+        await client.close()
+    latencies.sort()
+    return {"games": games, "moves": counts["moves"], "errors": counts["errors"],
+            "mismatches": counts["mismatches"], "elapsed": elapsed,
+            "moves_per_second": counts["moves"] / elapsed if elapsed > 0 else 0.0,
+            "p50_ms": percentile(latencies, 0.5) * 1000, "p99_ms": percentile(latencies, 0.99) * 1000}
+
+
+def main():
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    connections = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    host = sys.argv[3] if len(sys.argv) > 3 else DEFAULT_HOST
+    port = int(sys.argv[4]) if len(sys.argv) > 4 else DEFAULT_PORT
+    stats = asyncio.run(run_load(games, connections, host, port))
+    print("%d games, %d moves in %.2f s: %.0f moves/s, p50 %.2f ms, p99 %.2f ms, %d errors, %d mismatches" % (
+        stats["games"], stats["moves"], stats["elapsed"], stats["moves_per_second"], stats["p50_ms"],
+        stats["p99_ms"], stats["errors"], stats["mismatches"]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+# Author: Timothy Jan
+# Date: 10/17/2026
+# Description: Memory benchmark for Focus/Domination games. Keeps a number of fresh games alive per implementation and
+#              prints the bytes each one costs, as measured by tracemalloc. The legacy models keep the dict-based
+#              Player/Piece/Stack layout the games had before __slots__ and shared pieces, so both sides of that change
+#              can be measured.
+#              Usage: python FocusMemoryBenchmark.py [number of games]
+
+import sys
+import tracemalloc
+
+import FocusGame
+import FocusGame_original
+from FocusGame_compact import CompactFocusGame
+
+# owners of each row's starting stacks in the legacy games, "-" for an empty square
+LEGACY_ROWS_6X6 = ("aabbaa", "bbaabb", "aabbaa", "bbaabb", "aabbaa", "bbaabb")
+LEGACY_ROWS_8X8 = ("----", "aabbaa", "-bbaabb-", "-aabbaa-", "-bbaabb-", "-aabbaa-", "bbaabb", "----")
+
+
+class LegacyPlayer:
+    """Represents game players as they were stored before __slots__."""
+
+    def __init__(self, player):
+        self._player = {"name": player[0], "color": player[1]}
+        self._reserve = []
+        self._capture = []
+
+
+class LegacyPiece:
+    """Represents game pieces as they were stored before __slots__, one Piece per stack."""
+
+    def __init__(self, player):
+        self._piece = {"name": player[0], "color": player[1]}
+
+
+class LegacyStack:
+    """Represents stack of game pieces as it was stored before __slots__."""
+
+    def __init__(self, piece):
+        self._stack = [piece]
+
+
+def legacy_stack(owner, player_a, player_b):
+    """Returns a LegacyStack holding a fresh LegacyPiece of the owner ("a" or "b"), or empty for "-"."""
+    if owner == "-":
+        return LegacyStack(None)
+    return LegacyStack(LegacyPiece(player_a if owner == "a" else player_b))
+
+
+class LegacyOriginalGame:
+    """Represents the state FocusGame_original.FocusGame kept per game before __slots__ and shared pieces."""
+
+    def __init__(self, player_a, player_b):
+        self._player_a = LegacyPlayer(player_a)
+        self._player_b = LegacyPlayer(player_b)
+        self._board = tuple(tuple(legacy_stack(owner, player_a, player_b) for owner in row) for row in LEGACY_ROWS_6X6)
+        self._turn_counter = 1
+        self._first_player = None
+        self._second_player = None
+        self._current_turn = None
+        self._message = None
+
+
+class LegacyGame:
+    """Represents the state FocusGame.FocusGame kept per game before __slots__ and shared pieces."""
+
+    def __init__(self, player_a, player_b):
+        self._player_a = LegacyPlayer(player_a)
+        self._player_b = LegacyPlayer(player_b)
+        self._board = [[legacy_stack(owner, player_a, player_b) for owner in row] for row in LEGACY_ROWS_8X8]
+
+
+IMPLEMENTATIONS = (("legacy FocusGame_original", LegacyOriginalGame),
+                   ("FocusGame_original.FocusGame", FocusGame_original.FocusGame),
+                   ("legacy FocusGame", LegacyGame),
+                   ("FocusGame.FocusGame", FocusGame.FocusGame),
+                   ("CompactFocusGame", CompactFocusGame))
+
+
+def bytes_per_game(game_class, games=10000):
+    """Returns average bytes allocated per live game when games of game_class are alive at once."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    live = [game_class(("PlayerA", "R"), ("PlayerB", "G")) for game in range(games)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # the list holding the games is not part of a game
+    return (after - before - sys.getsizeof(live)) / games
+
+
+def main():
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    for name, game_class in IMPLEMENTATIONS:
+        print("%-30s %8.0f bytes per game (%d live games)" % (name, bytes_per_game(game_class, games), games))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+# Author: Timothy Jan
+# Date: 10/17/2026
+# Description: Precomputed orthogonal ray tables for the Focus boards. Each board square gets, for each direction, the
+#              tuple of squares a stack can land on when moving 1, 2, 3... spaces that way, so move generators never do
+#              bounds arithmetic. The 6x6 square and ray tables used by the packed engines are built once at import;
+#              FocusGeometry builds the tables of every other layout, including the 4/6/8/8/8/8/6/4 board, from the
+#              builders here.
+
+DOWN = 0
+RIGHT = 1
+UP = 2
+LEFT = 3
+ALL_DIRECTIONS = (DOWN, RIGHT, UP, LEFT)
+# FocusGame_original.pre_move_check only accepts moves that increase the row or the column
+ORIGINAL_DIRECTIONS = (DOWN, RIGHT)
+
+STEPS = ((1, 0), (0, 1), (-1, 0), (0, -1))  # (row, column) step for DOWN, RIGHT, UP, LEFT
+
+# (first column, number of cells) for every row, in geometric columns
+LAYOUT_6X6 = ((0, 6), (0, 6), (0, 6), (0, 6), (0, 6), (0, 6))
+LAYOUT_8X8 = ((2, 4), (1, 6), (0, 8), (0, 8), (0, 8), (0, 8), (1, 6), (2, 4))
+
+
+def build_squares(layout):
+    """Returns tuple of board locations (row, index in row) in row order for a layout."""
+    return tuple((row, index) for row, (first, length) in enumerate(layout) for index in range(length))
+
+
+def build_ray_table(layout):
+    """Returns ray table for a layout: rays[square][direction] is a tuple of square numbers ordered by distance."""
+    squares = build_squares(layout)
+    numbers = {}  # geometric (row, column) -> square number
+    for square, (row, index) in enumerate(squares):
+        numbers[(row, layout[row][0] + index)] = square
+
+    rays = []
+    for row, index in squares:
+        column = layout[row][0] + index
+        directions = []
+        for row_step, column_step in STEPS:
+            ray = []
+            distance = 1
+            while (row + row_step * distance, column + column_step * distance) in numbers:
+                ray.append(numbers[(row + row_step * distance, column + column_step * distance)])
+                distance += 1
+            directions.append(tuple(ray))
+        rays.append(tuple(directions))
+    return tuple(rays)
+
+
+def build_square_numbers(layout):
+    """Returns dict of board location (row, index in row) -> square number for a layout."""
+    return {location: square for square, location in enumerate(build_squares(layout))}
+
+
+def build_offset_table(layout):
+    """Returns offset table for a layout: offsets[start][end] is the signed number of spaces from start to end along
+    their shared row or column (positive down or right), 0 for the same square and None if they aren't in line."""
+    squares = build_squares(layout)
+    offsets = []
+    for start_row, start_index in squares:
+        start_column = layout[start_row][0] + start_index
+        row = []
+        for end_row, end_index in squares:
+            end_column = layout[end_row][0] + end_index
+            if end_row == start_row:
+                row.append(end_column - start_column)
+            elif end_column == start_column:
+                row.append(end_row - start_row)
+            else:
+                row.append(None)
+        offsets.append(tuple(row))
+    return tuple(offsets)
+
+
+def build_location_rays(layout):
+    """Returns ray table for a layout holding (row, index) location tuples instead of square numbers."""
+    squares = build_squares(layout)
+    return tuple(tuple(tuple(squares[square] for square in ray) for ray in directions)
+                 for directions in build_ray_table(layout))
+
+
+SQUARES_6X6 = build_squares(LAYOUT_6X6)
+RAYS_6X6 = build_ray_table(LAYOUT_6X6)
+
+
+def stack_moves(location, rays, height, directions):
+    """Yields (start, end, number) for every move of a stack of a given height from location along its rays."""
+    for direction in directions:
+        ray = rays[direction]
+        for number in range(1, min(height, len(ray)) + 1):
+            yield location, ray[number - 1], number
@@ -0,0 +1,172 @@
+# Author: Timothy Jan
+# Date: 10/17/2026
+# Description: Compact binary archive of finished Focus/Domination games and a memory-mapped reader for it.
+#
+#              File layout (little endian):
+#                  b"FOCUSREC", u16 version
+#                  game records, one after another:
+#                      u32 number of moves, u8 first player (0 player A, 1 player B),
+#                      u8 lengths of player A name, player A color, player B name, player B color, then the UTF-8 text
+#                      u16 per move: start square (63 for a reserve placement) << 9 | end square << 3 | number
+#                  index: u64 offset of each game record
+#                  trailer: u64 number of games, u64 offset of the index, b"FOCUSIDX"
+#
+#              Squares are CompactFocusGame board indexes (row * 6 + column). The index lets the reader jump to game K,
+#              and fixed size moves let it jump to ply P, without reading anything before them.
+
+import mmap
+import struct
+
+from FocusGame_compact import CompactFocusGame, INDEX
+from FocusMoves import SQUARES_6X6
+
+MAGIC = b"FOCUSREC"
+INDEX_MAGIC = b"FOCUSIDX"
+VERSION = 1
+PLACEMENT = 63  # start square of a reserve placement
+
+_FILE_HEADER = struct.Struct("<8sH")
+_GAME_HEADER = struct.Struct("<IBBBBB")
+_MOVE = struct.Struct("<H")
+_OFFSET = struct.Struct("<Q")
+_TRAILER = struct.Struct("<QQ8s")
+
+
+def encode_move(move):
+    """Returns u16 for a (start, end, number) location move, start is None for a reserve placement. Raises ValueError
+    for a move that doesn't fit the encoding: a location off the board, or a number outside 1 to 7, such as the moves
+    of no pieces or of a negative number that pre_move_check accepts and that only pass the turn."""
+    start, end, number = move
+    if not 0 < number <= 7:
+        raise ValueError("can't record a move of %r pieces" % (number,))
+    for location in (end,) if start is None else (start, end):
+        if not (0 <= location[0] < len(INDEX) and 0 <= location[1] < len(INDEX[0])):
+            raise ValueError("can't record a move off the board at %r" % (location,))
+    start_square = PLACEMENT if start is None else INDEX[start[0]][start[1]]
+    return start_square << 9 | INDEX[end[0]][end[1]] << 3 | number
+
+
+def decode_move(value):
+    """Returns (start, end, number) location move for a u16, start is None for a reserve placement."""
+    start_square = value >> 9
+    start = None if start_square == PLACEMENT else SQUARES_6X6[start_square]
+    return start, SQUARES_6X6[(value >> 3) & 63], value & 7
+
+
+class RecordWriter:
+    """Represents an archive file being written one game at a time."""
+
+    def __init__(self, path):
+        self._file = open(path, "wb")
+        self._file.write(_FILE_HEADER.pack(MAGIC, VERSION))
+        self._offsets = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write_game(self, player_a, player_b, first_player, moves):
+        """Writes one game. Players are (name, color) tuples, first_player is 0 if player A moved first and 1 if
+        player B did, and moves are the accepted (start, end, number) location moves in order. Raises ValueError,
+        writing nothing, if a move can't be encoded."""
+        values = [encode_move(move) for move in moves]
+        self._offsets.append(self._file.tell())
+        text = [value.encode("utf-8") for value in (player_a[0], player_a[1], player_b[0], player_b[1])]
+        self._file.write(_GAME_HEADER.pack(len(moves), first_player, *[len(value) for value in text]))
+        self._file.write(b"".join(text))
+        self._file.write(struct.pack("<%dH" % len(values), *values))
+
+    def close(self):
+        """Writes the index and trailer and closes the file."""
+        if self._file.closed:
+            return
+        index_offset = self._file.tell()
+        self._file.write(struct.pack("<%dQ" % len(self._offsets), *self._offsets))
+        self._file.write(_TRAILER.pack(len(self._offsets), index_offset, INDEX_MAGIC))
+        self._file.close()
+
+
+class RecordReader:
+    """Represents a memory-mapped archive file with random access to any game and ply."""
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version = _FILE_HEADER.unpack_from(self._map, 0)
+        count, index_offset, index_magic = _TRAILER.unpack_from(self._map, len(self._map) - _TRAILER.size)
+        if magic != MAGIC or index_magic != INDEX_MAGIC or version != VERSION:
+            self.close()
+            raise ValueError("not a Focus game record file")
+        self._count = count
+        self._index_offset = index_offset
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def close(self):
+        """Unmaps and closes the file."""
+        self._map.close()
+        self._file.close()
+
+    def get_game_count(self):
+        """Returns number of games in the archive."""
+        return self._count
+
+    def _locate(self, game):
+        """Returns (header tuple, offset of the first move) of a game."""
+        if not 0 <= game < self._count:
+            raise IndexError("game out of range")
+        offset = _OFFSET.unpack_from(self._map, self._index_offset + _OFFSET.size * game)[0]
+        header = _GAME_HEADER.unpack_from(self._map, offset)
+        return header, offset + _GAME_HEADER.size + sum(header[2:])
+
+    def get_header(self, game):
+        """Returns (player A, player B, first player, number of moves) of a game, players as (name, color) tuples."""
+        header, moves_offset = self._locate(game)
+        text = []
+        position = moves_offset - sum(header[2:])
+        for length in header[2:]:
+            text.append(self._map[position:position + length].decode("utf-8"))
+            position += length
+        return (text[0], text[1]), (text[2], text[3]), header[1], header[0]
+
+    def get_move(self, game, ply):
+        """Returns the (start, end, number) location move played at ply (from 0) of a game."""
+        header, moves_offset = self._locate(game)
+        if not 0 <= ply < header[0]:
+            raise IndexError("ply out of range")
+        return decode_move(_MOVE.unpack_from(self._map, moves_offset + _MOVE.size * ply)[0])
+
+    def get_moves(self, game, start=0, stop=None):
+        """Returns list of (start, end, number) location moves of a game from ply start up to ply stop."""
+        header, moves_offset = self._locate(game)
+        stop = header[0] if stop is None else min(stop, header[0])
+        if start >= stop:
+            return []
+        values = struct.unpack_from("<%dH" % (stop - start), self._map, moves_offset + _MOVE.size * start)
+        return [decode_move(value) for value in values]
+
+    def replay(self, game, plies=None):
+        """Returns a CompactFocusGame, not a FocusGame_original.FocusGame, in the position of a game after plies moves,
+        or after every move. Its get_message gives the same messages, but players are indexes (get_player_name(0) is
+        player A's name); FocusGame.from_compact turns it into a FocusGame."""
+        player_a, player_b, first_player, move_count = self.get_header(game)
+        moves_offset = self._locate(game)[1]
+        plies = move_count if plies is None else min(plies, move_count)
+        position = CompactFocusGame(player_a, player_b)
+        if plies == 0:
+            return position
+        position.setup_first_turn_players(position.get_player_name(first_player))
+        for value in struct.unpack_from("<%dH" % plies, self._map, moves_offset):
+            start = value >> 9
+            position.apply_move(position.get_current_turn(), -1 if start == PLACEMENT else start, (value >> 3) & 63,
+                                value & 7)
+        return position
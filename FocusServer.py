@@ -0,0 +1,276 @@
+# Author: Timothy Jan
+# Date: 10/17/2026
+# Description: Asyncio server hosting many FocusGame_original.FocusGame games in one event loop. Clients send one JSON
+#              request per line over TCP and get one JSON response per line, in request order.
+#
+#              Requests are objects with an "op", an optional "id" echoed back in the response, and the op's fields:
+#                  new_game       player_a, player_b ([name, color] pairs)   -> result is the new game id
+#                  end_game       game
+#                  move_piece     game, player, start, end, number           -> the FocusGame method's return value
+#                  reserved_move  game, player, location
+#                  show_pieces    game, location
+#                  show_reserve   game, player
+#                  show_captured  game, player
+#                  validate_move  game, player, start, end, number           -> null if legal, else a reason code
+#                  validate_moves game, player, moves ([start, end, number] lists, start null for a reserve placement)
+#                  watch          game                                       -> stream the game's move events
+#                  unwatch        game
+#              Responses are {"id": ..., "result": ...} or {"id": ..., "error": "..."}.
+#
+#              A connection watching a game also gets a line {"game": ..., "event": "move", ...} for every move, with
+#              the fields of a FocusGame_original move event, and {"game": ..., "event": "end"} when the game ends.
+#              Each event is encoded once and the same bytes are written to every watcher. A watcher that falls more
+#              than MAX_WATCH_BUFFER bytes behind is disconnected rather than slowing the game down.
+#
+#              Operations on one game hold that game's lock, so requests for a game from different connections never
+#              interleave. Each connection handles its requests one at a time and waits for the client to read its
+#              responses before reading more, so a slow client is throttled by TCP instead of queueing work here.
+#              Usage: python FocusServer.py [host] [port]
+
+import asyncio
+import json
+import sys
+
+from FocusGame_original import FocusGame
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8162
+MAX_LINE = 4096  # longest request line in bytes
+MAX_GAMES = 100000
+MAX_WATCH_BUFFER = 1 << 20  # unsent event bytes a watcher may have before it is disconnected
+
+# FocusGame methods served, with the request fields passed as their arguments in order
+GAME_OPERATIONS = {"move_piece": ("player", "start", "end", "number"),
+                   "reserved_move": ("player", "location"),
+                   "show_pieces": ("location",),
+                   "show_reserve": ("player",),
+                   "show_captured": ("player",),
+                   "validate_move": ("player", "start", "end", "number"),
+                   "validate_moves": ("player", "moves")}
+
+
+class RequestError(Exception):
+    """Raised when a request can't be served. The message is sent back as the response error."""
+    pass
+
+
+class _HostedGame:
+    """Represents a game hosted by the server, the lock serializing its operations and the connections watching it."""
+
+    __slots__ = ("game_id", "game", "lock", "watchers")
+
+    def __init__(self, game_id, game):
+        self.game_id = game_id
+        self.game = game
+        self.lock = asyncio.Lock()
+        self.watchers = set()  # stream writers of watching connections
+
+    def watch(self, writer):
+        """Starts sending the game's events to a connection."""
+        if not self.watchers:
+            self.game.subscribe(self.publish)
+        self.watchers.add(writer)
+
+    def unwatch(self, writer):
+        """Stops sending the game's events to a connection."""
+        self.watchers.discard(writer)
+        if not self.watchers:
+            self.game.unsubscribe(self.publish)
+
+    def publish(self, event):
+        """Writes an event to every watcher, encoded once."""
+        line = json.dumps(dict(event, game=self.game_id)).encode("utf-8") + b"\n"
+        for writer in list(self.watchers):
+            if writer.is_closing():
+                self.unwatch(writer)
+            elif writer.transport.get_write_buffer_size() > MAX_WATCH_BUFFER:
+                self.unwatch(writer)
+                writer.close()
+            else:
+                writer.write(line)
+
+    def close(self):
+        """Tells watchers the game ended and stops watching it."""
+        if self.watchers:
+            self.publish({"event": "end"})
+            # publishing may have unwatched every watcher, and the last unwatch already unsubscribed
+            if self.watchers:
+                self.game.unsubscribe(self.publish)
+                self.watchers.clear()
+
+
+def _argument(request, field):
+    """Returns a request field as a FocusGame argument, locations as tuples."""
+    if field not in request:
+        raise RequestError("missing field " + field)
+    value = request[field]
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+def _game_id(request):
+    """Returns the game request field, a game id."""
+    value = request.get("game")
+    # a list or dict id can't be looked up, and a bool would be taken for game 0 or 1
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise RequestError("game must be an integer")
+    return value
+
+
+def _player_tuple(request, field):
+    """Returns a [name, color] request field as a (name, color) tuple."""
+    value = request.get(field)
+    if not isinstance(value, list) or len(value) != 2 or not all(isinstance(text, str) for text in value):
+        raise RequestError(field + " must be [name, color]")
+    return value[0], value[1]
+
+
+class GameServer:
+    """Represents a TCP server hosting Focus games for line-delimited JSON requests."""
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, max_games=MAX_GAMES):
+        self._host = host
+        self._port = port
+        self._max_games = max_games
+        self._games = {}  # game id -> _HostedGame
+        self._watched = {}  # stream writer -> set of _HostedGames the connection watched
+        self._next_game = 1
+        self._requests = 0
+        self._server = None
+
+    def get_game_count(self):
+        """Returns number of games being hosted."""
+        return len(self._games)
+
+    def get_request_count(self):
+        """Returns number of requests served."""
+        return self._requests
+
+    def get_port(self):
+        """Returns the port the server listens on, which is picked by the system when created with port 0."""
+        if self._server is None:
+            return self._port
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self):
+        """Starts listening for connections."""
+        self._server = await asyncio.start_server(self._handle_connection, self._host, self._port, limit=MAX_LINE)
+
+    async def serve_forever(self):
+        """Starts listening if needed and serves connections until cancelled."""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """Stops listening for connections."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle_connection(self, reader, writer):
+        """Serves the requests of one connection until the client disconnects."""
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # the line is longer than MAX_LINE, and the rest of the stream can't be framed
+                    writer.write(b'{"id": null, "error": "request line too long"}\n')
+                    break
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                except (ValueError, RecursionError):
+                    # RecursionError comes from arrays or objects nested deeper than the decoder can go
+                    response = {"id": None, "error": "invalid JSON"}
+                else:
+                    response = await self.handle_request(request, writer)
+                writer.write(json.dumps(response).encode("utf-8") + b"\n")
+                # wait while the client is slower than the server at moving responses
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            # games keep their watchers until unwatched, so stop sending events to the closed connection
+            for hosted in self._watched.pop(writer, ()):
+                if writer in hosted.watchers:
+                    hosted.unwatch(writer)
+            writer.close()
+
+    async def handle_request(self, request, writer=None):
+        """Returns the response dict for a decoded request, from the connection of writer if it has one."""
+        self._requests += 1
+        request_id = request.get("id") if isinstance(request, dict) else None
+        try:
+            result = await self._dispatch(request, writer)
+        except RequestError as error:
+            return {"id": request_id, "error": str(error)}
+        return {"id": request_id, "result": result}
+
+    async def _dispatch(self, request, writer):
+        """Returns the result of a request, or raises RequestError."""
+        if not isinstance(request, dict):
+            raise RequestError("request must be an object")
+        operation = request.get("op")
+
+        if operation == "new_game":
+            player_a = _player_tuple(request, "player_a")
+            player_b = _player_tuple(request, "player_b")
+            if len(self._games) >= self._max_games:
+                raise RequestError("server is full")
+            game_id = self._next_game
+            self._next_game += 1
+            self._games[game_id] = _HostedGame(game_id, FocusGame(player_a, player_b))
+            return game_id
+
+        if operation == "end_game":
+            hosted = self._games.pop(_game_id(request), None)
+            if hosted is None:
+                raise RequestError("unknown game")
+            hosted.close()
+            return None
+
+        if operation in ("watch", "unwatch"):
+            hosted = self._games.get(_game_id(request))
+            if hosted is None:
+                raise RequestError("unknown game")
+            if writer is None:
+                raise RequestError("watching needs a connection")
+            if operation == "watch":
+                hosted.watch(writer)
+                self._watched.setdefault(writer, set()).add(hosted)
+            elif writer in hosted.watchers:
+                hosted.unwatch(writer)
+                self._watched[writer].discard(hosted)
+            return None
+
+        if operation not in GAME_OPERATIONS:
+            raise RequestError("unknown op")
+        hosted = self._games.get(_game_id(request))
+        if hosted is None:
+            raise RequestError("unknown game")
+        arguments = [_argument(request, field) for field in GAME_OPERATIONS[operation]]
+        async with hosted.lock:
+            try:
+                return getattr(hosted.game, operation)(*arguments)
+            except (AttributeError, IndexError, TypeError, ValueError) as error:
+                # arguments FocusGame itself can't handle, such as a location that isn't a pair
+                raise RequestError("%s: %s" % (type(error).__name__, error))
+
+
+def main():
+    host = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_HOST
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_PORT
+    server = GameServer(host, port)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,215 @@
+# Author: Timothy Jan
+# Date: 10/17/2026
+# Description: Opt-in instrumentation for FocusGame_original.FocusGame. InstrumentedFocusGame counts move calls and
+#              rejected moves by reason, and times the pre_move_check, assign_pieces, reserve_capture and update_turn
+#              phases of a sample of moves into a GameStats, which exports a stats dict or Prometheus text. An unsampled
+#              move only counts the call around FocusGame.move_piece. A sampled move runs FocusGame.move_piece with the
+#              game switched to _TimedFocusGame, whose phase methods time the FocusGame ones, so only that move pays
+#              for the clock. Games report to the module's shared STATS unless given their own GameStats.
+#              FocusGame itself is never wrapped, so games created from it pay nothing.
+
+import time
+
+from FocusGame_original import FocusGame, NOT_OWNER
+
+PHASES = ("pre_move_check", "assign_pieces", "reserve_capture", "update_turn", "reserved_move")
+QUANTILES = (0.5, 0.9, 0.99)
+SAMPLE_EVERY = 128  # time one move in this many, counting every move
+MAX_SAMPLES = 4096  # most recent timings kept per phase for percentiles
+
+
+class GameStats:
+    """Represents call counts, rejected moves by reason and phase timings collected from instrumented games."""
+
+    __slots__ = ("_sample_every", "_max_samples", "_moves", "_next_sample", "_reserved_calls", "_rejected",
+                 "_rejections", "_timed", "_totals", "_samples")
+
+    def __init__(self, sample_every=SAMPLE_EVERY, max_samples=MAX_SAMPLES):
+        self._sample_every = sample_every
+        self._max_samples = max_samples
+        self._moves = 0  # calls of both move methods, deciding which are timed
+        self._next_sample = sample_every  # value of _moves at the next timed move
+        self._reserved_calls = 0  # calls of reserved_move, the other moves being move_piece calls
+        self._rejected = {"move_piece": 0, "reserved_move": 0}
+        self._rejections = {}  # reason -> count
+        self._timed = {phase: 0 for phase in PHASES}  # phase -> timed calls
+        self._totals = {phase: 0.0 for phase in PHASES}  # phase -> seconds over timed calls
+        self._samples = {phase: [] for phase in PHASES}  # phase -> ring of recent seconds
+
+    def get_sample_every(self):
+        """Returns how many moves there are per timed move."""
+        return self._sample_every
+
+    def start_move(self, method):
+        """Counts a call of a move method and returns True if it should be timed."""
+        if method == "reserved_move":
+            self._reserved_calls += 1
+        self._moves += 1
+        if self._moves != self._next_sample:
+            return False
+        self._next_sample += self._sample_every
+        return True
+
+    def get_calls(self):
+        """Returns dict of calls by move method."""
+        return {"move_piece": self._moves - self._reserved_calls, "reserved_move": self._reserved_calls}
+
+    def count_rejection(self, method, reason):
+        """Counts a move rejected by a move method."""
+        self._rejected[method] += 1
+        self._rejections[reason] = self._rejections.get(reason, 0) + 1
+
+    def get_phase_calls(self, phase):
+        """Returns number of calls of a phase, timed or not. Every move_piece call checks its move, and only accepted
+        moves run the later phases."""
+        if phase == "pre_move_check":
+            return self._moves - self._reserved_calls
+        if phase == "reserved_move":
+            return self._reserved_calls
+        return self._moves - self._reserved_calls - self._rejected["move_piece"]
+
+    def add_time(self, phase, seconds):
+        """Records the time of one call of a phase."""
+        count = self._timed[phase]
+        self._timed[phase] = count + 1
+        self._totals[phase] += seconds
+        samples = self._samples[phase]
+        if len(samples) < self._max_samples:
+            samples.append(seconds)
+        else:
+            samples[count % self._max_samples] = seconds
+
+    def percentile(self, phase, fraction):
+        """Returns the time at fraction (0 to 1) of the recent timings of a phase, or 0.0 if none were taken."""
+        samples = sorted(self._samples[phase])
+        if not samples:
+            return 0.0
+        return samples[min(int(fraction * len(samples)), len(samples) - 1)]
+
+    def get_stats(self):
+        """Returns dict of calls, rejections by reason, and per phase its calls, timed calls, estimated cumulative
+        seconds (timed seconds scaled to every call) and percentile seconds."""
+        phases = {}
+        for phase in PHASES:
+            timed = self._timed[phase]
+            calls = self.get_phase_calls(phase)
+            phases[phase] = {"calls": calls, "timed": timed,
+                             "seconds": self._totals[phase] * calls / timed if timed else 0.0}
+            for quantile in QUANTILES:
+                phases[phase]["p%g" % (quantile * 100)] = self.percentile(phase, quantile)
+        return {"calls": self.get_calls(), "rejections": dict(self._rejections), "phases": phases}
+
+    def to_prometheus(self, prefix="focus"):
+        """Returns the stats in Prometheus text exposition format."""
+        stats = self.get_stats()
+        lines = ["# HELP %s_calls_total Calls of FocusGame move methods." % prefix,
+                 "# TYPE %s_calls_total counter" % prefix]
+        for method, count in sorted(stats["calls"].items()):
+            lines.append('%s_calls_total{method="%s"} %d' % (prefix, method, count))
+        lines.append("# HELP %s_rejected_moves_total Rejected moves by reason." % prefix)
+        lines.append("# TYPE %s_rejected_moves_total counter" % prefix)
+        for reason, count in sorted(stats["rejections"].items()):
+            lines.append('%s_rejected_moves_total{reason="%s"} %d' % (prefix, reason, count))
+        lines.append("# HELP %s_phase_seconds Time per call of each move phase." % prefix)
+        lines.append("# TYPE %s_phase_seconds summary" % prefix)
+        for phase, values in stats["phases"].items():
+            for quantile in QUANTILES:
+                lines.append('%s_phase_seconds{phase="%s",quantile="%g"} %.9f'
+                             % (prefix, phase, quantile, values["p%g" % (quantile * 100)]))
+            lines.append('%s_phase_seconds_sum{phase="%s"} %.9f' % (prefix, phase, values["seconds"]))
+            lines.append('%s_phase_seconds_count{phase="%s"} %d' % (prefix, phase, values["calls"]))
+        return "\n".join(lines) + "\n"
+
+
+STATS = GameStats()  # stats of instrumented games not given their own
+
+
+class InstrumentedFocusGame(FocusGame):
+    """Represents a FocusGame that reports its moves to a GameStats, the module's STATS unless given its own."""
+
+    __slots__ = ("_stats",)
+
+    def __init__(self, player_a, player_b, stats=None):
+        super().__init__(player_a, player_b)
+        self._stats = STATS if stats is None else stats
+
+    @classmethod
+    def from_compact(cls, compact, stats=None):
+        """Returns an InstrumentedFocusGame in the same position as a CompactFocusGame."""
+        game = super().from_compact(compact)
+        game._stats = STATS if stats is None else stats
+        return game
+
+    def get_stats(self):
+        """Returns the GameStats of this game."""
+        return self._stats
+
+    def move_piece(self, player, start, end, number):
+        """Allows players to move game stacks, counting the call and timing its phases if sampled."""
+        stats = self._stats
+        # counted inline rather than through start_move, so unsampled moves stay close to FocusGame.move_piece
+        moves = stats._moves + 1
+        stats._moves = moves
+        timed = moves == stats._next_sample
+        if timed:
+            stats._next_sample += stats._sample_every
+            # a sampled move runs as a _TimedFocusGame, whose phase methods time themselves
+            self.__class__ = _TimedFocusGame
+        try:
+            message = FocusGame.move_piece(self, player, start, end, number)
+        except IndexError:
+            # pre_move_check reads the owner of an empty stack
+            stats.count_rejection("move_piece", NOT_OWNER)
+            raise
+        finally:
+            if timed:
+                self.__class__ = InstrumentedFocusGame
+        if message is False:
+            stats.count_rejection("move_piece", self.validate_move(player, start, end, number))
+        return message
+
+    def reserved_move(self, player, location):
+        """Allows player to place a piece from their reserve on a given location, counting the call and timing it if
+        sampled."""
+        stats = self._stats
+        turn = self._turn_counter
+        if stats.start_move("reserved_move"):
+            started = time.perf_counter()
+            message = FocusGame.reserved_move(self, player, location)
+            stats.add_time("reserved_move", time.perf_counter() - started)
+        else:
+            message = FocusGame.reserved_move(self, player, location)
+        # every accepted drop passes the turn, while a rejected one can return the message of an earlier move
+        if self._turn_counter == turn:
+            stats.count_rejection("reserved_move", self.validate_move(player, None, location, 1))
+        return message
+
+
+class _TimedFocusGame(InstrumentedFocusGame):
+    """Represents an InstrumentedFocusGame during a sampled move_piece, timing each phase into its GameStats. Games are
+    only this class while the move runs, so unsampled moves call FocusGame's phase methods directly."""
+
+    __slots__ = ()
+
+    def _phase(self, phase, method, *arguments):
+        """Returns the result of a FocusGame phase method, recording how long it took."""
+        started = time.perf_counter()
+        result = method(self, *arguments)
+        self._stats.add_time(phase, time.perf_counter() - started)
+        return result
+
+    def pre_move_check(self, player, start, end, number):
+        """Performs pre-move checks, timed."""
+        return self._phase("pre_move_check", FocusGame.pre_move_check, player, start, end, number)
+
+    def assign_pieces(self, start, end, number):
+        """Moves pieces from one stack to another, timed."""
+        return self._phase("assign_pieces", FocusGame.assign_pieces, start, end, number)
+
+    def reserve_capture(self, location):
+        """Captures or reserves pieces over the end of a move, timed."""
+        return self._phase("reserve_capture", FocusGame.reserve_capture, location)
+
+    def update_turn(self):
+        """Updates turn counter and current turn, timed."""
+        return self._phase("update_turn", FocusGame.update_turn)
@@ -0,0 +1,203 @@
+# Author: Timothy Jan
+# Date: 10/17/2026
+# Description: Round-robin tournaments between computer opponent configurations. Games are sharded across a
+#              ProcessPoolExecutor with a fixed seed per game, every finished game is appended to a JSON lines
+#              checkpoint file as soon as it comes back, and a tournament started again with the same checkpoint only
+#              plays the games still missing. Results aggregate into win rates, Elo ratings and game length histograms.
+#
+#              The checkpoint's first line records the tournament setup (bots, games per pair, seed, max plies), and a
+#              checkpoint written by a different setup is refused. Searching bots get a node or playout budget instead
+#              of a clock by default, so a game replays exactly from its seed however loaded the machine is. A bot spec
+#              that sets time_limit searches against the clock again and its games can't be reproduced.
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from FocusAI import AlphaBetaEngine, MonteCarloEngine, RandomEngine, play_move
+from FocusGame_compact import CompactFocusGame
+
+ENGINES = {"alphabeta": AlphaBetaEngine, "montecarlo": MonteCarloEngine, "random": RandomEngine}
+SEEDED_ENGINES = ("montecarlo", "random")  # engines that take the game's seed
+# search budgets that don't depend on the clock, used unless a bot spec overrides them
+DEFAULT_OPTIONS = {"alphabeta": {"time_limit": None, "max_nodes": 20000},
+                   "montecarlo": {"time_limit": None, "max_playouts": 200}}
+ELO_START = 1500
+ELO_K = 16
+
+
+def make_bot(spec, seed):
+    """Returns engine for a (kind, options) bot spec, seeded with seed if the engine is random."""
+    kind, spec_options = spec
+    options = dict(DEFAULT_OPTIONS.get(kind, {}))
+    options.update(spec_options)
+    if kind in SEEDED_ENGINES:
+        options["seed"] = seed
+    return ENGINES[kind](**options)
+
+
+def game_seed(seed, game_id):
+    """Returns the seed of one tournament game."""
+    return seed * 1000003 + game_id
+
+
+def play_game(task):
+    """Plays one tournament game and returns its result dict. Task is (game id, seed, first bot name, first bot spec,
+    second bot name, second bot spec, max plies); the first bot moves first."""
+    game_id, seed, first, first_spec, second, second_spec, max_plies = task
+    bots = {first: make_bot(first_spec, seed), second: make_bot(second_spec, seed + 1)}
+    game = CompactFocusGame((first, "R"), (second, "G"))
+    player = first
+    winner = None
+    plies = 0
+    while plies < max_plies:
+        move = bots[player].choose_move(game, player)
+        if move is None:
+            # a player who can't move can't capture again, so the other player wins
+            winner = second if player == first else first
+            break
+        message = play_move(game, player, move)
+        plies += 1
+        if message == player + " Wins":
+            winner = player
+            break
+        player = second if player == first else first
+    return {"game": game_id, "seed": seed, "first": first, "second": second, "winner": winner, "plies": plies,
+            "captures_first": game.show_captured(first), "captures_second": game.show_captured(second)}
+
+
+class Tournament:
+    """Represents a round-robin tournament between named bot specs, optionally checkpointed to a file."""
+
+    def __init__(self, bots, games_per_pair=2, seed=0, max_plies=300, checkpoint=None, workers=None):
+        self._bots = bots  # name -> (engine kind, options dict)
+        self._games_per_pair = games_per_pair  # the bots of a pair take turns moving first
+        self._seed = seed
+        self._max_plies = max_plies
+        self._checkpoint = checkpoint
+        self._workers = workers
+        self._results = {}  # game id -> result dict
+        if checkpoint is not None and os.path.exists(checkpoint):
+            self.load_checkpoint()
+
+    def get_results(self):
+        """Returns list of finished game results ordered by game id."""
+        return [self._results[game_id] for game_id in sorted(self._results)]
+
+    def get_setup(self):
+        """Returns dict of the settings that decide which games the tournament plays, as the checkpoint records it."""
+        return {"bots": {name: [kind, options] for name, (kind, options) in sorted(self._bots.items())},
+                "games_per_pair": self._games_per_pair, "seed": self._seed, "max_plies": self._max_plies}
+
+    def get_tasks(self):
+        """Returns list of play_game tasks for every game of the tournament."""
+        names = sorted(self._bots)
+        tasks = []
+        for first_index, first in enumerate(names):
+            for second in names[first_index + 1:]:
+                for round_number in range(self._games_per_pair):
+                    mover, other = (first, second) if round_number % 2 == 0 else (second, first)
+                    game_id = len(tasks)
+                    tasks.append((game_id, game_seed(self._seed, game_id), mover, self._bots[mover], other,
+                                  self._bots[other], self._max_plies))
+        return tasks
+
+    def load_checkpoint(self):
+        """Reads finished games from the checkpoint file, skipping a line cut short by a crash. Raises ValueError if
+        the file was written by a tournament with a different setup."""
+        tasks = self.get_tasks()
+        with open(self._checkpoint) as checkpoint:
+            header = checkpoint.readline()
+            if not header:
+                return
+            try:
+                setup = json.loads(header).get("tournament")
+            except (ValueError, AttributeError):
+                setup = None
+            if setup != json.loads(json.dumps(self.get_setup())):
+                raise ValueError("checkpoint %s was written by a different tournament" % self._checkpoint)
+
+            for line in checkpoint:
+                try:
+                    result = json.loads(line)
+                except ValueError:
+                    continue
+                # every result must be the game this tournament plays under its id
+                game_id = result.get("game")
+                if not isinstance(game_id, int) or not 0 <= game_id < len(tasks) or \
+                        (result.get("seed"), result.get("first"), result.get("second")) != \
+                        (tasks[game_id][1], tasks[game_id][2], tasks[game_id][4]):
+                    raise ValueError("checkpoint %s has a result for game %r that this tournament doesn't play"
+                                     % (self._checkpoint, game_id))
+                self._results[game_id] = result
+
+    def run(self):
+        """Plays every game missing from the results across a process pool and yields each result as it finishes."""
+        tasks = [task for task in self.get_tasks() if task[0] not in self._results]
+        if not tasks:
+            return
+        checkpoint = open(self._checkpoint, "a") if self._checkpoint is not None else None
+        if checkpoint is not None and checkpoint.tell() == 0:
+            checkpoint.write(json.dumps({"tournament": self.get_setup()}) + "\n")
+            checkpoint.flush()
+        try:
+            with ProcessPoolExecutor(max_workers=self._workers) as executor:
+                futures = [executor.submit(play_game, task) for task in tasks]
+                for future in as_completed(futures):
+                    result = future.result()
+                    self._results[result["game"]] = result
+                    if checkpoint is not None:
+                        checkpoint.write(json.dumps(result) + "\n")
+                        checkpoint.flush()
+                    yield result
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+
+    def play(self):
+        """Plays every missing game and returns the standings."""
+        for result in self.run():
+            pass
+        return self.standings()
+
+    def standings(self):
+        """Returns dict of bot name -> dict of games, wins, losses, draws and win rate."""
+        table = {name: {"games": 0, "wins": 0, "losses": 0, "draws": 0, "win_rate": 0.0} for name in self._bots}
+        for result in self._results.values():
+            for name in (result["first"], result["second"]):
+                table[name]["games"] += 1
+                if result["winner"] is None:
+                    table[name]["draws"] += 1
+                elif result["winner"] == name:
+                    table[name]["wins"] += 1
+                else:
+                    table[name]["losses"] += 1
+        for row in table.values():
+            if row["games"]:
+                row["win_rate"] = (row["wins"] + 0.5 * row["draws"]) / row["games"]
+        return table
+
+    def elo(self):
+        """Returns dict of bot name -> Elo rating, replaying finished games in game id order."""
+        ratings = {name: float(ELO_START) for name in self._bots}
+        for result in self.get_results():
+            first = result["first"]
+            second = result["second"]
+            expected = 1 / (1 + 10 ** ((ratings[second] - ratings[first]) / 400))
+            if result["winner"] is None:
+                score = 0.5
+            elif result["winner"] == first:
+                score = 1.0
+            else:
+                score = 0.0
+            ratings[first] += ELO_K * (score - expected)
+            ratings[second] -= ELO_K * (score - expected)
+        return ratings
+
+    def length_histogram(self, bucket=10):
+        """Returns dict of game length bucket start -> number of games."""
+        histogram = {}
+        for result in self._results.values():
+            start = result["plies"] // bucket * bucket
+            histogram[start] = histogram.get(start, 0) + 1
+        return dict(sorted(histogram.items()))
@@ -0,0 +1,150 @@
+# Author: Timothy Jan
+# Date: 10/17/2026
+# Description: Rule tests for FocusGame.FocusGame, the move engine for FocusGeometry boards, on the 6x6 and 8-row
+#              layouts: moves in all four directions, rejected moves, trimming from the bottom, reserve placements,
+#              winning and off-board lookups.
+#              Usage: python -m pytest test_FocusGame.py (or python -m unittest test_FocusGame)
+
+import unittest
+
+from FocusGame import FocusGame, Piece, START_6X6, START_8X8
+from FocusGeometry import GEOMETRY_6X6, GEOMETRY_8X8
+
+PLAYER_A = ("PlayerA", "R")
+PLAYER_B = ("PlayerB", "G")
+SUCCESS = "successfully moved"
+
+
+class LayoutRulesTest:
+    """Rule tests run on the layout of GEOMETRY and START, mixed into a unittest.TestCase per layout."""
+
+    GEOMETRY = None
+    START = None
+
+    def new_game(self):
+        """Returns a FocusGame at the start position of the layout."""
+        return FocusGame(PLAYER_A, PLAYER_B, self.GEOMETRY)
+
+    def location_of(self, owner, count=1):
+        """Returns the location of the count-th square that starts with a piece of owner (0 for A, 1 for B)."""
+        squares = [square for square, square_owner in enumerate(self.START) if square_owner == owner]
+        return self.GEOMETRY.get_squares()[squares[count - 1]]
+
+    def test_start_position(self):
+        game = self.new_game()
+        colors = {0: ["R"], 1: ["G"], None: []}
+        for location, owner in zip(self.GEOMETRY.get_squares(), self.START):
+            self.assertEqual(game.show_pieces(location), colors[owner])
+        self.assertEqual((game.show_reserve("PlayerA"), game.show_captured("PlayerA")), (0, 0))
+
+    def test_off_board_lookups(self):
+        game = self.new_game()
+        for location in ((-1, 0), (0, -1), (8, 0), (0, 8)):
+            self.assertIsNone(game.get_stack_on_board(location))
+            self.assertIsNone(game.show_pieces(location))
+        self.assertIsNone(game.show_reserve("PlayerC"))
+        self.assertIsNone(game.show_captured("PlayerC"))
+
+    def test_legal_moves_are_accepted(self):
+        # every move a player is offered at the start is accepted, including up and left, which the 6x6 rules of
+        # FocusGame_original don't allow
+        moves = list(self.new_game().legal_moves("PlayerA"))
+        self.assertTrue(any(end[0] < start[0] for start, end, number in moves))
+        self.assertTrue(any(end[0] == start[0] and end[1] < start[1] for start, end, number in moves))
+        for move in moves:
+            self.assertEqual(self.new_game().move_piece("PlayerA", *move), SUCCESS)
+
+    def test_rejected_moves(self):
+        game = self.new_game()
+        start = self.location_of(0)
+        end = next(end for move_start, end, number in game.legal_moves("PlayerA") if move_start == start)
+        self.assertIs(game.move_piece("PlayerC", start, end, 1), False)  # unknown player
+        self.assertIs(game.move_piece("PlayerA", start, (9, 9), 1), False)  # off the board
+        self.assertIs(game.move_piece("PlayerA", start, end, 2), False)  # wrong distance and too many pieces
+        self.assertIs(game.move_piece("PlayerA", start, end, 0), False)  # no pieces
+        self.assertIs(game.move_piece("PlayerB", start, end, 1), False)  # not their stack
+        self.assertIs(game.move_piece("PlayerA", start, start, 1), False)  # nowhere
+        self.assertEqual(game.move_piece("PlayerA", start, end, 1), SUCCESS)
+        self.assertEqual(game.show_pieces(end)[-1], "R")
+        self.assertEqual(game.show_pieces(start), [])
+        # then only player B may move
+        self.assertIs(game.move_piece("PlayerA", end, start, 1), False)
+        self.assertEqual(game.get_current_turn().get_player_name(), "PlayerB")
+
+    def test_diagonal_move_rejected(self):
+        game = self.new_game()
+        start = self.location_of(0)
+        square = self.GEOMETRY.get_square(start)
+        offsets = self.GEOMETRY.get_offsets()[square]
+        diagonal = next(location for location, offset in zip(self.GEOMETRY.get_squares(), offsets)
+                        if offset is None and location != start)
+        self.assertIs(game.move_piece("PlayerA", start, diagonal, 1), False)
+
+    def test_tall_stack_trims_bottom(self):
+        game = self.new_game()
+        piece_a = Piece(PLAYER_A)
+        piece_b = Piece(PLAYER_B)
+        start = self.location_of(0)
+        move = next(move for move in game.legal_moves("PlayerA") if move[0] == start)
+        end = move[1]
+        # the end stack holds five pieces, player A's at the bottom, then B's, under A's moving piece
+        game.get_stack_on_board(end).get_stack()[:] = [piece_a, piece_b, piece_a, piece_b, piece_b]
+        self.assertEqual(game.move_piece("PlayerA", *move), SUCCESS)
+        self.assertEqual(game.show_pieces(end), ["G", "R", "G", "G", "R"])
+        self.assertEqual((game.show_reserve("PlayerA"), game.show_captured("PlayerA")), (1, 0))
+
+    def test_reserve_placement(self):
+        game = self.new_game()
+        location = self.location_of(1)
+        self.assertEqual(game.reserved_move("PlayerA", location), "No pieces in reserve")
+        game.get_player_a().add_reserve(Piece(PLAYER_A))
+        self.assertIs(game.reserved_move("PlayerA", (9, 9)), False)
+        self.assertEqual(game.reserved_move("PlayerA", location), SUCCESS)
+        self.assertEqual(game.show_pieces(location), ["G", "R"])
+        self.assertEqual(game.show_reserve("PlayerA"), 0)
+        self.assertEqual(game.get_current_turn().get_player_name(), "PlayerB")
+
+    def test_sixth_capture_wins(self):
+        game = self.new_game()
+        piece_b = Piece(PLAYER_B)
+        for capture in range(5):
+            game.get_player_a().add_capture(piece_b)
+        start = self.location_of(0)
+        move = next(move for move in game.legal_moves("PlayerA") if move[0] == start)
+        game.get_stack_on_board(move[1]).get_stack()[:] = [piece_b] * 5
+        self.assertEqual(game.move_piece("PlayerA", *move), "PlayerA Wins")
+        self.assertEqual(game.show_captured("PlayerA"), 6)
+        self.assertEqual(game.get_message(), "PlayerA Wins")
+
+
+class Rules6x6Test(LayoutRulesTest, unittest.TestCase):
+    """Tests the rules on the 6x6 board."""
+
+    GEOMETRY = GEOMETRY_6X6
+    START = START_6X6
+
+
+class Rules8x8Test(LayoutRulesTest, unittest.TestCase):
+    """Tests the rules on the 8-row board."""
+
+    GEOMETRY = GEOMETRY_8X8
+    START = START_8X8
+
+    def test_corner_cells_are_off_board(self):
+        # the first and last rows hold four cells, so a location five cells in is off the board
+        game = self.new_game()
+        self.assertIsNone(game.show_pieces((0, 4)))
+        self.assertIsNone(game.show_pieces((7, 5)))
+        self.assertEqual(game.show_pieces((1, 5)), ["R"])
+
+
+class StartPositionTest(unittest.TestCase):
+    """Tests start position checks."""
+
+    def test_start_must_cover_every_square(self):
+        with self.assertRaises(ValueError):
+            FocusGame(PLAYER_A, PLAYER_B, GEOMETRY_6X6, START_8X8)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+# Author: Timothy Jan
+# Date: 10/17/2026
+# Description: Tests for FocusGame_original: bounds of Stack removals, the reserve and capture credit of moves onto
+#              tall stacks and byte snapshots.
+#              Usage: python -m pytest test_FocusGame_original.py (or python -m unittest test_FocusGame_original)
+
+import unittest
+
+from FocusGame_original import FocusGame, Piece, Stack
+
+PLAYER_A = ("PlayerA", "R")
+PLAYER_B = ("PlayerB", "G")
+# PlayerA to move with a four piece stack at (0, 1), onto the four piece stack at (0, 5) whose bottom piece is B's,
+# and three pieces in reserve
+TALL_POSITION = ("-,aaaa,-,-,-,bbba/-,-,-,-,-,abbab/-,-,-,-,-,-/-,-,-,-,-,-/-,-,-,-,-,-/-,-,-,-,-,- "
+                 "a a 3 3:0 0:0 m")
+
+
+class StackTest(unittest.TestCase):
+    """Tests removing and moving pieces off a Stack."""
+
+    def setUp(self):
+        self.piece_a = Piece(PLAYER_A)
+        self.piece_b = Piece(PLAYER_B)
+        self.stack = Stack(self.piece_a)
+        self.stack.get_stack().append(self.piece_b)
+
+    def test_remove_from_stack(self):
+        self.stack.remove_from_stack(1)
+        self.assertEqual(self.stack.get_stack(), [self.piece_a])
+        self.stack.remove_from_stack(0)
+        self.stack.remove_from_stack(-1)
+        self.assertEqual(self.stack.get_stack(), [self.piece_a])
+
+    def test_remove_more_than_the_stack_holds(self):
+        with self.assertRaises(IndexError):
+            self.stack.remove_from_stack(3)
+        self.assertEqual(self.stack.get_stack(), [self.piece_a, self.piece_b])
+
+    def test_move_more_than_the_stack_holds(self):
+        other = Stack(self.piece_b)
+        with self.assertRaises(IndexError):
+            self.stack.move_to_stack(other, 3)
+        self.assertEqual(self.stack.get_stack(), [self.piece_a, self.piece_b])
+        self.assertEqual(other.get_stack(), [self.piece_b])
+        self.stack.move_to_stack(other, 2)
+        self.assertEqual(self.stack.get_stack(), [])
+        self.assertEqual(other.get_stack(), [self.piece_b, self.piece_a, self.piece_b])
+
+
+class ReserveCaptureTest(unittest.TestCase):
+    """Tests the pieces credited when a move leaves a stack over five pieces."""
+
+    def test_excess_pieces_are_credited_as_the_bottom_piece(self):
+        game = FocusGame.from_text(TALL_POSITION, PLAYER_A, PLAYER_B)
+        self.assertEqual(game.move_piece("PlayerA", (0, 1), (0, 5), 4), "successfully moved")
+        # three pieces over five, all credited as the bottom B piece, and removed from the top
+        self.assertEqual(game.show_captured("PlayerA"), 3)
+        self.assertEqual(game.show_reserve("PlayerA"), 3)
+        self.assertEqual(game.show_pieces((0, 5)), ["G", "G", "G", "R", "R"])
+
+    def test_own_bottom_piece_goes_to_reserve(self):
+        game = FocusGame.from_text(TALL_POSITION, PLAYER_A, PLAYER_B)
+        # placing on the five piece stack at (1, 5), whose bottom piece is A's
+        self.assertEqual(game.reserved_move("PlayerA", (1, 5)), "successfully moved")
+        self.assertEqual(game.show_reserve("PlayerA"), 3)
+        self.assertEqual(game.show_captured("PlayerA"), 0)
+        self.assertEqual(game.show_pieces((1, 5)), ["R", "G", "G", "R", "G"])
+
+
+class SnapshotTest(unittest.TestCase):
+    """Tests restoring games from byte snapshots."""
+
+    def test_from_bytes_round_trip(self):
+        game = FocusGame.from_text(TALL_POSITION, PLAYER_A, PLAYER_B)
+        game.move_piece("PlayerA", (0, 1), (0, 5), 4)
+        restored = FocusGame.from_bytes(game.to_bytes(), PLAYER_A, PLAYER_B)
+        self.assertEqual(restored.to_text(), game.to_text())
+        self.assertEqual(restored.get_hash(), game.get_hash())
+        self.assertIs(restored.get_current_turn(), restored.get_player_b())
+        # the restored game plays on like the original
+        for each_game in (game, restored):
+            self.assertEqual(each_game.move_piece("PlayerB", (1, 5), (2, 5), 1), "successfully moved")
+        self.assertEqual(restored.to_text(), game.to_text())
+
+
+if __name__ == '__main__':
+    unittest.main()
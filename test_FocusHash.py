@@ -0,0 +1,74 @@
+# Author: Timothy Jan
+# Date: 10/17/2026
+# Description: Tests for the Zobrist position hash FocusGame_original.FocusGame keeps up to date move by move, checked
+#              against the hash computed from scratch and the one CompactFocusGame keeps for the same position.
+#              Usage: python -m pytest test_FocusHash.py (or python -m unittest test_FocusHash)
+
+import random
+import unittest
+
+from FocusGame_compact import CompactFocusGame
+from FocusGame_original import FocusGame
+
+PLAYER_A = ("PlayerA", "R")
+PLAYER_B = ("PlayerB", "G")
+# PlayerA to move with a four piece stack at (0, 1), onto the four piece stack at (0, 5), and three pieces in reserve
+TALL_POSITION = ("-,aaaa,-,-,-,bbba/-,-,-,-,-,abbab/-,-,-,-,-,-/-,-,-,-,-,-/-,-,-,-,-,-/-,-,-,-,-,- "
+                 "a a 3 3:0 0:0 m")
+
+
+class PositionHashTest(unittest.TestCase):
+    """Tests the incremental position hash of FocusGame_original.FocusGame."""
+
+    def assert_hash(self, game):
+        self.assertEqual(game.get_hash(), game.compute_hash())
+        self.assertEqual(game.get_hash(), CompactFocusGame.from_game(game).get_hash())
+
+    def test_start_position(self):
+        self.assert_hash(FocusGame(PLAYER_A, PLAYER_B))
+
+    def test_trimming_move_and_drop(self):
+        game = FocusGame.from_text(TALL_POSITION, PLAYER_A, PLAYER_B)
+        self.assert_hash(game)
+        self.assertEqual(game.move_piece("PlayerA", (0, 1), (0, 5), 4), "successfully moved")
+        self.assertEqual(game.show_captured("PlayerA"), 3)
+        self.assert_hash(game)
+        self.assertEqual(game.move_piece("PlayerB", (1, 5), (2, 5), 1), "successfully moved")
+        game.reserved_move("PlayerA", (0, 5))
+        self.assertEqual(game.show_reserve("PlayerA"), 2)
+        self.assert_hash(game)
+
+    def test_rejected_and_empty_moves_keep_the_hash(self):
+        game = FocusGame(PLAYER_A, PLAYER_B)
+        start_hash = game.get_hash()
+        self.assertIs(game.move_piece("PlayerA", (0, 0), (1, 1), 1), False)
+        self.assertEqual(game.get_hash(), start_hash)
+        # a move of no pieces only passes the turn
+        self.assertEqual(game.move_piece("PlayerA", (0, 0), (0, 0), 0), False)
+        self.assertEqual(game.move_piece("PlayerA", (0, 0), (0, 1), 0), "successfully moved")
+        self.assert_hash(game)
+
+    def test_random_games_and_undo(self):
+        for seed in range(20):
+            rng = random.Random(seed)
+            game = FocusGame(PLAYER_A, PLAYER_B)
+            player = "PlayerA"
+            for ply in range(150):
+                moves = list(game.legal_moves(player))
+                if not moves:
+                    break
+                before = game.get_hash()
+                game.make_move(player, *moves[rng.randrange(len(moves))])
+                self.assert_hash(game)
+                if ply % 10 == 0:
+                    game.unmake_move()
+                    self.assertEqual(game.get_hash(), before)
+                    self.assert_hash(game)
+                    continue
+                if game.get_message() == player + " Wins":
+                    break
+                player = "PlayerB" if player == "PlayerA" else "PlayerA"
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+# Author: Timothy Jan
+# Date: 10/17/2026
+# Description: Tests for FocusRecord: move encoding bounds, archive round trips and replays.
+#              Usage: python -m pytest test_FocusRecord.py (or python -m unittest test_FocusRecord)
+
+import os
+import tempfile
+import unittest
+
+from FocusGame_compact import CompactFocusGame
+from FocusGame_original import FocusGame
+from FocusRecord import RecordReader, RecordWriter, decode_move, encode_move
+
+PLAYER_A = ("PlayerA", "R")
+PLAYER_B = ("PlayerB", "G")
+MOVES = [((0, 0), (1, 0), 1), ((0, 2), (1, 2), 1), ((1, 0), (3, 0), 2), ((0, 3), (0, 4), 1)]
+
+
+class EncodeMoveTest(unittest.TestCase):
+    """Tests the u16 move encoding."""
+
+    def test_round_trip(self):
+        for move in MOVES + [(None, (5, 5), 1), ((4, 5), (5, 5), 7)]:
+            self.assertEqual(decode_move(encode_move(move)), move)
+
+    def test_numbers_outside_the_field_are_rejected(self):
+        # moves of no pieces or of a negative number only pass the turn, and would corrupt the square fields
+        for number in (0, -1, 8):
+            with self.assertRaises(ValueError):
+                encode_move(((2, 2), (3, 2), number))
+
+    def test_off_board_locations_are_rejected(self):
+        for move in (((-1, 0), (0, 0), 1), ((0, 0), (0, 6), 1), (None, (6, 0), 1), (None, (0, -1), 1)):
+            with self.assertRaises(ValueError):
+                encode_move(move)
+
+
+class ArchiveTest(unittest.TestCase):
+    """Tests writing and reading archives."""
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".rec")
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_write_and_replay(self):
+        with RecordWriter(self.path) as writer:
+            writer.write_game(PLAYER_A, PLAYER_B, 0, MOVES)
+            with self.assertRaises(ValueError):
+                writer.write_game(PLAYER_A, PLAYER_B, 0, [((0, 0), (0, 0), 0)])
+            writer.write_game(PLAYER_B, PLAYER_A, 1, MOVES[:1])
+
+        game = FocusGame(PLAYER_A, PLAYER_B)
+        for (start, end, number), player in zip(MOVES, ("PlayerA", "PlayerB") * 2):
+            self.assertEqual(game.move_piece(player, start, end, number), "successfully moved")
+        with RecordReader(self.path) as reader:
+            # the rejected game left nothing behind
+            self.assertEqual(len(reader), 2)
+            self.assertEqual(reader.get_header(0), (PLAYER_A, PLAYER_B, 0, len(MOVES)))
+            self.assertEqual(reader.get_moves(0), MOVES)
+            self.assertEqual(reader.get_move(1, 0), MOVES[0])
+            final = reader.replay(0)
+            self.assertIsInstance(final, CompactFocusGame)
+            self.assertEqual(final.to_text(), game.to_text())
+            self.assertEqual(FocusGame.from_compact(final).to_text(), game.to_text())
+            self.assertEqual(reader.replay(0, 0).to_text(), FocusGame(PLAYER_A, PLAYER_B).to_text())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+# Author: Timothy Jan
+# Date: 10/17/2026
+# Description: Tests for FocusServer.GameServer over TCP: request handling and the watchers a connection leaves behind.
+#              Usage: python -m pytest test_FocusServer.py (or python -m unittest test_FocusServer)
+
+import asyncio
+import json
+import unittest
+
+from FocusServer import GameServer
+
+
+class GameServerTest(unittest.IsolatedAsyncioTestCase):
+    """Tests a GameServer listening on a port picked by the system."""
+
+    async def asyncSetUp(self):
+        self.server = GameServer(port=0)
+        await self.server.start()
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def connect(self):
+        """Returns (reader, writer) of a new connection to the server."""
+        return await asyncio.open_connection("127.0.0.1", self.server.get_port())
+
+    async def request(self, reader, writer, request):
+        """Returns the response to a request sent over a connection."""
+        writer.write(json.dumps(request).encode("utf-8") + b"\n")
+        await writer.drain()
+        return json.loads(await reader.readline())
+
+    async def test_move_is_streamed_to_watcher(self):
+        reader, writer = await self.connect()
+        game = (await self.request(reader, writer, {"op": "new_game", "player_a": ["PlayerA", "R"],
+                                                    "player_b": ["PlayerB", "G"]}))["result"]
+        self.assertEqual(await self.request(reader, writer, {"op": "watch", "game": game}), {"id": None,
+                                                                                             "result": None})
+        response = await self.request(reader, writer, {"op": "move_piece", "game": game, "player": "PlayerA",
+                                                       "start": [0, 0], "end": [1, 0], "number": 1, "id": 7})
+        # the event is written while the move runs, before its response
+        self.assertEqual((response["game"], response["event"]), (game, "move"))
+        self.assertEqual(json.loads(await reader.readline()), {"id": 7, "result": "successfully moved"})
+        writer.close()
+        await writer.wait_closed()
+
+    async def test_disconnect_unwatches_games(self):
+        reader, writer = await self.connect()
+        games = []
+        for count in range(2):
+            games.append((await self.request(reader, writer, {"op": "new_game", "player_a": ["PlayerA", "R"],
+                                                              "player_b": ["PlayerB", "G"]}))["result"])
+            await self.request(reader, writer, {"op": "watch", "game": games[-1]})
+        hosted = [self.server._games[game] for game in games]
+        self.assertEqual([len(each.watchers) for each in hosted], [1, 1])
+
+        writer.close()
+        await writer.wait_closed()
+        for attempt in range(100):
+            if not any(each.watchers for each in hosted):
+                break
+            await asyncio.sleep(0.01)
+        self.assertEqual([len(each.watchers) for each in hosted], [0, 0])
+        self.assertEqual(self.server._watched, {})
+        # the games no longer publish to anyone, so moves still succeed
+        other_reader, other_writer = await self.connect()
+        response = await self.request(other_reader, other_writer, {"op": "move_piece", "game": games[0],
+                                                                   "player": "PlayerA", "start": [0, 0],
+                                                                   "end": [1, 0], "number": 1})
+        self.assertEqual(response, {"id": None, "result": "successfully moved"})
+        other_writer.close()
+        await other_writer.wait_closed()
+
+
+if __name__ == '__main__':
+    unittest.main()
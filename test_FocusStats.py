@@ -0,0 +1,63 @@
+# Author: Timothy Jan
+# Date: 10/17/2026
+# Description: Tests for FocusStats: call and rejection counting and phase timing of InstrumentedFocusGame.
+#              Usage: python -m pytest test_FocusStats.py (or python -m unittest test_FocusStats)
+
+import unittest
+
+from FocusGame_compact import CompactFocusGame
+from FocusGame_original import DIAGONAL, OFF_BOARD
+from FocusStats import GameStats, InstrumentedFocusGame
+
+PLAYER_A = ("PlayerA", "R")
+PLAYER_B = ("PlayerB", "G")
+# the starting board with player A to move, A having moved first, and one piece in A's reserve
+RESERVE_POSITION = "a,a,b,b,a,a/b,b,a,a,b,b/a,a,b,b,a,a/b,b,a,a,b,b/a,a,b,b,a,a/b,b,a,a,b,b a a 3 1:0 0:0 m"
+
+
+def reserve_game(stats):
+    """Returns an InstrumentedFocusGame in RESERVE_POSITION reporting to stats."""
+    compact = CompactFocusGame.from_text(RESERVE_POSITION, PLAYER_A, PLAYER_B)
+    return InstrumentedFocusGame.from_compact(compact, stats)
+
+
+class InstrumentedFocusGameTest(unittest.TestCase):
+    """Tests counting and timing of InstrumentedFocusGame moves."""
+
+    def test_drop_after_rejected_move_is_not_a_rejection(self):
+        stats = GameStats(sample_every=1000)
+        game = reserve_game(stats)
+        # a diagonal move is rejected and leaves False as the game's message
+        self.assertIs(game.move_piece("PlayerA", (0, 0), (1, 1), 1), False)
+        # the legal drop that follows returns that stale message, but it was made
+        self.assertIs(game.reserved_move("PlayerA", (0, 0)), False)
+        self.assertEqual(game.get_current_turn().get_player_name(), "PlayerB")
+        self.assertEqual(game.show_reserve("PlayerA"), 0)
+        self.assertEqual(stats.get_calls(), {"move_piece": 1, "reserved_move": 1})
+        self.assertEqual(stats.get_stats()["rejections"], {DIAGONAL: 1})
+
+    def test_rejected_drop_is_counted(self):
+        stats = GameStats(sample_every=1000)
+        game = reserve_game(stats)
+        self.assertIs(game.reserved_move("PlayerA", (6, 0)), False)
+        self.assertEqual(game.show_reserve("PlayerA"), 1)
+        self.assertEqual(stats.get_stats()["rejections"], {OFF_BOARD: 1})
+
+    def test_sampled_moves_time_every_phase(self):
+        stats = GameStats(sample_every=2)
+        game = InstrumentedFocusGame(PLAYER_A, PLAYER_B, stats)
+        self.assertEqual(game.move_piece("PlayerA", (0, 0), (1, 0), 1), "successfully moved")
+        self.assertEqual(game.move_piece("PlayerB", (0, 2), (1, 2), 1), "successfully moved")
+        self.assertIs(type(game), InstrumentedFocusGame)
+        phases = stats.get_stats()["phases"]
+        for phase in ("pre_move_check", "assign_pieces", "reserve_capture", "update_turn"):
+            self.assertEqual((phases[phase]["calls"], phases[phase]["timed"]), (2, 1))
+
+    def test_games_share_module_stats_by_default(self):
+        first = InstrumentedFocusGame(PLAYER_A, PLAYER_B)
+        second = InstrumentedFocusGame(PLAYER_A, PLAYER_B)
+        self.assertIs(first.get_stats(), second.get_stats())
+
+
+if __name__ == '__main__':
+    unittest.main()